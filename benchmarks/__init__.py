@@ -0,0 +1,24 @@
+"""
+Benchmarks of SQLLineage, mostly over the bundled TPC-DS queries, run from the repository root:
+
+- `python -m benchmarks`: per-phase timings, throughput and peak RSS across graph operators and dialects
+- `python -m benchmarks.memory`: memory retained by lineage results
+- `python -m benchmarks.edges`: edge lookups by label and by vertex on the combined lineage graph
+- `python -m benchmarks.metadata`: SQLAlchemyMetaDataProvider reflection against a SQLite catalog of thousands of tables
+- `python -m benchmarks.startup`: import time of the command line entry point and wall time of a short invocation
+"""
+
+import glob
+import os
+
+TPCDS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "sqllineage", "data", "tpcds"
+)
+
+
+def load_tpcds_queries(limit: int | None = None) -> list[str]:
+    queries = []
+    for path in sorted(glob.glob(os.path.join(TPCDS_DIR, "query*.sql")))[:limit]:
+        with open(path) as f:
+            queries.append(f.read())
+    return queries
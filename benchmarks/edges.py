@@ -0,0 +1,138 @@
+"""
+Edge lookup benchmark: retrieve edges by label, and by vertex plus label, on the combined lineage graph of the bundled
+TPC-DS queries.
+
+Lookups served by the label index of graph operators are compared against how they were done before the index: a full
+scan over all edges for label lookup, and a scan over all incident edges of the vertex for vertex plus label lookup.
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqllineage.config import SQLLineageConfig
+from sqllineage.core.graph.networkx import NetworkXGraphOperator
+from sqllineage.core.graph.rustworkx import RustworkXGraphOperator
+from sqllineage.core.graph_operator import GraphOperator
+from sqllineage.runner import LineageRunner
+from sqllineage.utils.constant import EdgeDirection, EdgeType
+from sqllineage.utils.entities import EdgeTuple
+
+from . import load_tpcds_queries
+
+
+def scan_edges_by_label(go: GraphOperator, label: str) -> list[EdgeTuple]:
+    """
+    retrieve edges by label with a full scan over the underlying graph, same as graph operators did without the index
+    """
+    if isinstance(go, NetworkXGraphOperator):
+        return [
+            EdgeTuple(
+                source=src, target=tgt, label=attr.get("type", ""), attributes=attr
+            )
+            for src, tgt, attr in go.graph.edges(data=True)
+            if attr.get("type") == label
+        ]
+    elif isinstance(go, RustworkXGraphOperator):
+        return [
+            EdgeTuple(
+                source=go.graph[src_idx],
+                target=go.graph[tgt_idx],
+                label=label,
+                attributes=go._edge_props.get(edge_idx) or {},
+            )
+            for edge_idx, (src_idx, tgt_idx, code) in go.graph.edge_index_map().items()
+            if go._labels[code] == label
+        ]
+    raise TypeError("Unsupported graph operator " + str(type(go)))
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def measure(queries: list[str], dialect: str, repeat: int) -> dict[str, Any]:
+    runner = LineageRunner("\n".join(queries), dialect=dialect, silent_mode=True)
+    runner._eval()
+    go = runner._sql_holder.go
+    vertices = go.retrieve_vertices_by_props()
+    # build label index upfront so that it's not counted into the first lookup
+    go.retrieve_edges_by_label(EdgeType.LINEAGE)
+    results = {}
+    for label in (
+        EdgeType.LINEAGE,
+        EdgeType.HAS_COLUMN,
+        EdgeType.HAS_ALIAS,
+        EdgeType.RENAME,
+    ):
+        results[label] = {
+            "edges": len(go.retrieve_edges_by_label(label)),
+            "by_label_indexed_seconds": timeit(
+                lambda: go.retrieve_edges_by_label(label), repeat
+            ),
+            "by_label_scan_seconds": timeit(
+                lambda: scan_edges_by_label(go, label), repeat
+            ),
+            # lookup incoming edges of every vertex, as column lineage traversal does
+            "by_vertex_indexed_seconds": timeit(
+                lambda: [
+                    go.retrieve_edges_by_vertex(v, EdgeDirection.IN, label)
+                    for v in vertices
+                ],
+                repeat // 10 or 1,
+            ),
+            "by_vertex_filter_seconds": timeit(
+                lambda: [
+                    [
+                        e
+                        for e in go.retrieve_edges_by_vertex(v, EdgeDirection.IN)
+                        if e.label == label
+                    ]
+                    for v in vertices
+                ],
+                repeat // 10 or 1,
+            ),
+        }
+    return {
+        "queries": len(queries),
+        "dialect": dialect,
+        "graph_operator": SQLLineageConfig.GRAPH_OPERATOR_CLASS,
+        "vertices": len(vertices),
+        "edges": sum(r["edges"] for r in results.values()),
+        "labels": results,
+    }
+
+
+def main(args=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.edges", description=__doc__
+    )
+    parser.add_argument(
+        "--dialect", default="ansi", help="sql dialect to analyze TPC-DS queries with"
+    )
+    parser.add_argument(
+        "--limit", type=int, help="only analyze the first N TPC-DS queries"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=100, help="number of times to repeat each lookup"
+    )
+    parser.add_argument(
+        "--graph-operator",
+        default=SQLLineageConfig.GRAPH_OPERATOR_CLASS,
+        help="graph operator class, e.g. sqllineage.core.graph.rustworkx.RustworkXGraphOperator",
+    )
+    options = parser.parse_args(args)
+    with SQLLineageConfig(GRAPH_OPERATOR_CLASS=options.graph_operator):
+        result = measure(
+            load_tpcds_queries(options.limit), options.dialect, options.repeat
+        )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
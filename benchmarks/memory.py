@@ -0,0 +1,114 @@
+"""
+Memory benchmark: lineage result retained after analyzing the bundled TPC-DS queries, plus peak memory during analysis.
+
+Retained memory is what stays reachable from the lineage results once analysis is done, e.g. parse trees referenced
+by vertices of the lineage graph. Memory is traced with tracemalloc, so only allocations made by Python are counted.
+
+With --vertices N, memory per vertex is measured instead on a synthetic lineage graph of N columns, spread over tables
+with a handful of schemas, the same shape as a warehouse-wide lineage graph. No SQL is parsed, so this is the memory
+taken by the models and graph operator alone.
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any
+
+from sqllineage.config import SQLLineageConfig
+from sqllineage.core.graph import get_graph_operator_class
+from sqllineage.core.models import Column, Schema, Table
+from sqllineage.runner import LineageRunner
+from sqllineage.utils.constant import EdgeType
+
+from . import load_tpcds_queries
+
+
+def measure(queries: list[str], dialect: str) -> dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    runners = []
+    for sql in queries:
+        runner = LineageRunner(sql, dialect=dialect)
+        runner.get_column_lineage()
+        runners.append(runner)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    vertices = sum(
+        len(runner._sql_holder.go.retrieve_vertices_by_props()) for runner in runners
+    )
+    return {
+        "queries": len(queries),
+        "dialect": dialect,
+        "graph_operator": SQLLineageConfig.GRAPH_OPERATOR_CLASS,
+        "vertices": vertices,
+        "retained_bytes": retained - baseline,
+        "retained_bytes_per_query": (retained - baseline) // max(len(queries), 1),
+        "retained_bytes_per_vertex": (retained - baseline) // max(vertices, 1),
+        "peak_bytes": peak - baseline,
+    }
+
+
+def measure_vertices(
+    vertices: int, columns_per_table: int = 20, schemas: int = 10
+) -> dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    go = get_graph_operator_class()()
+    tables = vertices // (columns_per_table + 1)
+    for i in range(tables):
+        # names are built from scratch each time as parser does, instead of sharing string objects
+        table = Table(f"tab{i}", Schema(f"db{i % schemas}"))
+        go.add_vertex_if_not_exist(table)
+        for j in range(columns_per_table):
+            column = Column(f"col{j}")
+            column.parent = Table(f"tab{i}", Schema(f"db{i % schemas}"))
+            go.add_vertex_if_not_exist(column)
+            go.add_edge_if_not_exist(table, column, EdgeType.HAS_COLUMN)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    total = tables * (columns_per_table + 1)
+    return {
+        "vertices": total,
+        "graph_operator": SQLLineageConfig.GRAPH_OPERATOR_CLASS,
+        "retained_bytes": retained - baseline,
+        "retained_bytes_per_vertex": (retained - baseline) // max(total, 1),
+        "peak_bytes": peak - baseline,
+    }
+
+
+def main(args=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.memory", description=__doc__
+    )
+    parser.add_argument(
+        "--dialect", default="ansi", help="sql dialect to analyze TPC-DS queries with"
+    )
+    parser.add_argument(
+        "--limit", type=int, help="only analyze the first N TPC-DS queries"
+    )
+    parser.add_argument(
+        "--graph-operator",
+        default=SQLLineageConfig.GRAPH_OPERATOR_CLASS,
+        help="graph operator class, e.g. sqllineage.core.graph.rustworkx.RustworkXGraphOperator",
+    )
+    parser.add_argument(
+        "--vertices",
+        type=int,
+        help="measure memory per vertex on a synthetic lineage graph of N vertices instead",
+    )
+    options = parser.parse_args(args)
+    with SQLLineageConfig(GRAPH_OPERATOR_CLASS=options.graph_operator):
+        if options.vertices:
+            result = measure_vertices(options.vertices)
+        else:
+            result = measure(load_tpcds_queries(options.limit), options.dialect)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Metadata benchmark: SQLAlchemyMetaDataProvider against a local SQLite catalog with thousands of tables.
+
+A script of INSERT ... SELECT * statements over random tables of the catalog is analyzed with metadata from the
+provider, reflecting tables one at a time, in bulk per statement, and by reflecting the whole schema at once. Besides
+wall time spent on metadata, number of SQL queries sent to the database is counted as a proxy of round-trips to a
+remote catalog.
+
+Note SQLite has no catalog query for columns of multiple tables, SQLAlchemy falls back to one PRAGMA query per table.
+Databases like PostgreSQL reflect a schema with a few queries, regardless of the number of tables.
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, event
+
+from sqllineage.core.metadata.sqlalchemy import SQLAlchemyMetaDataProvider
+from sqllineage.core.metadata_provider import MetaDataProvider
+from sqllineage.runner import LineageRunner
+
+
+class PerTableSQLAlchemyMetaDataProvider(SQLAlchemyMetaDataProvider):
+    """
+    reflect tables one at a time, same as SQLAlchemyMetaDataProvider did without bulk reflection
+    """
+
+    def _get_tables_columns(
+        self, tables: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], list[str]]:
+        return MetaDataProvider._get_tables_columns(self, tables, **kwargs)
+
+
+def create_catalog(path: str, tables: int, columns: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    metadata = MetaData()
+    for i in range(tables):
+        Table(
+            f"tab{i}", metadata, *[Column(f"col{j}", Integer) for j in range(columns)]
+        )
+    metadata.create_all(engine)
+    engine.dispose()
+
+
+def generate_sql(tables: int, statements: int, seed: int = 0) -> str:
+    rnd = random.Random(seed)
+    sqls = []
+    for _ in range(statements):
+        tgt, src1, src2 = rnd.sample(range(tables), 3)
+        sqls.append(
+            f"INSERT INTO main.tab{tgt} SELECT a.*, b.* FROM main.tab{src1} a "
+            f"JOIN main.tab{src2} b ON a.col0 = b.col0;"
+        )
+    return "\n".join(sqls)
+
+
+def measure(
+    provider: SQLAlchemyMetaDataProvider, sql: str, dialect: str, latency: float = 0
+) -> dict[str, Any]:
+    queries = 0
+    metadata_seconds = 0.0
+    depth = 0
+
+    def count(*_) -> None:
+        nonlocal queries
+        queries += 1
+        time.sleep(latency)
+
+    def timed(func: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args, **kwargs):
+            nonlocal metadata_seconds, depth
+            depth += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                depth -= 1
+                # only count the outermost call, e.g. single table lookup delegating to bulk lookup
+                if depth == 0:
+                    metadata_seconds += time.perf_counter() - start
+
+        return wrapper
+
+    event.listen(provider.engine, "before_cursor_execute", count)
+    for method in ("_get_table_columns", "_get_tables_columns"):
+        setattr(provider, method, timed(getattr(provider, method)))
+    start = time.perf_counter()
+    LineageRunner(sql, dialect=dialect, metadata_provider=provider).get_column_lineage(
+        endpoints_only=True
+    )
+    return {
+        "seconds": time.perf_counter() - start,
+        "metadata_seconds": metadata_seconds,
+        "queries": queries,
+    }
+
+
+def main(args=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.metadata", description=__doc__
+    )
+    parser.add_argument(
+        "--tables", type=int, default=2000, help="number of tables in the catalog"
+    )
+    parser.add_argument(
+        "--columns", type=int, default=20, help="number of columns per table"
+    )
+    parser.add_argument(
+        "--statements", type=int, default=100, help="number of statements to analyze"
+    )
+    parser.add_argument(
+        "--dialect", default="ansi", help="sql dialect to analyze the script with"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0,
+        help="milliseconds of latency added to each query, to simulate a remote catalog",
+    )
+    options = parser.parse_args(args)
+    latency = options.latency / 1000
+    sql = generate_sql(options.tables, options.statements)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "catalog.db")
+        create_catalog(path, options.tables, options.columns)
+        url = f"sqlite:///{path}"
+        result = {
+            "tables": options.tables,
+            "columns": options.columns,
+            "statements": options.statements,
+            "per_table": measure(
+                PerTableSQLAlchemyMetaDataProvider(url), sql, options.dialect, latency
+            ),
+            "bulk": measure(
+                SQLAlchemyMetaDataProvider(url), sql, options.dialect, latency
+            ),
+            "reflect_schema": measure(
+                SQLAlchemyMetaDataProvider(url, reflect_schema=True),
+                sql,
+                options.dialect,
+                latency,
+            ),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Startup benchmark: import time of the sqllineage command line entry point, and wall time of a short `sqllineage -e`
+invocation as run by pre-commit hooks, each in a fresh interpreter.
+
+Besides timings, heavy modules imported by the invocation are listed. Only the sqlfluff dialect in use is supposed
+to be imported, with neither sqlalchemy (unless --sqlalchemy_url is given) nor sqlparse (unless analyzing with the
+`non-validating` dialect). Pass --max-seconds to fail when the median wall time exceeds the budget, e.g. in CI.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+SQL = "INSERT INTO tab1 SELECT col1, col2 FROM tab2 JOIN tab3 ON tab2.id = tab3.id"
+
+# modules that are costly to import, reported when imported by the invocation
+HEAVY_MODULES = ("sqlalchemy", "sqlparse", "sqlfluff.dialects.", "rustworkx")
+
+REPORT_MODULES = f"""
+import atexit, json, sys
+atexit.register(lambda: print(json.dumps(sorted({{
+    m if m.startswith("sqlfluff.dialects.") else m.partition(".")[0]
+    for m in sys.modules if m.startswith({HEAVY_MODULES!r})
+}})), file=sys.stderr))
+"""
+
+
+def run(code: str) -> tuple[float, list[str]]:
+    """
+    run code in a fresh interpreter
+
+    :return: wall time in seconds, and heavy modules imported
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", REPORT_MODULES + code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def measure(code: str, repeat: int) -> dict[str, Any]:
+    timings = []
+    modules: list[str] = []
+    for _ in range(repeat):
+        elapsed, modules = run(code)
+        timings.append(elapsed)
+    return {
+        "min_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "heavy_modules": modules,
+    }
+
+
+def main(args=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup", description=__doc__
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of interpreters to start"
+    )
+    parser.add_argument(
+        "--dialect", default="ansi", help="sql dialect to analyze the statement with"
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        help="exit with non-zero code if median wall time of `sqllineage -e` exceeds it",
+    )
+    options = parser.parse_args(args)
+    result = {
+        "baseline": measure("pass", options.repeat),
+        "import": measure("import sqllineage.cli", options.repeat),
+        "cli": measure(
+            "from sqllineage.cli import main; "
+            f"main(['-e', {SQL!r}, '--dialect', {options.dialect!r}])",
+            options.repeat,
+        ),
+    }
+    print(json.dumps(result, indent=2))
+    if (
+        options.max_seconds is not None
+        and result["cli"]["median_seconds"] > options.max_seconds
+    ):
+        sys.exit(
+            f"sqllineage -e took {result['cli']['median_seconds']:.3f}s, exceeding {options.max_seconds}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark suite: per-phase timings, throughput and peak RSS of analyzing the bundled TPC-DS queries.
+
+Each combination of graph operator and dialect is run in a fresh subprocess so that peak RSS is measured separately.
+Phases are timed as follows:
+
+- split: split SQL script into statements
+- parse: parse each statement into sqlfluff tree
+- extract: extract statement level lineage from the tree
+- merge: combine statement level lineage into one graph
+- column_paths: enumerate column lineage paths of the combined graph
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Any
+
+import sqlfluff
+from sqlfluff.core import FluffConfig
+
+from sqllineage import VERSION
+from sqllineage.config import SQLLineageConfig
+from sqllineage.core.holders import SQLLineageHolder, StatementLineageHolder
+from sqllineage.core.metadata.dummy import DummyMetaDataProvider
+from sqllineage.core.parser.sqlfluff.analyzer import SqlFluffLineageAnalyzer
+from sqllineage.core.parser.sqlfluff.extractors.base import BaseExtractor
+from sqllineage.exceptions import InvalidSyntaxException
+from sqllineage.utils.entities import AnalyzerContext
+
+from . import TPCDS_DIR, load_tpcds_queries
+
+PHASES = ("split", "parse", "extract", "merge", "column_paths")
+DEFAULT_DIALECTS = ["ansi", "sparksql"]
+DEFAULT_GRAPH_OPERATORS = [
+    "sqllineage.core.graph.networkx.NetworkXGraphOperator",
+    "sqllineage.core.graph.rustworkx.RustworkXGraphOperator",
+]
+
+
+def run_phases(queries: list[str], dialect: str) -> dict[str, Any]:
+    """
+    analyze queries phase by phase in current process, using the configured graph operator.
+    """
+    provider = DummyMetaDataProvider()
+    sqlfluff_config = FluffConfig.from_path(
+        path=TPCDS_DIR, overrides={"dialect": dialect}
+    )
+    timings = dict.fromkeys(PHASES, 0.0)
+    stmt_holders = []
+    failed = 0
+
+    def timed(phase, func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[phase] += time.perf_counter() - start
+
+    for sql in queries:
+        analyzer = timed(
+            "split",
+            SqlFluffLineageAnalyzer,
+            sql,
+            TPCDS_DIR,
+            dialect,
+            False,
+            sqlfluff_config,
+        )
+        for stmt in analyzer.statements:
+            try:
+                segments = timed(
+                    "parse", analyzer._list_specific_statement_segment, stmt
+                )
+            except InvalidSyntaxException:
+                failed += 1
+                continue
+            if not segments:
+                # parsed into no statement segment, nothing to extract lineage from
+                failed += 1
+                continue
+            holder = timed(
+                "extract",
+                lambda segment: BaseExtractor.try_extract(
+                    dialect, provider, segment, AnalyzerContext()
+                ),
+                segments[0],
+            )
+            if holder is None:
+                failed += 1
+                continue
+            stmt_holders.append(timed("extract", StatementLineageHolder.of, holder))
+    sql_holder = timed("merge", SQLLineageHolder.of, provider, *stmt_holders)
+    column_lineage = timed("column_paths", sql_holder.get_column_lineage)
+    total = sum(timings.values())
+    return {
+        "dialect": dialect,
+        "graph_operator": SQLLineageConfig.GRAPH_OPERATOR_CLASS,
+        "statements": len(stmt_holders),
+        "failed_statements": failed,
+        "column_paths": len(column_lineage),
+        "timings": timings,
+        "total_seconds": total,
+        "statements_per_second": len(stmt_holders) / total if total else None,
+    }
+
+
+def peak_rss() -> int | None:
+    """
+    peak resident set size of current process in bytes, None if not supported by the platform.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, and in kilobytes elsewhere
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def run_in_subprocess(
+    dialect: str, graph_operator: str, limit: int | None
+) -> dict[str, Any]:
+    args = [
+        sys.executable,
+        "-m",
+        "benchmarks",
+        "--worker",
+        "--dialects",
+        dialect,
+        "--graph-operators",
+        graph_operator,
+    ]
+    if limit is not None:
+        args += ["--limit", str(limit)]
+    completed = subprocess.run(args, capture_output=True, text=True, check=True)
+    result: dict[str, Any] = json.loads(completed.stdout)
+    return result
+
+
+def main(args=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--dialects",
+        nargs="+",
+        default=DEFAULT_DIALECTS,
+        help="sql dialects to benchmark",
+    )
+    parser.add_argument(
+        "--graph-operators",
+        nargs="+",
+        default=DEFAULT_GRAPH_OPERATORS,
+        help="graph operator classes to benchmark",
+    )
+    parser.add_argument(
+        "--limit", type=int, help="only analyze the first N TPC-DS queries"
+    )
+    parser.add_argument(
+        "--output", help="write JSON result to this file instead of stdout"
+    )
+    # internal option: run a single configuration in current process
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    options = parser.parse_args(args)
+    queries = load_tpcds_queries(options.limit)
+    if options.worker:
+        with SQLLineageConfig(GRAPH_OPERATOR_CLASS=options.graph_operators[0]):
+            result = run_phases(queries, options.dialects[0])
+        result["peak_rss_bytes"] = peak_rss()
+        print(json.dumps(result))
+        return
+    report = {
+        "sqllineage": VERSION,
+        "sqlfluff": sqlfluff.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "queries": len(queries),
+        "results": [
+            run_in_subprocess(dialect, graph_operator, options.limit)
+            for graph_operator in options.graph_operators
+            for dialect in options.dialects
+        ],
+    }
+    content = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w") as f:
+            f.write(content + "\n")
+    else:
+        print(content)
@@ -1,7 +1,9 @@
 import argparse
 import logging
 import logging.config
+import sys
 import warnings
+from typing import TYPE_CHECKING
 
 from sqllineage import (
     DEFAULT_DIALECT,
@@ -15,13 +17,14 @@ from sqllineage import (
 from sqllineage import (
     VERSION as MAIN_VERSION,
 )
-from sqllineage.core.metadata.dummy import DummyMetaDataProvider
-from sqllineage.core.metadata.sqlalchemy import SQLAlchemyMetaDataProvider
-from sqllineage.drawing import draw_lineage_graph
-from sqllineage.runner import LineageRunner
+from sqllineage.config import SQLLineageConfig
 from sqllineage.utils.constant import LineageLevel
 from sqllineage.utils.helpers import extract_file_path_from_args, extract_sql_from_args
 
+# modules depending on parsers are imported upon use, so that forwarding to lineage daemon starts up fast
+if TYPE_CHECKING:
+    from sqllineage.core.metadata_provider import MetaDataProvider
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,45 +105,93 @@ def main(args=None) -> None:
         help="sqlalchemy url to provide metadata for lineage analysis",
         type=str,
     )
-    args = parser.parse_args(args)
-    metadata_provider = (
-        SQLAlchemyMetaDataProvider(args.sqlalchemy_url)
-        if args.sqlalchemy_url
-        else DummyMetaDataProvider()
+    parser.add_argument(
+        "--metadata-snapshot",
+        help="metadata snapshot file to provide metadata for lineage analysis, without connecting to the database",
+        type=str,
+        metavar="<filename>",
     )
-    if args.e and args.f:
-        warnings.warn("Both -e and -f options are specified. -e option will be ignored")
-    if args.f or args.e:
-        sql = extract_sql_from_args(args)
-        file_path = extract_file_path_from_args(args)
-        runner = LineageRunner(
-            sql,
-            file_path=file_path,
-            dialect=args.dialect,
-            metadata_provider=metadata_provider,
-            verbose=args.verbose,
-            draw_options={
-                "host": args.host,
-                "port": args.port,
-                "f": args.f if args.f else None,
-            },
-            silent_mode=args.silent_mode,
+    parser.add_argument(
+        "--dump-metadata-snapshot",
+        help="dump metadata from --sqlalchemy_url into a snapshot file for later use with --metadata-snapshot",
+        type=str,
+        metavar="<filename>",
+    )
+    parser.add_argument(
+        "--profile",
+        help="print wall time of each phase and the slowest statements to stderr",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--timeout",
+        help="seconds to analyze the whole SQL, statements left unanalyzed once time is up are skipped",
+        type=float,
+        metavar="<seconds>",
+    )
+    parser.add_argument(
+        "--statement-timeout",
+        help="seconds to analyze each statement, statement running out of time is skipped",
+        type=float,
+        metavar="<seconds>",
+    )
+    parser.add_argument(
+        "--daemon",
+        help="run as a long-lived daemon on --daemon-socket, with the dialect warmed up, "
+        "for command line to forward lineage analysis to",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--daemon-socket",
+        help="unix socket of the lineage daemon, default to SQLLINEAGE_DAEMON_SOCKET environment variable. "
+        "Lineage is analyzed by the daemon when it's running, otherwise analyzed locally",
+        type=str,
+        metavar="<path>",
+    )
+    args = parser.parse_args(args)
+    daemon_socket = args.daemon_socket or SQLLineageConfig.DAEMON_SOCKET
+    if args.daemon:
+        if not daemon_socket:
+            parser.error("--daemon requires --daemon-socket")
+        from sqllineage.daemon import serve
+
+        return serve(daemon_socket, args.dialect)
+    if args.dump_metadata_snapshot:
+        if not args.sqlalchemy_url:
+            parser.error("--dump-metadata-snapshot requires --sqlalchemy_url")
+        from sqllineage.core.metadata.snapshot import SnapshotMetaDataProvider
+        from sqllineage.core.metadata.sqlalchemy import SQLAlchemyMetaDataProvider
+
+        snapshot = SnapshotMetaDataProvider.dump(
+            SQLAlchemyMetaDataProvider(args.sqlalchemy_url), args.dump_metadata_snapshot
+        )
+        print(
+            f"Dumped metadata of {len(snapshot.list_tables())} tables into {args.dump_metadata_snapshot}"
         )
-        if args.graph_visualization:
-            runner.draw()
-        elif args.level == LineageLevel.COLUMN:
-            runner.print_column_lineage()
-        else:
-            runner.print_table_lineage()
+        return None
+    if args.f or args.e:
+        if daemon_socket and not args.graph_visualization:
+            from sqllineage.daemon import forward
+
+            if (response := forward(daemon_socket, args)) is not None:
+                sys.stdout.write(response["stdout"])
+                sys.stderr.write(response["stderr"])
+                if response["code"]:
+                    sys.exit(response["code"])
+                return None
+        analyze(args)
     elif args.graph_visualization:
+        from sqllineage.drawing import draw_lineage_graph
+
         return draw_lineage_graph(
             **{
                 "host": args.host,
                 "port": args.port,
-                "metadata_provider": metadata_provider,
+                "metadata_provider": _get_metadata_provider(args),
             }
         )
     elif args.dialects:
+        from sqllineage.runner import LineageRunner
+
         dialects = []
         for _, supported_dialects in LineageRunner.supported_dialects().items():
             dialects += supported_dialects
@@ -149,5 +200,63 @@ def main(args=None) -> None:
         parser.print_help()
 
 
+def analyze(args: argparse.Namespace) -> None:
+    """
+    Analyze SQL from -e or -f option and print lineage, or draw it with -g option.
+
+    :param args: the parsed command line arguments
+    """
+    from sqllineage.core.observer import LineageProfiler
+    from sqllineage.runner import LineageRunner
+
+    if args.e and args.f:
+        warnings.warn("Both -e and -f options are specified. -e option will be ignored")
+    sql = extract_sql_from_args(args)
+    file_path = extract_file_path_from_args(args)
+    profiler = LineageProfiler() if args.profile else None
+    runner = LineageRunner(
+        sql,
+        file_path=file_path,
+        dialect=args.dialect,
+        metadata_provider=_get_metadata_provider(args),
+        verbose=args.verbose,
+        draw_options={
+            "host": args.host,
+            "port": args.port,
+            "f": args.f if args.f else None,
+        },
+        silent_mode=args.silent_mode,
+        observer=profiler,
+        timeout=args.timeout,
+        statement_timeout=args.statement_timeout,
+    )
+    if args.graph_visualization:
+        runner.draw()
+    elif args.level == LineageLevel.COLUMN:
+        runner.print_column_lineage()
+    else:
+        runner.print_table_lineage()
+    if profiler is not None:
+        print(profiler, file=sys.stderr)
+
+
+def _get_metadata_provider(args: argparse.Namespace) -> "MetaDataProvider":
+    from sqllineage.core.metadata.dummy import DummyMetaDataProvider
+    from sqllineage.core.metadata.snapshot import SnapshotMetaDataProvider
+
+    if args.metadata_snapshot:
+        if args.sqlalchemy_url:
+            warnings.warn(
+                "Both --metadata-snapshot and --sqlalchemy_url are specified. --sqlalchemy_url will be ignored"
+            )
+        return SnapshotMetaDataProvider(args.metadata_snapshot)
+    elif args.sqlalchemy_url:
+        from sqllineage.core.metadata.sqlalchemy import SQLAlchemyMetaDataProvider
+
+        return SQLAlchemyMetaDataProvider(args.sqlalchemy_url)
+    else:
+        return DummyMetaDataProvider()
+
+
 if __name__ == "__main__":
     main()
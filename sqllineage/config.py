@@ -25,6 +25,10 @@ class _SQLLineageConfigLoader:
             str,
             "sqllineage.core.graph.networkx.NetworkXGraphOperator",
         ),
+        # directory for persistent parse cache, disabled when empty
+        "PARSE_CACHE_DIR": (str, ""),
+        # unix socket of lineage daemon for command line to forward lineage analysis to, disabled when empty
+        "DAEMON_SOCKET": (str, ""),
     }
 
     def __init__(self) -> None:
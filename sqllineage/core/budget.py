@@ -0,0 +1,238 @@
+import ctypes
+import itertools
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqllineage.exceptions import AnalysisTimeoutException
+
+# raising exception into another thread is only available on CPython
+INTERRUPTIBLE = hasattr(ctypes, "pythonapi")
+
+
+class _Interrupted(BaseException):
+    """
+    Raised asynchronously into the thread running out of time. It's a BaseException so that it isn't swallowed by
+    `except Exception` in parser code, and it's converted to AnalysisTimeoutException before leaving time_limit.
+    """
+
+
+def _raise_in_thread(thread_id: int, exc: type[BaseException] | None) -> None:
+    # exc None clears the exception set but not yet raised
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id), ctypes.py_object(exc) if exc is not None else None
+    )
+
+
+class _Watchdog:
+    """
+    A single daemon thread interrupting threads running out of time, shared by all the time_limit blocks, rather than
+    starting a timer thread for each of them.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        # watched blocks by key, in the form of [deadline, thread id, fired]
+        self._blocks: dict[int, list[Any]] = {}
+        self._keys = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, deadline: float, thread_id: int) -> int:
+        """
+        :return: key to unwatch the block with
+        """
+        with self._cond:
+            key = next(self._keys)
+            self._blocks[key] = [deadline, thread_id, False]
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="sqllineage-watchdog", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return key
+
+    def unwatch(self, key: int) -> bool:
+        """
+        :return: whether the block is interrupted
+        """
+        with self._cond:
+            if (block := self._blocks.pop(key, None)) is None:
+                return False
+            _, thread_id, fired = block
+            if fired:
+                # block finishes before the exception is raised, don't let it leak out
+                _raise_in_thread(thread_id, None)
+            return bool(fired)
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                deadlines = []
+                for block in self._blocks.values():
+                    deadline, thread_id, fired = block
+                    if fired:
+                        continue
+                    if deadline <= now:
+                        block[2] = True
+                        _raise_in_thread(thread_id, _Interrupted)
+                    else:
+                        deadlines.append(deadline)
+                self._cond.wait(min(deadlines) - now if deadlines else None)
+
+
+_watchdog = _Watchdog()
+
+
+def _reset_watchdog() -> None:
+    global _watchdog
+    _watchdog = _Watchdog()
+
+
+if hasattr(os, "register_at_fork"):
+    # watchdog thread doesn't survive fork, neither should the lock possibly held by it
+    os.register_at_fork(after_in_child=_reset_watchdog)
+
+
+@contextmanager
+def time_limit(seconds: float | None, message: str) -> Iterator[None]:
+    """
+    abort the code block in current thread with AnalysisTimeoutException once it runs longer than seconds.
+
+    The block is interrupted by an exception raised asynchronously from the watchdog thread, which takes effect at the
+    next Python bytecode, so only wrap code that is safe to abort anywhere, see :func:`interruptible`. On Python
+    implementations other than CPython, the block runs to the end and the time limit is checked afterward.
+
+    :param seconds: time limit in seconds, None means no limit
+    :param message: message of AnalysisTimeoutException
+    """
+    if seconds is None:
+        yield
+        return
+    if seconds <= 0:
+        raise AnalysisTimeoutException(message)
+    start = time.monotonic()
+    if not INTERRUPTIBLE:
+        yield
+        if time.monotonic() - start > seconds:
+            raise AnalysisTimeoutException(message)
+        return
+    key = _watchdog.watch(start + seconds, threading.get_ident())
+    try:
+        try:
+            yield
+        finally:
+            fired = _watchdog.unwatch(key)
+    except _Interrupted:
+        # exception lands before the block is unwatched
+        _watchdog.unwatch(key)
+        raise AnalysisTimeoutException(message) from None
+    if fired or time.monotonic() - start > seconds:
+        raise AnalysisTimeoutException(message)
+
+
+# time limit of the code block running in current thread, set by TimeBudget, in the form of (deadline, message)
+_local = threading.local()
+
+
+@contextmanager
+def interruptible() -> Iterator[None]:
+    """
+    let the code block be aborted once the time limit set by TimeBudget for current thread is up.
+
+    Only wrap code that is safe to abort at any bytecode, i.e. without I/O, lock or state shared beyond the block,
+    like parsing SQL. Elsewhere, time limit is checked cooperatively by :func:`check_time_limit`.
+    """
+    if (limit := getattr(_local, "limit", None)) is None:
+        yield
+    else:
+        deadline, message = limit
+        with time_limit(deadline - time.monotonic(), message):
+            yield
+
+
+def check_time_limit() -> None:
+    """
+    raise AnalysisTimeoutException if the time limit set by TimeBudget for current thread is up.
+    """
+    if (limit := getattr(_local, "limit", None)) is not None:
+        deadline, message = limit
+        if time.monotonic() > deadline:
+            raise AnalysisTimeoutException(message)
+
+
+@contextmanager
+def _limit(seconds: float | None, message: str) -> Iterator[None]:
+    """
+    set time limit for the code block in current thread, nested limit can only be tighter.
+
+    The code block is not interrupted by itself. It's aborted in :func:`interruptible` blocks, or at
+    :func:`check_time_limit` calls, and time limit is checked again once the code block finishes.
+    """
+    if seconds is not None and seconds <= 0:
+        raise AnalysisTimeoutException(message)
+    previous = getattr(_local, "limit", None)
+    limit = (time.monotonic() + seconds, message) if seconds is not None else None
+    if limit is None or (previous is not None and previous[0] <= limit[0]):
+        limit = previous
+    _local.limit = limit
+    try:
+        yield
+    finally:
+        _local.limit = previous
+    if limit is not None and time.monotonic() > limit[0]:
+        raise AnalysisTimeoutException(limit[1])
+
+
+class TimeBudget:
+    """
+    Time budget of lineage analysis: a deadline for the whole run, and a time limit for each statement.
+
+    Budget is not enforced by interrupting whatever code is running, which could leave metadata connections, cache
+    files or locks in a broken state. Instead, only parsing is aborted when time is up, see :func:`interruptible`, the
+    rest checks time limit between phases. Statements running out of time are recorded in timed_out, so that analysis
+    can carry on with the rest.
+    """
+
+    def __init__(
+        self, timeout: float | None = None, statement_timeout: float | None = None
+    ):
+        """
+        :param timeout: seconds for the whole run starting from now, None means no limit
+        :param statement_timeout: seconds for each statement, None means no limit
+        """
+        self.timeout = timeout
+        self.statement_timeout = statement_timeout
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        self.timed_out: list[str] = []
+
+    def __bool__(self):
+        return self.timeout is not None or self.statement_timeout is not None
+
+    def remaining(self) -> float | None:
+        """
+        seconds left for the whole run, None if there's no deadline
+        """
+        return self._deadline - time.monotonic() if self._deadline is not None else None
+
+    def run(self, message: str):
+        """
+        limit the code block to the time left for the whole run
+        """
+        return _limit(self.remaining(), message)
+
+    def statement(self, sql: str):
+        """
+        limit analyzing a statement to the statement time limit, or the time left for the whole run if it's shorter
+        """
+        limits = [
+            s for s in (self.remaining(), self.statement_timeout) if s is not None
+        ]
+        return _limit(
+            min(limits) if limits else None,
+            f"SQLLineage ran out of time budget analyzing SQL:{sql}",
+        )
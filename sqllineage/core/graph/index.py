@@ -0,0 +1,198 @@
+from collections.abc import Iterator
+from typing import Any
+
+from sqllineage.utils.constant import EdgeDirection
+
+
+class EdgeLabelIndex:
+    """
+    Index of graph edges by label, plus adjacency of each vertex by label, so that edges of a given label (optionally
+    incident to a given vertex) are retrieved in time proportional to the result size rather than number of edges.
+
+    Vertex here can be either the vertex object itself or the node index used by graph library. Each edge is keyed by
+    (source, target) pair, with a value holding whatever the graph operator needs to access the edge data afterward,
+    e.g. edge index for rustworkx. Edges are kept in insertion order.
+
+    Graph operator owning the index is responsible for keeping it in sync with every mutation on the graph.
+    """
+
+    def __init__(self) -> None:
+        self._labels: dict[tuple[Any, Any], str] = {}
+        self._edges: dict[str, dict[tuple[Any, Any], Any]] = {}
+        self._out: dict[Any, dict[str, dict[Any, Any]]] = {}
+        self._in: dict[Any, dict[str, dict[Any, Any]]] = {}
+
+    def add(self, src: Any, tgt: Any, label: str, value: Any = None) -> None:
+        """
+        index an edge. When the edge is already indexed under another label, it's moved to the new label.
+        """
+        edge = (src, tgt)
+        if (existing := self._labels.get(edge)) is not None:
+            if existing == label:
+                self._edges[label][edge] = value
+                self._out[src][label][tgt] = value
+                self._in[tgt][label][src] = value
+                return
+            self.remove(src, tgt)
+        self._labels[edge] = label
+        self._edges.setdefault(label, {})[edge] = value
+        self._out.setdefault(src, {}).setdefault(label, {})[tgt] = value
+        self._in.setdefault(tgt, {}).setdefault(label, {})[src] = value
+
+    def label(self, src: Any, tgt: Any) -> str | None:
+        """
+        label of the edge, None if the edge doesn't exist
+        """
+        return self._labels.get((src, tgt))
+
+    def remove(self, src: Any, tgt: Any) -> Any:
+        """
+        remove an edge from index if exists, returning its value
+        """
+        edge = (src, tgt)
+        if (label := self._labels.pop(edge, None)) is not None:
+            del self._out[src][label][tgt]
+            del self._in[tgt][label][src]
+            return self._edges[label].pop(edge)
+        return None
+
+    def remove_vertex(self, vertex: Any) -> list[Any]:
+        """
+        remove all edges incident to the vertex from index, returning their values
+        """
+        values = []
+        for label, tgts in self._out.pop(vertex, {}).items():
+            for tgt in tgts:
+                del self._labels[(vertex, tgt)]
+                values.append(self._edges[label].pop((vertex, tgt)))
+                self._in[tgt][label].pop(vertex)
+        for label, srcs in self._in.pop(vertex, {}).items():
+            for src in srcs:
+                # self-loop is already removed with outgoing edges
+                if self._labels.pop((src, vertex), None) is not None:
+                    values.append(self._edges[label].pop((src, vertex)))
+                    self._out[src][label].pop(vertex)
+        return values
+
+    def edges(self, label: str) -> Iterator[tuple[Any, Any, Any]]:
+        """
+        iterate (source, target, value) of edges with the label
+        """
+        for (src, tgt), value in self._edges.get(label, {}).items():
+            yield src, tgt, value
+
+    def adjacent_edges(
+        self, vertex: Any, direction: str, label: str
+    ) -> Iterator[tuple[Any, Any, Any]]:
+        """
+        iterate (source, target, value) of edges with the label, going into or out of the vertex
+        """
+        if direction == EdgeDirection.IN:
+            for src, value in self._in.get(vertex, {}).get(label, {}).items():
+                yield src, vertex, value
+        else:
+            for tgt, value in self._out.get(vertex, {}).get(label, {}).items():
+                yield vertex, tgt, value
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+
+class VertexPropIndex:
+    """
+    Index of vertices by property value, e.g. vertices tagged with NodeTag.READ, so that vertices with given props are
+    retrieved in time proportional to the result size. Props of each vertex are kept as well, so that the index can
+    also serve as storage of vertex props. Property with unhashable value is kept but not indexed.
+
+    Like EdgeLabelIndex, vertex here can be either the vertex object itself or the node index used by graph library,
+    and graph operator owning the index is responsible for keeping it in sync with every mutation on the graph.
+    """
+
+    def __init__(self) -> None:
+        self._vertices: dict[tuple[str, Any], dict[Any, None]] = {}
+        self._props: dict[Any, dict[str, Any]] = {}
+
+    def update(self, vertex: Any, props: dict[str, Any]) -> None:
+        """
+        index props of a vertex. Props not present are left as is, the same way as updating vertex attributes.
+        """
+        indexed = self._props.setdefault(vertex, {})
+        for prop, value in props.items():
+            if prop in indexed:
+                if indexed[prop] == value:
+                    continue
+                self._discard(prop, indexed[prop], vertex)
+            indexed[prop] = value
+            try:
+                self._vertices.setdefault((prop, value), {})[vertex] = None
+            except TypeError:
+                # unhashable value
+                pass
+
+    def get(self, vertex: Any) -> dict[str, Any]:
+        """
+        props of the vertex
+        """
+        return self._props.get(vertex, {})
+
+    def remove_vertex(self, vertex: Any) -> None:
+        """
+        remove vertex from index if exists
+        """
+        for prop, value in self._props.pop(vertex, {}).items():
+            self._discard(prop, value, vertex)
+
+    def _discard(self, prop: str, value: Any, vertex: Any) -> None:
+        try:
+            bucket = self._vertices[(prop, value)]
+        except TypeError:
+            # unhashable value
+            return
+        del bucket[vertex]
+        if not bucket:
+            del self._vertices[(prop, value)]
+
+    def lookup(self, props: dict[str, Any]) -> list[Any] | None:
+        """
+        vertices with all the given props, None if it can't be looked up from index, when any of the prop value is not
+        hashable, or is None which also matches vertices without the prop.
+        """
+        if None in props.values():
+            return None
+        try:
+            buckets = [self._vertices.get(item, {}) for item in props.items()]
+        except TypeError:
+            return None
+        smallest = min(buckets, key=len)
+        return [v for v in smallest if all(v in bucket for bucket in buckets)]
+
+
+class VertexTypeIndex:
+    """
+    Vertices partitioned by type of the vertex object, e.g. Table or Column, so that vertices of given types are
+    retrieved in time proportional to the result size.
+
+    Like EdgeLabelIndex, vertex here can be either the vertex object itself or the node index used by graph library,
+    and graph operator owning the index is responsible for keeping it in sync with every mutation on the graph.
+    """
+
+    def __init__(self) -> None:
+        self._vertices: dict[type, dict[Any, None]] = {}
+
+    def add(self, vertex: Any, vertex_type: type) -> None:
+        self._vertices.setdefault(vertex_type, {})[vertex] = None
+
+    def remove(self, vertex: Any, vertex_type: type) -> None:
+        if (bucket := self._vertices.get(vertex_type)) is not None:
+            bucket.pop(vertex, None)
+
+    def lookup(self, *types: type) -> list[Any]:
+        """
+        vertices being instance of any of the given types
+        """
+        return [
+            v
+            for vertex_type, bucket in self._vertices.items()
+            if issubclass(vertex_type, types)
+            for v in bucket
+        ]
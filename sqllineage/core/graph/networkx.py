@@ -2,6 +2,7 @@ from typing import Any
 
 import networkx as nx
 
+from sqllineage.core.graph.index import EdgeLabelIndex, VertexPropIndex, VertexTypeIndex
 from sqllineage.core.graph_operator import GraphOperator
 from sqllineage.utils.constant import EdgeDirection
 from sqllineage.utils.entities import EdgeTuple
@@ -14,6 +15,10 @@ class NetworkXGraphOperator(GraphOperator):
     networkx allows any hashable object to be added as a node.
 
     networkx edge has a native support for edge type, which we use to store edge label.
+
+    Vertices are indexed by props and partitioned by type, and edges are indexed by label with edge attributes dict as
+    value. The indexes are built lazily upon first lookup and maintained by every mutation afterward. Sub graphs by
+    types are cached until the next mutation.
     """
 
     def __init__(self, graph: nx.DiGraph = None) -> None:
@@ -21,11 +26,48 @@ class NetworkXGraphOperator(GraphOperator):
             self.graph = nx.DiGraph()
         else:
             self.graph = graph
+        self._vertex_index: VertexPropIndex | None = None
+        self._type_index: VertexTypeIndex | None = None
+        self._edge_index: EdgeLabelIndex | None = None
+        self._sub_graphs: dict[tuple[type, ...], NetworkXGraphOperator] = {}
+
+    @property
+    def vertex_index(self) -> VertexPropIndex:
+        if self._vertex_index is None:
+            self._vertex_index = VertexPropIndex()
+            for vertex, attr in self.graph.nodes(data=True):
+                self._vertex_index.update(vertex, attr)
+        return self._vertex_index
+
+    @property
+    def type_index(self) -> VertexTypeIndex:
+        if self._type_index is None:
+            self._type_index = VertexTypeIndex()
+            for vertex in self.graph.nodes:
+                self._type_index.add(vertex, type(vertex))
+        return self._type_index
+
+    @property
+    def edge_index(self) -> EdgeLabelIndex:
+        if self._edge_index is None:
+            self._edge_index = EdgeLabelIndex()
+            for src, tgt, attr in self.graph.edges(data=True):
+                self._edge_index.add(src, tgt, attr.get("type", ""), attr)
+        return self._edge_index
 
     def add_vertex_if_not_exist(self, vertex: Any, **props) -> None:
         self.graph.add_node(vertex, **props)
+        self._sub_graphs.clear()
+        if self._vertex_index is not None:
+            self._vertex_index.update(vertex, props)
+        if self._type_index is not None:
+            self._type_index.add(vertex, type(vertex))
 
     def retrieve_vertices_by_props(self, **props) -> list[Any]:
+        if not props:
+            return list(self.graph.nodes)
+        if (vertices := self.vertex_index.lookup(props)) is not None:
+            return vertices
         vertices = []
         for v, attr in self.graph.nodes(data=True):
             if all(attr.get(prop) == val for prop, val in props.items()):
@@ -54,11 +96,23 @@ class NetworkXGraphOperator(GraphOperator):
             self.graph,
             {vertex: {k: v for k, v in props.items()} for vertex in vertices},
         )
+        self._sub_graphs.clear()
+        if self._vertex_index is not None:
+            for vertex in vertices:
+                if vertex in self.graph:
+                    self._vertex_index.update(vertex, props)
 
     def drop_vertices(self, *vertices) -> None:
         for vertex in vertices:
             if self.graph.has_node(vertex):
                 self.graph.remove_node(vertex)
+                self._sub_graphs.clear()
+                if self._vertex_index is not None:
+                    self._vertex_index.remove_vertex(vertex)
+                if self._type_index is not None:
+                    self._type_index.remove(vertex, type(vertex))
+                if self._edge_index is not None:
+                    self._edge_index.remove_vertex(vertex)
 
     def add_edge_if_not_exist(
         self, src_vertex: Any, tgt_vertex: Any, label: str, **props
@@ -68,19 +122,39 @@ class NetworkXGraphOperator(GraphOperator):
             # pop type if present as type is explicitly set by label
             props.pop("type", None)
             self.graph.add_edge(src_vertex, tgt_vertex, type=label, **props)
+            self._sub_graphs.clear()
+            if self._type_index is not None:
+                self._type_index.add(src_vertex, type(src_vertex))
+                self._type_index.add(tgt_vertex, type(tgt_vertex))
+            if self._edge_index is not None:
+                self._edge_index.add(
+                    src_vertex,
+                    tgt_vertex,
+                    label,
+                    self.graph.adj[src_vertex][tgt_vertex],
+                )
 
     def retrieve_edges_by_label(self, label: str) -> list[EdgeTuple]:
         return [
-            EdgeTuple(
-                source=src, target=tgt, label=attr.get("type", ""), attributes=attr
-            )
-            for src, tgt, attr in self.graph.edges(data=True)
-            if attr.get("type") == label
+            EdgeTuple(source=src, target=tgt, label=label, attributes=attr)
+            for src, tgt, attr in self.edge_index.edges(label)
         ]
 
     def retrieve_edges_by_vertex(
         self, vertex: Any, direction: str, label: str | None = None
     ) -> list[EdgeTuple]:
+        if label is not None:
+            return [
+                EdgeTuple(
+                    source=src,
+                    target=tgt,
+                    label=label,
+                    attributes=attr,
+                )
+                for src, tgt, attr in self.edge_index.adjacent_edges(
+                    vertex, direction, label
+                )
+            ]
         edges = []
         edge_view = (
             self.graph.in_edges(vertex, data=True)
@@ -88,31 +162,73 @@ class NetworkXGraphOperator(GraphOperator):
             else self.graph.out_edges(vertex, data=True)
         )
         for src, tgt, attr in edge_view:
-            # always add the edge when label is not specified (or when specified and matches)
-            if label is None or attr.get("type") == label:
-                edges.append(
-                    EdgeTuple(
-                        source=src,
-                        target=tgt,
-                        label=attr.get("type", ""),
-                        attributes=attr,
-                    )
+            edges.append(
+                EdgeTuple(
+                    source=src,
+                    target=tgt,
+                    label=attr.get("type", ""),
+                    attributes=attr,
                 )
+            )
         return edges
 
     def drop_edge(self, src_vertex: Any, tgt_vertex: Any) -> None:
         self.graph.remove_edge(src_vertex, tgt_vertex)
+        self._sub_graphs.clear()
+        if self._edge_index is not None:
+            self._edge_index.remove(src_vertex, tgt_vertex)
 
     def get_sub_graph(self, *vertices) -> "NetworkXGraphOperator":
         return NetworkXGraphOperator(self.graph.subgraph(vertices))
 
-    def merge(self, other: GraphOperator) -> None:
-        if isinstance(other, NetworkXGraphOperator):
-            self.graph = nx.compose(self.graph, other.graph)
-        else:
-            raise TypeError(
-                "Expect other to be NetworkXGraphOperator, got " + str(type(other))
+    def get_sub_graph_by_types(self, *types: type) -> "NetworkXGraphOperator":
+        if (sub_graph := self._sub_graphs.get(types)) is None:
+            sub_graph = self._sub_graphs[types] = self.get_sub_graph(
+                *self.retrieve_vertices_by_types(*types)
+            )
+        return sub_graph
+
+    def retrieve_vertices_by_types(self, *types: type) -> list[Any]:
+        return self.type_index.lookup(*types)
+
+    def retrieve_vertex_degrees(self) -> dict[Any, tuple[int, int]]:
+        return {
+            v: (in_degree, out_degree)
+            for (v, in_degree), (_, out_degree) in zip(
+                self.graph.in_degree, self.graph.out_degree
             )
+        }
+
+    def merge(self, other: GraphOperator) -> None:
+        self.merge_many(other)
+
+    def merge_many(self, *others: GraphOperator) -> None:
+        if nx.is_frozen(self.graph):
+            # sub graph view can't be modified, make a copy of it first
+            self.graph = self.graph.copy()
+        self._sub_graphs.clear()
+        # add to current graph in place instead of nx.compose, which copies current graph every time
+        for other in others:
+            if isinstance(other, NetworkXGraphOperator):
+                self.graph.add_nodes_from(other.graph.nodes(data=True))
+                if self._vertex_index is not None:
+                    for vertex, attr in other.graph.nodes(data=True):
+                        self._vertex_index.update(vertex, attr)
+                if self._type_index is not None:
+                    for vertex in other.graph.nodes:
+                        self._type_index.add(vertex, type(vertex))
+                self.graph.add_edges_from(other.graph.edges(data=True))
+                if self._edge_index is not None:
+                    for src, tgt in other.graph.edges:
+                        attr = self.graph.adj[src][tgt]
+                        self._edge_index.add(src, tgt, attr.get("type", ""), attr)
+            else:
+                raise TypeError(
+                    "Expect other to be NetworkXGraphOperator, got " + str(type(other))
+                )
+
+    def retrieve_ancestors(self, vertex: Any) -> set[Any]:
+        return nx.ancestors(self.graph, vertex) if vertex in self.graph else set()
 
     def list_lineage_paths(self, src_vertex: Any, tgt_vertex: Any) -> list[list[Any]]:
         return list(nx.all_simple_paths(self.graph, src_vertex, tgt_vertex))
@@ -1,7 +1,9 @@
+from collections.abc import Iterable
 from typing import Any
 
 import rustworkx as rx
 
+from sqllineage.core.graph.index import EdgeLabelIndex, VertexPropIndex, VertexTypeIndex
 from sqllineage.core.graph_operator import GraphOperator
 from sqllineage.utils.constant import EdgeDirection
 from sqllineage.utils.entities import EdgeTuple
@@ -11,227 +13,401 @@ class RustworkXGraphOperator(GraphOperator):
     """
     rustworkx based implementation of GraphOperator
 
-    node added to rustworkx graph can only be accessed by index, and it doesn't distinguish nodes vs nodes attributes.
-    For the implementation, each vertex T is represented as a dict with at least one key "vertex" to hold the actual
-    vertex object, e.g., {vertex: T, prop1: val1, ...}, and we will maintain a mapping from vertex T to its node index
-    in the graph
+    node added to rustworkx graph can only be accessed by index. Node payload is the vertex object itself, and we will
+    maintain a mapping from vertex to its node index in the graph. Edge payload is an integer code of the edge label.
+    Everything else lives in side tables keyed by node index or edge index:
 
-    edge added to rustworkx does not have the concept of label, so we will store label as part of edge data,
-    e.g., {label: str, prop1: val1, ...}
+    - vertex props, indexed by prop value
+    - vertex types
+    - edges by label, plus props for the few edges having them, e.g. {index: int} for has_column edges
+
+    Ancestors and paths are queried on node indices, which are mapped back to vertex objects only for the result.
+
+    Sub graph is a view over the same graph and side tables, restricted to a set of node indices. It's materialized
+    into a graph of its own only when being modified, or when listing lineage paths. Like networkx sub graph view, it's
+    not supposed to be used after the graph it's created from is modified, as node indices may be reused by then.
+    RuntimeError is raised if it is. Sub graphs by types are cached until the next mutation.
     """
 
-    def __init__(self, graph: rx.PyDiGraph[Any, Any] | None = None) -> None:
-        if graph is None:
-            self.graph = rx.PyDiGraph()
-            self._vertex_to_index: dict[Any, int] = {}
-        else:
-            self.graph = graph
-            # Rebuild vertex mapping from existing graph using actual node indices
-            self._vertex_to_index = {}
-            for node_idx in self.graph.node_indices():
-                node_data = self.graph[node_idx]
-                self._vertex_to_index[node_data["vertex"]] = node_idx
+    def __init__(self, graph: rx.PyDiGraph | None = None) -> None:
+        """
+        :param graph: a prebuilt rustworkx PyDiGraph or PyDAG, with node payload {vertex: T, prop1: val1, ...} and edge
+                      payload {label: str, prop1: val1, ...}. Node payload other than such dict is taken as the vertex
+                      itself. The graph is copied into the representation described above, rather than used in place.
+        """
+        self.graph: rx.PyDiGraph[Any, int] = rx.PyDiGraph()
+        self._vertex_to_index: dict[Any, int] = {}
+        self._vertex_index = VertexPropIndex()
+        self._type_index = VertexTypeIndex()
+        self._edge_index = EdgeLabelIndex()
+        self._edge_props: dict[int, dict[str, Any]] = {}
+        self._label_codes: dict[str, int] = {}
+        self._labels: list[str] = []
+        self._sub_graphs: dict[tuple[type, ...], RustworkXGraphOperator] = {}
+        # node indices of sub graph view in ascending order, None for the whole graph
+        self._nodes: dict[int, None] | None = None
+        # sub graph view materialized as a graph of its own, with mapping from its node index to the original one
+        self._compact: tuple[rx.PyDiGraph[Any, int], rx.NodeMap] | None = None
+        # number of mutations so far, shared with sub graph views, and the number when a view is created
+        self._version = [0]
+        self._view_version = 0
+        if graph is not None:
+            self._load(graph)
+
+    def _load(self, graph: rx.PyDiGraph) -> None:
+        vertices = {}
+        for node_idx in graph.node_indices():
+            payload = graph[node_idx]
+            if isinstance(payload, dict) and "vertex" in payload:
+                props = dict(payload)
+                vertex = props.pop("vertex")
+            else:
+                vertex, props = payload, {}
+            self.add_vertex_if_not_exist(vertex, **props)
+            vertices[node_idx] = vertex
+        for src_idx, tgt_idx, payload in graph.weighted_edge_list():
+            props = dict(payload) if isinstance(payload, dict) else {}
+            label = props.pop("label", "")
+            self.add_edge_if_not_exist(
+                vertices[src_idx], vertices[tgt_idx], label, **props
+            )
+
+    def _view(self, node_indices: Iterable[int]) -> "RustworkXGraphOperator":
+        view = object.__new__(RustworkXGraphOperator)
+        view.__dict__.update(self.__dict__)
+        view._nodes = dict.fromkeys(sorted(node_indices))
+        view._sub_graphs = {}
+        view._compact = None
+        view._view_version = self._version[0]
+        return view
+
+    def _mutated(self) -> None:
+        # invalidate cached sub graphs, as well as sub graph views created from this graph
+        self._sub_graphs.clear()
+        self._version[0] += 1
+
+    def _check_view(self) -> None:
+        if self._version[0] != self._view_version:
+            raise RuntimeError(
+                "Sub graph view is used after the graph it's created from is modified"
+            )
+
+    def _materialize(self) -> None:
+        # copy sub graph view into a graph of its own before modifying it
+        if self._nodes is not None:
+            materialized = RustworkXGraphOperator()
+            materialized._merge(self)
+            self.__dict__.update(materialized.__dict__)
+
+    def _node_indices(self) -> Iterable[int]:
+        if self._nodes is None:
+            return self.graph.node_indices()
+        self._check_view()
+        return self._nodes
+
+    def _contains(self, node_idx: int) -> bool:
+        if self._nodes is None:
+            return True
+        self._check_view()
+        return node_idx in self._nodes
+
+    def _get_index(self, vertex: Any) -> int | None:
+        idx = self._vertex_to_index.get(vertex)
+        return idx if idx is not None and self._contains(idx) else None
+
+    def _add_node(self, vertex: Any) -> int:
+        node_idx = self.graph.add_node(vertex)
+        self._vertex_to_index[vertex] = node_idx
+        self._type_index.add(node_idx, type(vertex))
+        return node_idx
+
+    def _label_code(self, label: str) -> int:
+        if (code := self._label_codes.get(label)) is None:
+            code = self._label_codes[label] = len(self._labels)
+            self._labels.append(label)
+        return code
+
+    def _to_edge_tuple(self, src_idx: int, tgt_idx: int, edge_idx: int) -> EdgeTuple:
+        return EdgeTuple(
+            source=self.graph[src_idx],
+            target=self.graph[tgt_idx],
+            label=self._labels[self.graph.get_edge_data_by_index(edge_idx)],
+            attributes=self._edge_props.get(edge_idx) or {},
+        )
+
+    def _degrees(self, node_idx: int) -> tuple[int, int]:
+        if self._nodes is None:
+            return self.graph.in_degree(node_idx), self.graph.out_degree(node_idx)
+        return (
+            sum(
+                1 for i in self.graph.predecessor_indices(node_idx) if i in self._nodes
+            ),
+            sum(1 for i in self.graph.successor_indices(node_idx) if i in self._nodes),
+        )
 
     def add_vertex_if_not_exist(self, vertex: Any, **props) -> None:
-        if vertex in self._vertex_to_index:
-            # Update existing node
-            node_idx = self._vertex_to_index[vertex]
-            node_data = self.graph[node_idx]
-            node_data.update(props)
-            self.graph[node_idx] = node_data
-        else:
-            # Add new node
-            node_data = {"vertex": vertex, **props}
-            node_idx = self.graph.add_node(node_data)
-            self._vertex_to_index[vertex] = node_idx
+        self._materialize()
+        if (node_idx := self._vertex_to_index.get(vertex)) is None:
+            node_idx = self._add_node(vertex)
+            self._mutated()
+        # props are looked up from the side table shared with sub graph views, updating them doesn't stale the views
+        self._vertex_index.update(node_idx, props)
 
     def retrieve_vertices_by_props(self, **props) -> list[Any]:
-        vertices = []
-        for node_idx in self.graph.node_indices():
-            node_data = self.graph[node_idx]
-            if all(node_data.get(prop) == val for prop, val in props.items()):
-                vertices.append(node_data["vertex"])
-        return vertices
-
-    def retrieve_source_vertices(self) -> list[Any]:
+        if not props:
+            return [self.graph[node_idx] for node_idx in self._node_indices()]
+        if (indices := self._vertex_index.lookup(props)) is not None:
+            return [self.graph[idx] for idx in indices if self._contains(idx)]
         return [
-            self.graph[node_idx]["vertex"]
-            for node_idx in self.graph.node_indices()
-            if len(self.graph.in_edges(node_idx)) == 0
-            and len(self.graph.out_edges(node_idx)) > 0
+            self.graph[node_idx]
+            for node_idx in self._node_indices()
+            if all(
+                self._vertex_index.get(node_idx).get(prop) == val
+                for prop, val in props.items()
+            )
         ]
 
+    def retrieve_source_vertices(self) -> list[Any]:
+        vertices = []
+        for node_idx in self._node_indices():
+            in_degree, out_degree = self._degrees(node_idx)
+            if in_degree == 0 and out_degree > 0:
+                vertices.append(self.graph[node_idx])
+        return vertices
+
     def retrieve_target_vertices(self) -> list[Any]:
-        return [
-            self.graph[node_idx]["vertex"]
-            for node_idx in self.graph.node_indices()
-            if len(self.graph.in_edges(node_idx)) > 0
-            and len(self.graph.out_edges(node_idx)) == 0
-        ]
+        vertices = []
+        for node_idx in self._node_indices():
+            in_degree, out_degree = self._degrees(node_idx)
+            if in_degree > 0 and out_degree == 0:
+                vertices.append(self.graph[node_idx])
+        return vertices
 
     def retrieve_selfloop_vertices(self) -> list[Any]:
         return [
-            self.graph[node_idx]["vertex"]
-            for node_idx in self.graph.node_indices()
-            if self.graph.has_edge(node_idx, node_idx)
+            self.graph[node_idx]
+            for node_idx in self._node_indices()
+            if self._edge_index.label(node_idx, node_idx) is not None
         ]
 
+    def retrieve_vertex_degrees(self) -> dict[Any, tuple[int, int]]:
+        return {
+            self.graph[node_idx]: self._degrees(node_idx)
+            for node_idx in self._node_indices()
+        }
+
     def update_vertices(self, *vertices: Any, **props) -> None:
+        self._materialize()
         for vertex in vertices:
-            if vertex in self._vertex_to_index:
-                node_idx = self._vertex_to_index[vertex]
-                node_data = self.graph[node_idx]
-                node_data.update(props)
-                self.graph[node_idx] = node_data
+            if (node_idx := self._vertex_to_index.get(vertex)) is not None:
+                self._vertex_index.update(node_idx, props)
 
     def drop_vertices(self, *vertices: Any) -> None:
+        self._materialize()
         indices_to_remove = []
         for vertex in vertices:
-            # remove from mapping and collect indices to remove
+            # remove from mapping and side tables, and collect indices to remove
             if (idx := self._vertex_to_index.pop(vertex, None)) is not None:
                 indices_to_remove.append(idx)
-        self.graph.remove_nodes_from(indices_to_remove)
+                self._vertex_index.remove_vertex(idx)
+                self._type_index.remove(idx, type(self.graph[idx]))
+                for edge_idx in self._edge_index.remove_vertex(idx):
+                    self._edge_props.pop(edge_idx, None)
+        if indices_to_remove:
+            self.graph.remove_nodes_from(indices_to_remove)
+            self._mutated()
 
     def add_edge_if_not_exist(
         self, src_vertex: Any, tgt_vertex: Any, label: str, **props
     ) -> None:
         if src_vertex is not None and tgt_vertex is not None:
+            self._materialize()
             src_idx = self._vertex_to_index.get(src_vertex)
             tgt_idx = self._vertex_to_index.get(tgt_vertex)
             if src_idx is None:
-                src_idx = self.graph.add_node({"vertex": src_vertex})
-                self._vertex_to_index[src_vertex] = src_idx
+                src_idx = self._add_node(src_vertex)
+                self._mutated()
             if tgt_idx is None:
-                tgt_idx = self.graph.add_node({"vertex": tgt_vertex})
-                self._vertex_to_index[tgt_vertex] = tgt_idx
-            edge_data = {"label": label, **props}
-            if not self.graph.has_edge(src_idx, tgt_idx):
-                self.graph.add_edge(src_idx, tgt_idx, edge_data)
+                tgt_idx = self._add_node(tgt_vertex)
+                self._mutated()
+            if self._edge_index.label(src_idx, tgt_idx) is None:
+                edge_idx = self.graph.add_edge(
+                    src_idx, tgt_idx, self._label_code(label)
+                )
+                self._edge_index.add(src_idx, tgt_idx, label, edge_idx)
+                if props:
+                    self._edge_props[edge_idx] = props
+                self._mutated()
 
     def retrieve_edges_by_label(self, label: str) -> list[EdgeTuple]:
-        edges = []
-        for src_idx, tgt_idx in self.graph.edge_list():
-            edge_data = self.graph.get_edge_data(src_idx, tgt_idx)
-            if edge_data["label"] == label:
-                attribute = edge_data.copy()
-                attribute.pop("label")
-                edges.append(
-                    EdgeTuple(
-                        source=self.graph[src_idx]["vertex"],
-                        target=self.graph[tgt_idx]["vertex"],
-                        label=label,
-                        attributes=attribute,
-                    )
-                )
-        return edges
+        return [
+            self._to_edge_tuple(src_idx, tgt_idx, edge_idx)
+            for src_idx, tgt_idx, edge_idx in self._edge_index.edges(label)
+            if self._contains(src_idx) and self._contains(tgt_idx)
+        ]
 
     def retrieve_edges_by_vertex(
         self, vertex: Any, direction: str, label: str | None = None
     ) -> list[EdgeTuple]:
-        edges: list[EdgeTuple] = []
-        vertex_idx = self._vertex_to_index.get(vertex, -1)
-
-        # rustworkx returns in_edges and out_edges in reverse insertion order
-        # we want to return in insertion order to match the behavior of NetworkX
-        if direction == EdgeDirection.IN:
-            edge_list = reversed(self.graph.in_edges(vertex_idx))
+        if (vertex_idx := self._get_index(vertex)) is None:
+            return []
+        if label is not None:
+            edges = self._edge_index.adjacent_edges(vertex_idx, direction, label)
         else:
-            edge_list = reversed(self.graph.out_edges(vertex_idx))
-
-        # Collect edges and sort by (source_idx, target_idx) for deterministic ordering
-        for src_idx, tgt_idx, edge_data in edge_list:
-            if label is None or edge_data.get("label") == label:
-                src_node = self.graph[src_idx]
-                tgt_node = self.graph[tgt_idx]
-                src_vertex = (
-                    src_node.get("vertex") if isinstance(src_node, dict) else src_node
-                )
-                tgt_vertex = (
-                    tgt_node.get("vertex") if isinstance(tgt_node, dict) else tgt_node
-                )
-                label = edge_data["label"]
-                attributes = edge_data.copy()
-                attributes.pop("label")
-                edges.append(
-                    EdgeTuple(
-                        source=src_vertex,
-                        target=tgt_vertex,
-                        label=label,
-                        attributes=attributes,
-                    )
-                )
-
-        return edges
+            # rustworkx returns incident edges in reverse insertion order
+            # we want to return in insertion order to match the behavior of NetworkX
+            edge_indices = reversed(
+                self.graph.in_edge_indices(vertex_idx)
+                if direction == EdgeDirection.IN
+                else self.graph.out_edge_indices(vertex_idx)
+            )
+            edges = (
+                (*self.graph.get_edge_endpoints_by_index(edge_idx), edge_idx)
+                for edge_idx in edge_indices
+            )
+        return [
+            self._to_edge_tuple(src_idx, tgt_idx, edge_idx)
+            for src_idx, tgt_idx, edge_idx in edges
+            if self._contains(src_idx) and self._contains(tgt_idx)
+        ]
 
     def drop_edge(self, src_vertex: Any, tgt_vertex: Any) -> None:
+        self._materialize()
         src_idx = self._vertex_to_index.get(src_vertex)
         tgt_idx = self._vertex_to_index.get(tgt_vertex)
         if (
             src_idx is not None
             and tgt_idx is not None
-            and self.graph.has_edge(src_idx, tgt_idx)
+            and (edge_idx := self._edge_index.remove(src_idx, tgt_idx)) is not None
         ):
-            self.graph.remove_edge(src_idx, tgt_idx)
+            self.graph.remove_edge_from_index(edge_idx)
+            self._edge_props.pop(edge_idx, None)
+            self._mutated()
 
     def get_sub_graph(self, *vertices: Any) -> "RustworkXGraphOperator":
-        indices = [
-            self._vertex_to_index[vertex]
-            for vertex in vertices
-            if vertex in self._vertex_to_index
+        return self._view(
+            {idx for vertex in vertices if (idx := self._get_index(vertex)) is not None}
+        )
+
+    def get_sub_graph_by_types(self, *types: type) -> "RustworkXGraphOperator":
+        if (sub_graph := self._sub_graphs.get(types)) is None:
+            sub_graph = self._sub_graphs[types] = self.get_sub_graph(
+                *self.retrieve_vertices_by_types(*types)
+            )
+        return sub_graph
+
+    def retrieve_vertices_by_types(self, *types: type) -> list[Any]:
+        return [
+            self.graph[node_idx]
+            for node_idx in self._type_index.lookup(*types)
+            if self._contains(node_idx)
         ]
-        return RustworkXGraphOperator(self.graph.subgraph(indices))
 
     def merge(self, other: GraphOperator) -> None:
-        if isinstance(other, RustworkXGraphOperator):
-            # Create a mapping from other's indices to self's indices
-            index_mapping = {}
-
-            # Add all nodes from other graph
-            for other_idx in other.graph.node_indices():
-                node_data = other.graph[other_idx]
-                vertex = node_data["vertex"]
-                if vertex not in self._vertex_to_index:
-                    new_idx = self.graph.add_node(node_data)
-                    self._vertex_to_index[vertex] = new_idx
-                    index_mapping[other_idx] = new_idx
-                else:
-                    self.graph[self._vertex_to_index[vertex]].update(node_data)
-                    index_mapping[other_idx] = self._vertex_to_index[vertex]
-
-            # Add all edges from other graph
-            for src_idx, tgt_idx in other.graph.edge_list():
-                edge_data = other.graph.get_edge_data(src_idx, tgt_idx)
-                self_src_idx = index_mapping.get(src_idx, -1)
-                self_tgt_idx = index_mapping.get(tgt_idx, -1)
-                if not self.graph.has_edge(self_src_idx, self_tgt_idx):
-                    self.graph.add_edge(self_src_idx, self_tgt_idx, edge_data)
+        self.merge_many(other)
+
+    def merge_many(self, *others: GraphOperator) -> None:
+        self._materialize()
+        for other in others:
+            if isinstance(other, RustworkXGraphOperator):
+                self._merge(other)
+            else:
+                raise TypeError(
+                    "Expect other to be RustworkXGraphOperator, got " + str(type(other))
+                )
+
+    def _merge(self, other: "RustworkXGraphOperator") -> None:
+        self._mutated()
+        # Create a mapping from other's indices to self's indices
+        index_mapping = {}
+        # new vertices to add, with position of each new vertex and mapping from other's indices to the position.
+        # Other graph may contain equal vertices as separate nodes, they're merged into one just like adding them one
+        # by one.
+        new_vertices: list[Any] = []
+        new_positions: dict[Any, int] = {}
+        other_idx_to_position = {}
+        for other_idx in other._node_indices():
+            vertex = other.graph[other_idx]
+            if (idx := self._vertex_to_index.get(vertex)) is not None:
+                index_mapping[other_idx] = idx
+            elif (pos := new_positions.get(vertex)) is not None:
+                other_idx_to_position[other_idx] = pos
+            else:
+                new_positions[vertex] = other_idx_to_position[other_idx] = len(
+                    new_vertices
+                )
+                new_vertices.append(vertex)
+        # Add new nodes and edges in bulk
+        indices = self.graph.add_nodes_from(new_vertices)
+        for vertex, pos in new_positions.items():
+            self._vertex_to_index[vertex] = indices[pos]
+            self._type_index.add(indices[pos], type(vertex))
+        for other_idx, pos in other_idx_to_position.items():
+            index_mapping[other_idx] = indices[pos]
+        for other_idx, idx in index_mapping.items():
+            # props are copied so that later update on either graph won't affect the other
+            self._vertex_index.update(idx, other._vertex_index.get(other_idx))
+        new_edges: dict[tuple[int, int], tuple[str, int]] = {}
+        for other_edge_idx, (
+            src_idx,
+            tgt_idx,
+            code,
+        ) in other.graph.edge_index_map().items():
+            if src_idx not in index_mapping or tgt_idx not in index_mapping:
+                continue
+            edge = (index_mapping[src_idx], index_mapping[tgt_idx])
+            if edge not in new_edges and self._edge_index.label(*edge) is None:
+                new_edges[edge] = (other._labels[code], other_edge_idx)
+        edge_indices = self.graph.add_edges_from(
+            [(*edge, self._label_code(label)) for edge, (label, _) in new_edges.items()]
+        )
+        for ((src_idx, tgt_idx), (label, other_edge_idx)), edge_idx in zip(
+            new_edges.items(), edge_indices
+        ):
+            self._edge_index.add(src_idx, tgt_idx, label, edge_idx)
+            if props := other._edge_props.get(other_edge_idx):
+                self._edge_props[edge_idx] = dict(props)
+
+    def retrieve_ancestors(self, vertex: Any) -> set[Any]:
+        if (idx := self._get_index(vertex)) is None:
+            return set()
+        if self._nodes is None:
+            ancestors = rx.ancestors(self.graph, idx)
         else:
-            raise TypeError(
-                "Expect other to be RustworkXGraphOperator, got " + str(type(other))
-            )
+            # walk backward within the sub graph view
+            ancestors, stack = set(), [idx]
+            while stack:
+                for i in self.graph.predecessor_indices(stack.pop()):
+                    if i in self._nodes and i not in ancestors:
+                        ancestors.add(i)
+                        stack.append(i)
+            ancestors.discard(idx)
+        return {self.graph[i] for i in ancestors}
 
     def list_lineage_paths(self, src_vertex: Any, tgt_vertex: Any) -> list[list[Any]]:
-        result = []
-        for path in rx.all_simple_paths(
-            self.graph,
-            self._vertex_to_index.get(src_vertex, -1),
-            self._vertex_to_index.get(tgt_vertex, -1),
-        ):
-            path_vertices = []
-            for idx in path:
-                node_data = self.graph[idx]
-                path_vertices.append(node_data["vertex"])
-            result.append(path_vertices)
-        return result
+        src_idx = self._get_index(src_vertex)
+        tgt_idx = self._get_index(tgt_vertex)
+        if src_idx is None or tgt_idx is None:
+            return []
+        graph = self.graph
+        if self._nodes is not None:
+            if self._compact is None:
+                self._compact = self.graph.subgraph_with_nodemap(list(self._nodes))
+            graph, node_map = self._compact
+            to_compact = {v: k for k, v in node_map.items()}
+            src_idx, tgt_idx = to_compact[src_idx], to_compact[tgt_idx]
+        return [
+            [graph[idx] for idx in path]
+            for path in rx.all_simple_paths(graph, src_idx, tgt_idx)
+        ]
 
     def to_cytoscape(
         self, compound: bool = False
     ) -> list[dict[str, dict[str, object]]]:
+        vertices = self.retrieve_vertices_by_props()
         if compound:
             parents_dict = {}
-            for node_idx in self.graph.node_indices():
-                node_data = self.graph[node_idx]
-                vertex = node_data.get("vertex")
+            for vertex in vertices:
                 parent = getattr(vertex, "parent", None)
                 if parent is not None:
                     parents_dict[parent] = {
@@ -240,8 +416,7 @@ class RustworkXGraphOperator(GraphOperator):
                     }
 
             nodes = []
-            for node_idx in self.graph.node_indices():
-                vertex = self.graph[node_idx]["vertex"]
+            for vertex in vertices:
                 parent = getattr(vertex, "parent", None)
                 parent_candidates = getattr(vertex, "parent_candidates", [])
                 nodes.append(
@@ -267,20 +442,21 @@ class RustworkXGraphOperator(GraphOperator):
                 for _, attr in parents_dict.items()
             ]
         else:
-            nodes = [
-                {"data": {"id": str(self.graph[node_idx]["vertex"])}}
-                for node_idx in self.graph.node_indices()
-            ]
+            nodes = [{"data": {"id": str(vertex)}} for vertex in vertices]
 
         edges: list[dict[str, dict[str, Any]]] = [
             {
                 "data": {
                     "id": f"e{edge_id}",
-                    "source": str(self.graph[src_idx]["vertex"]),
-                    "target": str(self.graph[tgt_idx]["vertex"]),
+                    "source": str(self.graph[src_idx]),
+                    "target": str(self.graph[tgt_idx]),
                 }
             }
-            for edge_id, (src_idx, tgt_idx) in enumerate(self.graph.edge_list())
+            for edge_id, (src_idx, tgt_idx) in enumerate(
+                (src_idx, tgt_idx)
+                for src_idx, tgt_idx in self.graph.edge_list()
+                if self._contains(src_idx) and self._contains(tgt_idx)
+            )
         ]
 
         return nodes + edges
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from sqllineage.utils.constant import EdgeDirection
 from sqllineage.utils.entities import EdgeTuple
 
 
@@ -83,6 +84,35 @@ class GraphOperator(ABC):
     def get_sub_graph(self, *vertices: Any) -> "GraphOperator":
         raise NotImplementedError
 
+    def get_sub_graph_by_types(self, *types: type) -> "GraphOperator":
+        """
+        sub graph of vertices being instance of any of the given types, e.g. table level or column level lineage.
+
+        Implementation may cache the sub graph until current graph is modified, so the caller shouldn't modify it.
+        """
+        return self.get_sub_graph(*self.retrieve_vertices_by_types(*types))
+
+    def retrieve_vertices_by_types(self, *types: type) -> list[Any]:
+        """
+        vertices being instance of any of the given types
+        """
+        return [v for v in self.retrieve_vertices_by_props() if isinstance(v, types)]
+
+    def retrieve_vertex_degrees(self) -> dict[Any, tuple[int, int]]:
+        """
+        in-degree and out-degree of each vertex.
+
+        This default implementation counts via retrieve_edges_by_vertex, override it if the underlying graph library
+        offers a native one.
+        """
+        return {
+            v: (
+                len(self.retrieve_edges_by_vertex(v, EdgeDirection.IN)),
+                len(self.retrieve_edges_by_vertex(v, EdgeDirection.OUT)),
+            )
+            for v in self.retrieve_vertices_by_props()
+        }
+
     @abstractmethod
     def merge(self, other: "GraphOperator") -> None:
         """
@@ -92,6 +122,30 @@ class GraphOperator(ABC):
         """
         raise NotImplementedError
 
+    def merge_many(self, *others: "GraphOperator") -> None:
+        """
+        merge multiple graphs into current graph in one go, same as calling merge one by one following the order.
+        """
+        for other in others:
+            self.merge(other)
+
+    def retrieve_ancestors(self, vertex: Any) -> set[Any]:
+        """
+        ancestors are defined as vertices with a path to the given vertex, excluding the vertex itself.
+
+        This default implementation walks backward via retrieve_edges_by_vertex, override it if the underlying graph
+        library offers a native one.
+        """
+        ancestors = set()
+        stack = [vertex]
+        while stack:
+            for edge in self.retrieve_edges_by_vertex(stack.pop(), EdgeDirection.IN):
+                if edge.source not in ancestors:
+                    ancestors.add(edge.source)
+                    stack.append(edge.source)
+        ancestors.discard(vertex)
+        return ancestors
+
     @abstractmethod
     def list_lineage_paths(self, src_vertex: Any, tgt_vertex: Any) -> list[list[Any]]:
         """
@@ -1,5 +1,7 @@
 import itertools
+from typing import Any
 
+from sqllineage.core.budget import check_time_limit
 from sqllineage.core.graph import get_graph_operator_class
 from sqllineage.core.graph_operator import GraphOperator
 from sqllineage.core.metadata_provider import MetaDataProvider
@@ -7,24 +9,85 @@ from sqllineage.core.models import Column, Path, Schema, SubQuery, Table
 from sqllineage.utils.constant import EdgeDirection, EdgeTag, EdgeType, NodeTag
 
 DATASET_CLASSES = (Path, Table)
+STATEMENT_NODE_TAGS = (NodeTag.READ, NodeTag.WRITE, NodeTag.CTE, NodeTag.DROP)
+STATEMENT_EDGE_TYPES = (
+    EdgeType.LINEAGE,
+    EdgeType.RENAME,
+    EdgeType.HAS_COLUMN,
+    EdgeType.HAS_ALIAS,
+)
 
 
 class ColumnLineageMixin:
     def get_column_lineage(
-        self, exclude_path_ending_in_subquery=True, exclude_subquery_columns=False
+        self,
+        exclude_path_ending_in_subquery=True,
+        exclude_subquery_columns=False,
+        endpoints_only=False,
     ) -> set[tuple[Column, ...]]:
         """
         :param exclude_path_ending_in_subquery:  exclude_subquery rename to exclude_path_ending_in_subquery
                exclude column from SubQuery in the ending path
         :param exclude_subquery_columns: exclude column from SubQuery in the path.
+        :param endpoints_only: only return (source column, target column) pairs connected by lineage path, without
+               enumerating every path in between. exclude_subquery_columns doesn't apply in this case.
 
         return a list of column tuple :class:`sqllineage.models.Column`
         """
+        source_columns, target_columns = self._get_column_lineage_endpoints(
+            exclude_path_ending_in_subquery
+        )
+        columns: set[tuple[Column, ...]] = set()
+        for target in target_columns:
+            check_time_limit()
+            # walk backward once from each target, so that paths are only enumerated for reachable source
+            ancestors = self.go.retrieve_ancestors(target)
+            for source in source_columns:
+                # source is the same as target for self-loop column
+                if source not in ancestors and source != target:
+                    continue
+                if endpoints_only:
+                    columns.add((source, target))
+                    continue
+                for path in self.go.list_lineage_paths(source, target):
+                    check_time_limit()
+                    if exclude_subquery_columns:
+                        path = [
+                            node
+                            for node in path
+                            if not isinstance(node.parent, SubQuery)
+                        ]
+                        if len(path) > 1:
+                            columns.add(tuple(path))
+                    else:
+                        columns.add(tuple(path))
+        return columns
+
+    def get_column_lineage_dag(
+        self, exclude_path_ending_in_subquery=True
+    ) -> GraphOperator:
+        """
+        a compressed form of column lineage: the sub graph of all the columns on lineage paths. Each path returned
+        by get_column_lineage is a path in this graph from a source column to a target column.
+
+        :param exclude_path_ending_in_subquery: exclude column from SubQuery in the ending path
+        """
+        _, target_columns = self._get_column_lineage_endpoints(
+            exclude_path_ending_in_subquery
+        )
+        vertices = set(target_columns)
+        for target in target_columns:
+            vertices |= {
+                v for v in self.go.retrieve_ancestors(target) if isinstance(v, Column)
+            }
+        return self.go.get_sub_graph(*vertices)
+
+    def _get_column_lineage_endpoints(
+        self, exclude_path_ending_in_subquery: bool
+    ) -> tuple[list[Column], list[Column]]:
         self.go: GraphOperator  # For mypy attribute checking
         # filter all the column node in the graph
-        column_graph = self.go.get_sub_graph(
-            *[v for v in self.go.retrieve_vertices_by_props() if isinstance(v, Column)]
-        )
+        column_graph = self.go.get_sub_graph_by_types(Column)
         source_columns = column_graph.retrieve_source_vertices()
         target_columns = column_graph.retrieve_target_vertices()
         # handle column-level self-loop case like table-level
@@ -35,22 +98,10 @@ class ColumnLineageMixin:
                     column_group.append(column)
         # if a column lineage path ends at SubQuery, then it should be pruned
         if exclude_path_ending_in_subquery:
-            target_columns = {
+            target_columns = [
                 node for node in target_columns if isinstance(node.parent, Table)
-            }
-        columns = set()
-        for source, target in itertools.product(source_columns, target_columns):
-            simple_paths = self.go.list_lineage_paths(source, target)
-            for path in simple_paths:
-                if exclude_subquery_columns:
-                    path = [
-                        node for node in path if not isinstance(node.parent, SubQuery)
-                    ]
-                    if len(path) > 1:
-                        columns.add(tuple(path))
-                else:
-                    columns.add(tuple(path))
-        return columns
+            ]
+        return source_columns, target_columns
 
 
 class SubQueryLineageHolder(ColumnLineageMixin):
@@ -326,8 +377,48 @@ class StatementLineageHolder(SubQueryLineageHolder, ColumnLineageMixin):
     def of(cls, holder: SubQueryLineageHolder) -> "StatementLineageHolder":
         stmt_holder = cls()
         stmt_holder.go = holder.go
+        stmt_holder.compact()
         return stmt_holder
 
+    def compact(self) -> None:
+        """
+        detach parser specific query object from every SubQuery, whether as a vertex or as parent of a column.
+        Only raw text and alias are needed once extraction is done, this way parse tree can be garbage collected.
+        """
+        for vertex in self.go.retrieve_vertices_by_props():
+            for sq in (
+                vertex.parent_candidates if isinstance(vertex, Column) else [vertex]
+            ):
+                if isinstance(sq, SubQuery):
+                    sq.query = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        StatementLineageHolder is pickled in a graph operator agnostic form, so that it can be passed between
+        processes or persisted, and then restored using whichever graph operator is configured at that time.
+        """
+        return {
+            "vertices": self.go.retrieve_vertices_by_props(),
+            "tags": {
+                tag: self.go.retrieve_vertices_by_props(**{tag: True})
+                for tag in STATEMENT_NODE_TAGS
+            },
+            "edges": [
+                (e.source, e.target, e.label, e.attributes)
+                for label in STATEMENT_EDGE_TYPES
+                for e in self.go.retrieve_edges_by_label(label)
+            ],
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.go = get_graph_operator_class()()
+        for vertex in state["vertices"]:
+            self.go.add_vertex_if_not_exist(vertex)
+        for tag, vertices in state["tags"].items():
+            self.go.update_vertices(*vertices, **{tag: True})
+        for src, tgt, label, attributes in state["edges"]:
+            self.go.add_edge_if_not_exist(src, tgt, label, **attributes)
+
 
 class SQLLineageHolder(ColumnLineageMixin):
     def __init__(self, go: GraphOperator):
@@ -340,35 +431,56 @@ class SQLLineageHolder(ColumnLineageMixin):
         self._selfloop_tables = self.__retrieve_tag_tables(NodeTag.SELFLOOP)
         self._sourceonly_tables = self.__retrieve_tag_tables(NodeTag.SOURCE_ONLY)
         self._targetonly_tables = self.__retrieve_tag_tables(NodeTag.TARGET_ONLY)
+        # table lineage graph the summary is computed from, with source, target and intermediate tables by degree
+        self._table_summary_graph: GraphOperator | None = None
+        self._table_summary: tuple[
+            set[Table | Path], set[Table | Path], set[Table | Path]
+        ] = (set(), set(), set())
 
     @property
     def table_lineage_graph(self) -> GraphOperator:
         """
         The table level GraphOperator held by SQLLineageHolder
         """
-        table_nodes = [
-            v
-            for v in self.go.retrieve_vertices_by_props()
-            if isinstance(v, DATASET_CLASSES)
-        ]
-        return self.go.get_sub_graph(*table_nodes)
+        return self.go.get_sub_graph_by_types(*DATASET_CLASSES)
 
     @property
     def column_lineage_graph(self) -> GraphOperator:
         """
         The column level GraphOperator held by SQLLineageHolder
         """
-        column_nodes = [
-            v for v in self.go.retrieve_vertices_by_props() if isinstance(v, Column)
-        ]
-        return self.go.get_sub_graph(*column_nodes)
+        return self.go.get_sub_graph_by_types(Column)
+
+    def _get_table_summary(
+        self,
+    ) -> tuple[set[Table | Path], set[Table | Path], set[Table | Path]]:
+        """
+        source, target and intermediate tables of table lineage graph by degree, computed in one pass and kept as long
+        as the table lineage graph is not rebuilt.
+        """
+        table_graph = self.table_lineage_graph
+        if self._table_summary_graph is not table_graph:
+            source: set[Table | Path] = set()
+            target: set[Table | Path] = set()
+            intermediate: set[Table | Path] = set()
+            degrees = table_graph.retrieve_vertex_degrees()
+            for table, (in_degree, out_degree) in degrees.items():
+                if in_degree == 0 and out_degree > 0:
+                    source.add(table)
+                elif in_degree > 0 and out_degree == 0:
+                    target.add(table)
+                elif in_degree > 0 and out_degree > 0:
+                    intermediate.add(table)
+            self._table_summary_graph = table_graph
+            self._table_summary = (source, target, intermediate)
+        return self._table_summary
 
     @property
     def source_tables(self) -> set[Table | Path]:
         """
         a list of source :class:`sqllineage.core.models.Table`
         """
-        source_tables = set(self.table_lineage_graph.retrieve_source_vertices())
+        source_tables = set(self._get_table_summary()[0])
         source_tables |= self._selfloop_tables
         source_tables |= self._sourceonly_tables
         return source_tables
@@ -378,7 +490,7 @@ class SQLLineageHolder(ColumnLineageMixin):
         """
         a list of target :class:`sqllineage.core.models.Table`
         """
-        target_tables = set(self.table_lineage_graph.retrieve_target_vertices())
+        target_tables = set(self._get_table_summary()[1])
         target_tables |= self._selfloop_tables
         target_tables |= self._targetonly_tables
         return target_tables
@@ -388,26 +500,9 @@ class SQLLineageHolder(ColumnLineageMixin):
         """
         a list of intermediate :class:`sqllineage.core.models.Table`
         """
-        all_tables: list[Table | Path] = (
-            self.table_lineage_graph.retrieve_vertices_by_props()
+        intermediate_tables = self._get_table_summary()[2] - self.__retrieve_tag_tables(
+            NodeTag.SELFLOOP
         )
-        intermediate_tables = {
-            table
-            for table in all_tables
-            if len(
-                self.table_lineage_graph.retrieve_edges_by_vertex(
-                    table, EdgeDirection.IN
-                )
-            )
-            > 0
-            and len(
-                self.table_lineage_graph.retrieve_edges_by_vertex(
-                    table, EdgeDirection.OUT
-                )
-            )
-            > 0
-        }
-        intermediate_tables -= self.__retrieve_tag_tables(NodeTag.SELFLOOP)
         return intermediate_tables
 
     def __retrieve_tag_tables(self, tag) -> set[Path | Table]:
@@ -425,52 +520,60 @@ class SQLLineageHolder(ColumnLineageMixin):
         """
         ngo = get_graph_operator_class()()
         for holder in args:
-            ngo.merge(holder.go)
-            if holder.drop:
-                for table in holder.drop:
-                    if (
-                        len(ngo.retrieve_edges_by_vertex(table, EdgeDirection.IN)) == 0
-                        and len(ngo.retrieve_edges_by_vertex(table, EdgeDirection.OUT))
-                        == 0
-                    ):
-                        ngo.drop_vertices(table)
-            elif holder.rename:
-                for table_old, table_new in holder.rename:
-                    for edge in ngo.retrieve_edges_by_vertex(
-                        table_old, EdgeDirection.IN
-                    ):
-                        ngo.add_edge_if_not_exist(
-                            edge.source, table_new, edge.label, **edge.attributes
-                        )
-                    for edge in ngo.retrieve_edges_by_vertex(
-                        table_old, EdgeDirection.OUT
-                    ):
-                        ngo.add_edge_if_not_exist(
-                            table_new, edge.target, edge.label, **edge.attributes
-                        )
-                    ngo.drop_vertices(table_old)
-                    # remove possible self-loop edge created by rename
-                    ngo.drop_edge(table_new, table_new)
-                    if (
-                        len(ngo.retrieve_edges_by_vertex(table_new, EdgeDirection.IN))
-                        == 0
-                        and len(
-                            ngo.retrieve_edges_by_vertex(table_new, EdgeDirection.OUT)
-                        )
-                        == 0
-                    ):
-                        ngo.drop_vertices(table_new)
+            cls.merge_statement(ngo, holder)
+        return cls.build(metadata_provider, ngo)
+
+    @staticmethod
+    def merge_statement(ngo: GraphOperator, holder: StatementLineageHolder) -> None:
+        """
+        To merge a :class:`sqllineage.core.holders.StatementLineageHolder` into the combined graph in place,
+        following the order of statements. Call :meth:`build` to get the lineage result once all statements are merged.
+        """
+        ngo.merge(holder.go)
+        if holder.drop:
+            for table in holder.drop:
+                if (
+                    len(ngo.retrieve_edges_by_vertex(table, EdgeDirection.IN)) == 0
+                    and len(ngo.retrieve_edges_by_vertex(table, EdgeDirection.OUT)) == 0
+                ):
+                    ngo.drop_vertices(table)
+        elif holder.rename:
+            for table_old, table_new in holder.rename:
+                for edge in ngo.retrieve_edges_by_vertex(table_old, EdgeDirection.IN):
+                    ngo.add_edge_if_not_exist(
+                        edge.source, table_new, edge.label, **edge.attributes
+                    )
+                for edge in ngo.retrieve_edges_by_vertex(table_old, EdgeDirection.OUT):
+                    ngo.add_edge_if_not_exist(
+                        table_new, edge.target, edge.label, **edge.attributes
+                    )
+                ngo.drop_vertices(table_old)
+                # remove possible self-loop edge created by rename
+                ngo.drop_edge(table_new, table_new)
+                if (
+                    len(ngo.retrieve_edges_by_vertex(table_new, EdgeDirection.IN)) == 0
+                    and len(ngo.retrieve_edges_by_vertex(table_new, EdgeDirection.OUT))
+                    == 0
+                ):
+                    ngo.drop_vertices(table_new)
+        else:
+            read, write = holder.read, holder.write
+            if len(read) > 0 and len(write) == 0:
+                # source only table comes from SELECT statement
+                ngo.update_vertices(*read, **{NodeTag.SOURCE_ONLY: True})
+            elif len(read) == 0 and len(write) > 0:
+                # target only table comes from case like: 1) INSERT/UPDATE constant values; 2) CREATE TABLE
+                ngo.update_vertices(*write, **{NodeTag.TARGET_ONLY: True})
             else:
-                read, write = holder.read, holder.write
-                if len(read) > 0 and len(write) == 0:
-                    # source only table comes from SELECT statement
-                    ngo.update_vertices(*read, **{NodeTag.SOURCE_ONLY: True})
-                elif len(read) == 0 and len(write) > 0:
-                    # target only table comes from case like: 1) INSERT/UPDATE constant values; 2) CREATE TABLE
-                    ngo.update_vertices(*write, **{NodeTag.TARGET_ONLY: True})
-                else:
-                    for source, target in itertools.product(read, write):
-                        ngo.add_edge_if_not_exist(source, target, EdgeType.LINEAGE)
+                for source, target in itertools.product(read, write):
+                    ngo.add_edge_if_not_exist(source, target, EdgeType.LINEAGE)
+
+    @classmethod
+    def build(cls, metadata_provider, ngo: GraphOperator) -> "SQLLineageHolder":
+        """
+        To build :class:`sqllineage.core.holders.SQLLineageHolder` from the combined graph of statements, which is
+        modified in place.
+        """
         # selfloop table comes from cases like: INSERT INTO tbl (part='xx') SELECT * FROM tbl WHERE part = ''
         ngo.update_vertices(
             *ngo.retrieve_selfloop_vertices(), **{NodeTag.SELFLOOP: True}
@@ -481,7 +584,8 @@ class SQLLineageHolder(ColumnLineageMixin):
             for e in ngo.retrieve_edges_by_label(label=EdgeType.LINEAGE)
             if isinstance(e.source, Column) and len(e.source.parent_candidates) > 1
         ]
-        for unresolved_col, tgt_col in unresolved_column_lineages:
+        resolved_in_graph = []
+        for unresolved_col, _ in unresolved_column_lineages:
             # check if there's only one parent candidate contains the column with same name
             src_cols = []
             # check if source column exists in graph (either from subquery or from table created in prev statement)
@@ -496,16 +600,34 @@ class SQLLineageHolder(ColumnLineageMixin):
                 ]
                 if src_col_candidate in parent_columns:
                     src_cols.append(src_col_candidate)
-            # if not in graph, check if defined in table schema by metadata service
-            if len(src_cols) == 0 and bool(metadata_provider):
+            resolved_in_graph.append(src_cols)
+        # if not in graph, check if defined in table schema by metadata service, fetching all the tables in one go
+        metadata_tables = (
+            [
+                parent
+                for (unresolved_col, _), src_cols in zip(
+                    unresolved_column_lineages, resolved_in_graph
+                )
+                if len(src_cols) == 0
+                for parent in unresolved_col.parent_candidates
+                if isinstance(parent, Table) and str(parent.schema) != Schema.unknown
+            ]
+            if bool(metadata_provider)
+            else []
+        )
+        metadata_columns = (
+            metadata_provider.get_tables_columns(metadata_tables)
+            if metadata_tables
+            else {}
+        )
+        for (unresolved_col, tgt_col), src_cols in zip(
+            unresolved_column_lineages, resolved_in_graph
+        ):
+            if len(src_cols) == 0:
                 for parent in unresolved_col.parent_candidates:
-                    if (
-                        isinstance(parent, Table)
-                        and str(parent.schema) != Schema.unknown
-                    ):
-                        for parent_col in metadata_provider.get_table_columns(parent):
-                            if unresolved_col.raw_name == parent_col.raw_name:
-                                src_cols.append(parent_col)
+                    for parent_col in metadata_columns.get(parent, []):
+                        if unresolved_col.raw_name == parent_col.raw_name:
+                            src_cols.append(parent_col)
 
             # Multiple sources is a correct case for JOIN with USING
             # It incorrect for JOIN with ON, but sql without specifying an alias in this case will be invalid
@@ -0,0 +1,115 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqllineage.core.metadata_provider import MetaDataProvider
+from sqllineage.utils.entities import CacheInfo
+
+
+class CachingMetaDataProvider(MetaDataProvider):
+    """
+    A MetaDataProvider wrapping another one, caching the columns of each table in memory.
+
+    The cache is bounded in size with least recently used tables evicted first, and each entry expires after a TTL.
+    Tables not found, i.e. with no columns returned, are cached as well, with a separate TTL. Tables missing from the
+    cache are fetched from the wrapped provider in bulk.
+
+    The cache is thread safe, the same instance can be shared by LineageRunner across threads, so that a long-running
+    service doesn't query the metadata source for the same table again and again.
+    """
+
+    def __init__(
+        self,
+        provider: MetaDataProvider,
+        maxsize: int = 4096,
+        ttl: float | None = 3600,
+        negative_ttl: float | None = 300,
+    ):
+        """
+        :param provider: the MetaDataProvider to fetch metadata from upon cache miss
+        :param maxsize: max number of tables to cache
+        :param ttl: seconds before a cached table expires, None means never
+        :param negative_ttl: seconds before a cached table not found expires, None means never, 0 means not caching it
+        """
+        super().__init__()
+        self.provider = provider
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # (schema, table) to (columns, expiry time on monotonic clock), in least recently used order
+        self._cache: OrderedDict[tuple[str, str], tuple[tuple[str, ...], float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _get_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
+        return self._get_tables_columns([(schema, table)], **kwargs)[(schema, table)]
+
+    def _get_tables_columns(
+        self, tables: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], list[str]]:
+        result = {}
+        misses = []
+        with self._lock:
+            now = time.monotonic()
+            for key in tables:
+                if (entry := self._cache.get(key)) is not None and entry[1] > now:
+                    self._cache.move_to_end(key)
+                    result[key] = list(entry[0])
+                    self._hits += 1
+                else:
+                    misses.append(key)
+                    self._misses += 1
+        if misses:
+            # fetch outside the lock so that cache hits from other threads are not blocked by the metadata source
+            fetched = self.provider._get_tables_columns(misses, **kwargs)
+            with self._lock:
+                now = time.monotonic()
+                for key in misses:
+                    cols = result[key] = list(fetched.get(key, []))
+                    ttl = self.ttl if cols else self.negative_ttl
+                    if ttl is None or ttl > 0:
+                        self._cache[key] = (
+                            tuple(cols),
+                            now + ttl if ttl is not None else math.inf,
+                        )
+                        self._cache.move_to_end(key)
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _list_tables(self) -> list[tuple[str, str]]:
+        return self.provider._list_tables()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        statistics of the cache, in the same form as functools.lru_cache
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        clear the cache and its statistics
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        # lock can't be pickled either
+        state = super().__getstate__()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return bool(self.provider)
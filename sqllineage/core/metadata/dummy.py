@@ -16,5 +16,11 @@ class DummyMetaDataProvider(MetaDataProvider):
     def _get_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
         return self.metadata.get(f"{schema}.{table}", [])
 
+    def _list_tables(self) -> list[tuple[str, str]]:
+        return [
+            (schema, table)
+            for schema, table in (key.rsplit(".", 1) for key in self.metadata)
+        ]
+
     def __bool__(self):
         return len(self.metadata) > 0
@@ -0,0 +1,164 @@
+import os
+import pathlib
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+from sqllineage.core.metadata_provider import MetaDataProvider
+from sqllineage.exceptions import MetaDataProviderException
+
+SNAPSHOT_FORMAT_VERSION = "1"
+
+# memory map the whole snapshot file for read, up to 1GB
+MMAP_SIZE = 1 << 30
+
+
+class SnapshotMetaDataProvider(MetaDataProvider):
+    """
+    SnapshotMetaDataProvider reads metadata from a snapshot file dumped beforehand, without connecting to the catalog.
+
+    Snapshot is a SQLite database file, with columns clustered by schema and table name in a B-tree. The file is opened
+    read-only and memory-mapped upon first lookup, and each lookup is a B-tree search. Nothing is loaded into memory
+    upfront, no matter how large the catalog is.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: path of the snapshot file, as dumped by :meth:`SnapshotMetaDataProvider.dump`
+        """
+        super().__init__()
+        if not os.path.isfile(path):
+            raise MetaDataProviderException(f"Metadata snapshot {path} does not exist")
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def dump(
+        cls,
+        provider: MetaDataProvider,
+        path: str,
+        tables: Iterable[tuple[str, str]] | None = None,
+        batch_size: int = 500,
+    ) -> "SnapshotMetaDataProvider":
+        """
+        dump metadata from another MetaDataProvider into a snapshot file, overwriting the existing one.
+
+        :param provider: the MetaDataProvider to dump metadata from
+        :param path: path of the snapshot file
+        :param tables: (schema, table) pairs to dump, default to all the tables the provider can list
+        :param batch_size: number of tables to fetch from the provider at a time
+        :return: SnapshotMetaDataProvider reading from the dumped snapshot
+        """
+        tables = list(tables) if tables is not None else provider._list_tables()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # write to a temp file first then rename, so that readers never see a partial snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            with sqlite3.connect(tmp_path) as conn:
+                conn.execute("CREATE TABLE snapshot (key TEXT PRIMARY KEY, value TEXT)")
+                conn.execute(
+                    "INSERT INTO snapshot VALUES ('format_version', ?)",
+                    (SNAPSHOT_FORMAT_VERSION,),
+                )
+                conn.execute(
+                    "CREATE TABLE columns (schema_name TEXT NOT NULL, table_name TEXT NOT NULL, "
+                    "position INTEGER NOT NULL, column_name TEXT NOT NULL, "
+                    "PRIMARY KEY (schema_name, table_name, position)) WITHOUT ROWID"
+                )
+                for i in range(0, len(tables), batch_size):
+                    fetched = provider._get_tables_columns(tables[i : i + batch_size])
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO columns VALUES (?, ?, ?, ?)",
+                        (
+                            (schema, table, position, column)
+                            for (schema, table), columns in fetched.items()
+                            for position, column in enumerate(columns)
+                        ),
+                    )
+            conn.close()
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return cls(path)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            try:
+                conn = sqlite3.connect(
+                    pathlib.Path(self.path).absolute().as_uri() + "?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                )
+                conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+                (version,) = conn.execute(
+                    "SELECT value FROM snapshot WHERE key = 'format_version'"
+                ).fetchone()
+            except sqlite3.DatabaseError as e:
+                raise MetaDataProviderException(
+                    f"{self.path} is not a valid metadata snapshot"
+                ) from e
+            if version != SNAPSHOT_FORMAT_VERSION:
+                raise MetaDataProviderException(
+                    f"Metadata snapshot {self.path} is in format version {version}, "
+                    f"expecting {SNAPSHOT_FORMAT_VERSION}. Please dump it again"
+                )
+            self._conn = conn
+        return self._conn
+
+    def _get_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
+        return self._get_tables_columns([(schema, table)])[(schema, table)]
+
+    def _get_tables_columns(
+        self, tables: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], list[str]]:
+        # sqlite connection is shared across threads, but not meant to be used concurrently
+        with self._lock:
+            conn = self._connection()
+            return {
+                (schema, table): [
+                    column
+                    for (column,) in conn.execute(
+                        "SELECT column_name FROM columns WHERE schema_name = ? AND table_name = ? "
+                        "ORDER BY position",
+                        (schema, table),
+                    )
+                ]
+                for schema, table in tables
+            }
+
+    def list_tables(self) -> list[tuple[str, str]]:
+        """
+        list all the tables in the snapshot.
+
+        :return: (schema, table) pairs dumped into the snapshot
+        """
+        return self._list_tables()
+
+    def _list_tables(self) -> list[tuple[str, str]]:
+        with self._lock:
+            return (
+                self._connection()
+                .execute("SELECT DISTINCT schema_name, table_name FROM columns")
+                .fetchall()
+            )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # sqlite connection and lock can't be pickled, connection is opened again upon first lookup
+        state = super().__getstate__()
+        state["_conn"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        if (conn := getattr(self, "_conn", None)) is not None:
+            conn.close()
@@ -1,30 +1,56 @@
 import logging
 from typing import Any
 
-from sqlalchemy import MetaData, Table, create_engine
+from sqlalchemy import MetaData, Table, create_engine, inspect
 from sqlalchemy.engine import (
     make_url,
 )  # note: from sqlalchemy import make_url is only possible for v2.x
-from sqlalchemy.exc import NoSuchModuleError, NoSuchTableError, OperationalError
+from sqlalchemy.exc import (
+    NoSuchModuleError,
+    NoSuchTableError,
+    OperationalError,
+    ProgrammingError,
+)
 
 from sqllineage.core.metadata_provider import MetaDataProvider
 from sqllineage.exceptions import MetaDataProviderException
 
 logger = logging.getLogger(__name__)
 
+# errors reflecting tables, e.g. table not found, or schema not found which raises ProgrammingError for some databases
+REFLECTION_ERRORS = (NoSuchTableError, OperationalError, ProgrammingError)
+
 
 class SQLAlchemyMetaDataProvider(MetaDataProvider):
     """
     SQLAlchemyMetaDataProvider queries metadata from database using SQLAlchemy
+
+    Tables needed by a statement are reflected in bulk, one round-trip per schema with SQLAlchemy 2.x. Columns of each
+    table are kept once reflected, so only tables not found so far are reflected. With reflect_schema on, all the
+    tables of a schema are reflected the first time any table of it is needed. Tables not found are not kept, so that
+    a long-running service sees tables created afterward. Wrap the provider in
+    :class:`sqllineage.core.metadata.caching.CachingMetaDataProvider` with negative_ttl to cache them for a while.
     """
 
-    def __init__(self, url: str, engine_kwargs: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        url: str,
+        engine_kwargs: dict[str, Any] | None = None,
+        reflect_schema: bool = False,
+    ):
         """
         :param url: sqlalchemy url
         :param engine_kwargs: a dictionary of keyword arguments that will be passed to sqlalchemy create_engine
+        :param reflect_schema: reflect all the tables of a schema at once and keep them. This suits a large catalog
+                               where SQL to analyze refers to many tables in a few schemas.
         """
         super().__init__()
         self.metadata_obj = MetaData()
+        self.reflect_schema = reflect_schema
+        # schema to table columns, for schemas reflected at once
+        self._schema_columns: dict[str, dict[str, list[str]]] = {}
+        # (schema, table) to columns, for tables reflected in bulk
+        self._table_columns: dict[tuple[str, str], list[str]] = {}
         try:
             if engine_kwargs is None:
                 engine_kwargs = {}
@@ -45,13 +71,21 @@ class SQLAlchemyMetaDataProvider(MetaDataProvider):
             self.engine.dispose()
 
     def _get_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
+        if self.reflect_schema:
+            return self._get_tables_columns([(schema, table)])[(schema, table)]
+        if (columns := self._table_columns.get((schema, table))) is not None:
+            return columns
         columns = []
         try:
-            sqlalchemy_table = Table(
-                table, self.metadata_obj, schema=schema, autoload_with=self.engine
-            )
+            # table already reflected is kept by metadata_obj, no need to reflect again
+            if (
+                sqlalchemy_table := self.metadata_obj.tables.get(f"{schema}.{table}")
+            ) is None:
+                sqlalchemy_table = Table(
+                    table, self.metadata_obj, schema=schema, autoload_with=self.engine
+                )
             columns = [c.name for c in sqlalchemy_table.columns]
-        except (NoSuchTableError, OperationalError):
+        except REFLECTION_ERRORS:
             logger.warning(
                 "error listing columns for table %s.%s in %s, return empty list instead",
                 schema,
@@ -59,3 +93,108 @@ class SQLAlchemyMetaDataProvider(MetaDataProvider):
                 self.engine.url,
             )
         return columns
+
+    def _get_tables_columns(
+        self, tables: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], list[str]]:
+        tables_by_schema: dict[str, list[str]] = {}
+        for schema, table in tables:
+            tables_by_schema.setdefault(schema, []).append(table)
+        result = {}
+        for schema, names in tables_by_schema.items():
+            schema_columns = self._get_schema_tables_columns(schema, names)
+            for name in names:
+                if (columns := schema_columns.get(name)) is None:
+                    logger.warning(
+                        "error listing columns for table %s.%s in %s, return empty list instead",
+                        schema,
+                        name,
+                        self.engine.url,
+                    )
+                    columns = []
+                result[(schema, name)] = columns
+        return result
+
+    def _get_schema_tables_columns(
+        self, schema: str, names: list[str]
+    ) -> dict[str, list[str]]:
+        """
+        columns of given tables found in the schema, reflecting only tables not found before.
+        """
+        # schema just reflected as a whole is up to date, tables not in it are not reflected again
+        reflected_now = False
+        if self.reflect_schema and schema not in self._schema_columns:
+            # schema failed to reflect is not kept, it's reflected again next time
+            if (reflected := self._reflect_columns(schema)) is not None:
+                self._schema_columns[schema] = reflected
+                reflected_now = True
+        reflected_schema = self._schema_columns.get(schema, {})
+        schema_columns = {}
+        misses = []
+        for name in dict.fromkeys(names):
+            if (
+                columns := reflected_schema.get(
+                    name, self._table_columns.get((schema, name))
+                )
+            ) is not None:
+                schema_columns[name] = columns
+            elif (
+                sqlalchemy_table := self.metadata_obj.tables.get(f"{schema}.{name}")
+            ) is not None:
+                schema_columns[name] = [c.name for c in sqlalchemy_table.columns]
+            else:
+                misses.append(name)
+        if (
+            misses
+            and not reflected_now
+            and (reflected := self._reflect_columns(schema, misses)) is not None
+        ):
+            for name, columns in reflected.items():
+                self._table_columns[(schema, name)] = columns
+            schema_columns |= reflected
+        return {name: columns for name, columns in schema_columns.items() if columns}
+
+    def _list_tables(self) -> list[tuple[str, str]]:
+        inspector = inspect(self.engine)
+        return [
+            (schema, table)
+            for schema in inspector.get_schema_names()
+            for table in inspector.get_table_names(schema=schema)
+            + inspector.get_view_names(schema=schema)
+        ]
+
+    def _reflect_columns(
+        self, schema: str, names: list[str] | None = None
+    ) -> dict[str, list[str]] | None:
+        """
+        reflect columns of given tables in the schema, or all the tables and views in the schema when names is None.
+
+        :return: table name to columns for tables found, None if reflection fails
+        """
+        try:
+            inspector = inspect(self.engine)
+            if hasattr(inspector, "get_multi_columns"):
+                # SQLAlchemy 2.x reflects multiple tables in one round-trip
+                from sqlalchemy.engine.reflection import ObjectKind
+
+                return {
+                    table: [c["name"] for c in columns]
+                    for (_, table), columns in inspector.get_multi_columns(
+                        schema=schema, filter_names=names, kind=ObjectKind.ANY
+                    ).items()
+                }
+            if names is None:
+                names = inspector.get_table_names(
+                    schema=schema
+                ) + inspector.get_view_names(schema=schema)
+            result = {}
+            for name in names:
+                try:
+                    result[name] = [
+                        c["name"] for c in inspector.get_columns(name, schema=schema)
+                    ]
+                except NoSuchTableError:
+                    pass
+            return result
+        except REFLECTION_ERRORS:
+            return None
@@ -1,7 +1,15 @@
+import asyncio
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
 
 from sqllineage.core.models import Column, Table
 
+T = TypeVar("T")
+
 
 class MetaDataProvider(ABC):
     """
@@ -19,10 +27,33 @@ class MetaDataProvider(ABC):
     Only by literal analysis, we don't know which table is selected column c1 from.
     A subclass of MetaDataProvider implementing _get_table_columns passing to :class:`sqllineage.runner.LineageRunner`.
     can help parse column lineage correctly.
+
+    Columns of all the tables a statement refers to are prefetched in bulk before the statement is analyzed. Override
+    _get_tables_columns as well when the metadata source can serve multiple tables in one round-trip.
+
+    Session metadata and prefetched metadata are kept per thread, so that one provider can be shared by lineage
+    runners across threads.
     """
 
     def __init__(self) -> None:
-        self._session_metadata: dict[str, list[str]] = {}
+        self._local = threading.local()
+
+    @property
+    def _session_metadata(self) -> dict[str, list[str]]:
+        session_metadata: dict[str, list[str]] | None = getattr(
+            self._local, "session_metadata", None
+        )
+        if session_metadata is None:
+            session_metadata = self._local.session_metadata = {}
+        return session_metadata
+
+    @property
+    def _prefetched(self) -> dict[str, list[str]]:
+        return getattr(self._local, "prefetched", {})
+
+    @_prefetched.setter
+    def _prefetched(self, value: dict[str, list[str]]) -> None:
+        self._local.prefetched = value
 
     def get_table_columns(self, table: Table, **kwargs) -> list[Column]:
         """
@@ -30,8 +61,74 @@ class MetaDataProvider(ABC):
         """
         if (key := str(table)) in self._session_metadata:
             cols = self._session_metadata[key]
+        elif key in self._prefetched:
+            cols = self._prefetched[key]
         else:
             cols = self._get_table_columns(str(table.schema), table.raw_name, **kwargs)
+        return self._to_columns(table, cols)
+
+    def get_tables_columns(
+        self, tables: Iterable[Table], **kwargs
+    ) -> dict[Table, list[Column]]:
+        """
+        return columns of given tables, with tables not known yet fetched in one bulk call.
+        """
+        tables = list(dict.fromkeys(tables))
+        with self.prefetch(tables, **kwargs):
+            return {table: self.get_table_columns(table, **kwargs) for table in tables}
+
+    @contextmanager
+    def prefetch(self, tables: Iterable[Table], **kwargs) -> Iterator[None]:
+        """
+        fetch columns of given tables in one bulk call, get_table_columns is served from the result within the context.
+        """
+        previous = self._prefetched
+        if pending := self._pending(tables):
+            fetched = self._get_tables_columns(pending, **kwargs)
+            self._prefetched = previous | {
+                f"{schema}.{table}": cols for (schema, table), cols in fetched.items()
+            }
+        try:
+            yield
+        finally:
+            self._prefetched = previous
+
+    @abstractmethod
+    def _get_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
+        raise NotImplementedError
+
+    def _get_tables_columns(
+        self, tables: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], list[str]]:
+        """
+        columns of given (schema, table) pairs. By default, tables are fetched one by one.
+        """
+        return {
+            (schema, table): self._get_table_columns(schema, table, **kwargs)
+            for schema, table in tables
+        }
+
+    def _list_tables(self) -> list[tuple[str, str]]:
+        """
+        (schema, table) pairs of all the tables this provider knows of, e.g. to dump a metadata snapshot.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't support listing tables"
+        )
+
+    def _pending(self, tables: Iterable[Table]) -> list[tuple[str, str]]:
+        """
+        (schema, table) pairs of given tables that are neither session metadata nor prefetched already
+        """
+        pending = {}
+        for table in tables:
+            key = str(table)
+            if key not in self._session_metadata and key not in self._prefetched:
+                pending[key] = (str(table.schema), table.raw_name)
+        return list(pending.values())
+
+    @staticmethod
+    def _to_columns(table: Table, cols: list[str]) -> list[Column]:
         columns = []
         for col in cols:
             column = Column(col)
@@ -39,10 +136,6 @@ class MetaDataProvider(ABC):
             columns.append(column)
         return columns
 
-    @abstractmethod
-    def _get_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
-        raise NotImplementedError
-
     def register_session_metadata(self, table: Table, columns: list[Column]) -> None:
         """Register session-level metadata, like temporary table or view created."""
         self._session_metadata[str(table)] = [c.raw_name for c in columns]
@@ -54,6 +147,16 @@ class MetaDataProvider(ABC):
     def session(self):
         return MetaDataSession(self)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # thread local state can't be pickled, e.g. when the provider is sent to worker processes
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
     def __bool__(self):
         """
         bool value tells whether this provider is ready to provide metadata
@@ -61,6 +164,146 @@ class MetaDataProvider(ABC):
         return True
 
 
+class AsyncMetaDataProvider(MetaDataProvider):
+    """
+    Base class for metadata provider backed by an asyncio client, e.g. a data catalog service over HTTP.
+
+    A subclass implements _aget_table_columns coroutine instead. When columns of multiple tables are requested in bulk,
+    they're fetched concurrently with at most `concurrency` requests in flight.
+
+    Coroutines all run in one event loop owned by the provider, on a thread started upon first lookup, so that client
+    bound to event loop (e.g. aiohttp session, asyncpg pool) can be kept across lookups. Call :meth:`close`, or use
+    the provider as a context manager, to stop the event loop.
+    """
+
+    def __init__(self, concurrency: int = 16) -> None:
+        """
+        :param concurrency: max number of tables to fetch concurrently
+        """
+        super().__init__()
+        self.concurrency = concurrency
+        self._loop_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        # stops the event loop, called upon close or once provider is garbage collected
+        self._loop_finalizer: Callable[[], Any] | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """
+        stop the event loop, a new one is started if the provider is used again.
+        """
+        with self._loop_lock:
+            if self._loop_finalizer is not None:
+                self._loop_finalizer()
+            self._loop, self._loop_thread, self._loop_finalizer = None, None, None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            # loop thread is gone in forked process
+            if (
+                self._loop is None
+                or self._loop_thread is None
+                or not self._loop_thread.is_alive()
+            ):
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="sqllineage-metadata",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+                self._loop_finalizer = weakref.finalize(
+                    self, _stop_loop, self._loop, self._loop_thread
+                )
+            return self._loop
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        loop = self._get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError(
+                "Synchronous lookup can't be made from the event loop of the metadata provider, "
+                "await the async API instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # event loop and lock can't be pickled, event loop is started again upon first lookup
+        state = super().__getstate__()
+        for key in ("_loop_lock", "_loop", "_loop_thread", "_loop_finalizer"):
+            del state[key]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._loop_lock = threading.Lock()
+        self._loop, self._loop_thread, self._loop_finalizer = None, None, None
+
+    @abstractmethod
+    async def _aget_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
+        raise NotImplementedError
+
+    async def _aget_tables_columns(
+        self, tables: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], list[str]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(schema: str, table: str) -> list[str]:
+            async with semaphore:
+                return await self._aget_table_columns(schema, table, **kwargs)
+
+        results = await asyncio.gather(*(fetch(*t) for t in tables))
+        return dict(zip(tables, results))
+
+    async def aget_tables_columns(
+        self, tables: Iterable[Table], **kwargs
+    ) -> dict[Table, list[Column]]:
+        """
+        async counterpart of get_tables_columns, for caller already running in an event loop.
+        """
+        tables = list(dict.fromkeys(tables))
+        # fetch in the event loop of the provider, rather than the one of the caller
+        fetched = await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                self._aget_tables_columns(self._pending(tables), **kwargs),
+                self._get_loop(),
+            )
+        )
+        result = {}
+        for table in tables:
+            schema_table = (str(table.schema), table.raw_name)
+            if schema_table in fetched:
+                result[table] = self._to_columns(table, fetched[schema_table])
+            else:
+                result[table] = self.get_table_columns(table, **kwargs)
+        return result
+
+    def _get_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
+        return self._run(self._aget_table_columns(schema, table, **kwargs))
+
+    def _get_tables_columns(
+        self, tables: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], list[str]]:
+        return self._run(self._aget_tables_columns(tables, **kwargs))
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not threading.current_thread():
+        thread.join()
+        loop.close()
+
+
 class MetaDataSession:
     """
     Create an analyzer session which can register session-level metadata as a supplement to global metadata.
@@ -1,4 +1,6 @@
+import sys
 import warnings
+import weakref
 from typing import Any
 
 from sqllineage.config import SQLLineageConfig
@@ -9,20 +11,41 @@ from sqllineage.utils.helpers import escape_identifier_name
 class Schema:
     """
     Data Class for Schema
+
+    Schema is interned, all the schemas with the same name share one instance.
     """
 
+    __slots__ = ("raw_name", "__weakref__")
+
+    raw_name: str
     unknown = "<default>"
+    _interned: "weakref.WeakValueDictionary[str, Schema]" = (
+        weakref.WeakValueDictionary()
+    )
 
-    def __init__(self, name: str | None = None):
+    def __new__(cls, name: str | None = None) -> "Schema":
         """
         :param name: schema name
         """
         if name:
-            self.raw_name = escape_identifier_name(name)
+            raw_name = escape_identifier_name(name)
         elif SQLLineageConfig.DEFAULT_SCHEMA:
-            self.raw_name = escape_identifier_name(SQLLineageConfig.DEFAULT_SCHEMA)
+            raw_name = escape_identifier_name(SQLLineageConfig.DEFAULT_SCHEMA)
         else:
-            self.raw_name = escape_identifier_name(Schema.unknown)
+            raw_name = escape_identifier_name(Schema.unknown)
+        return cls._intern(raw_name)
+
+    @classmethod
+    def _intern(cls, raw_name: str) -> "Schema":
+        if (schema := cls._interned.get(raw_name)) is None:
+            schema = super().__new__(cls)
+            schema.raw_name = sys.intern(raw_name)
+            cls._interned[raw_name] = schema
+        return schema
+
+    def __reduce__(self):
+        # restore to the interned instance, name is escaped already
+        return Schema._intern, (self.raw_name,)
 
     def __str__(self):
         return self.raw_name
@@ -31,20 +54,27 @@ class Schema:
         return "Schema: " + str(self)
 
     def __eq__(self, other):
-        return isinstance(other, Schema) and str(self) == str(other)
+        return self is other or (
+            isinstance(other, Schema) and self.raw_name == other.raw_name
+        )
 
     def __hash__(self):
-        return hash(str(self))
+        return hash(self.raw_name)
 
     def __bool__(self):
-        return str(self) != self.unknown
+        return self.raw_name != self.unknown
 
 
 class Table:
     """
     Data Class for Table
+
+    Table with different alias can't share one instance. Instead, names are interned, and the cached hash is compared
+    before the full name when checking equality.
     """
 
+    __slots__ = ("schema", "raw_name", "alias", "_str_cache", "_hash_cache")
+
     def __init__(self, name: str, schema: Schema = Schema(), **kwargs):
         """
         :param name: table name
@@ -56,13 +86,17 @@ class Table:
             if len(schema_name.split(".")) > 2:
                 raise SQLLineageException("Invalid format for table name: %s.", name)
             self.schema = Schema(schema_name)
-            self.raw_name = escape_identifier_name(table_name)
+            self.raw_name = sys.intern(escape_identifier_name(table_name))
             if schema:
                 warnings.warn("Name is in schema.table format, schema param is ignored")
         else:
             self.schema = schema
-            self.raw_name = name if escaped else escape_identifier_name(name)
-        self.alias = escape_identifier_name(kwargs.pop("alias", self.raw_name))
+            self.raw_name = sys.intern(
+                name if escaped else escape_identifier_name(name)
+            )
+        self.alias = sys.intern(
+            escape_identifier_name(kwargs.pop("alias", self.raw_name))
+        )
         self._str_cache = f"{self.schema}.{self.raw_name}"
         self._hash_cache = hash(self._str_cache)
 
@@ -73,11 +107,26 @@ class Table:
         return "Table: " + str(self)
 
     def __eq__(self, other):
-        return isinstance(other, Table) and str(self) == str(other)
+        return self is other or (
+            isinstance(other, Table)
+            and self._hash_cache == other._hash_cache
+            and self._str_cache == other._str_cache
+        )
 
     def __hash__(self):
         return self._hash_cache
 
+    def __getstate__(self) -> dict[str, Any]:
+        return {"schema": self.schema, "raw_name": self.raw_name, "alias": self.alias}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.schema = state["schema"]
+        self.raw_name = sys.intern(state["raw_name"])
+        self.alias = sys.intern(state["alias"])
+        # str hash is randomized per interpreter, recompute it when unpickled in another process
+        self._str_cache = f"{self.schema}.{self.raw_name}"
+        self._hash_cache = hash(self._str_cache)
+
     @staticmethod
     def of(table: Any) -> "Table":
         raise NotImplementedError
@@ -88,11 +137,13 @@ class Path:
     Data Class for Path
     """
 
+    __slots__ = ("uri",)
+
     def __init__(self, uri: str):
         """
         :param uri: uri of the path
         """
-        self.uri = escape_identifier_name(uri)
+        self.uri = sys.intern(escape_identifier_name(uri))
 
     def __str__(self):
         return self.uri
@@ -101,7 +152,13 @@ class Path:
         return "Path: " + str(self)
 
     def __eq__(self, other):
-        return isinstance(other, Path) and self.uri == other.uri
+        return self is other or (isinstance(other, Path) and self.uri == other.uri)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"uri": self.uri}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.uri = sys.intern(state["uri"])
 
     def __hash__(self):
         return hash(self.uri)
@@ -112,6 +169,8 @@ class SubQuery:
     Data Class for SubQuery
     """
 
+    __slots__ = ("query", "query_raw", "alias")
+
     def __init__(self, subquery: Any, subquery_raw: str, alias: str | None):
         """
         :param subquery: subquery
@@ -137,6 +196,14 @@ class SubQuery:
     def __hash__(self):
         return hash(self.query_raw)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # parser specific query object is only needed during extraction, and it's not meant to be serialized
+        return {"query": None, "query_raw": self.query_raw, "alias": self.alias}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     @staticmethod
     def of(subquery: Any, alias: str | None) -> "SubQuery":
         raise NotImplementedError
@@ -145,19 +212,31 @@ class SubQuery:
 class Column:
     """
     Data Class for Column
+
+    Like Table, names are interned, and the cached hash is compared before the full name when checking equality.
     """
 
+    __slots__ = (
+        "_parent",
+        "raw_name",
+        "source_columns",
+        "from_alias",
+        "_str_cache",
+        "_hash_cache",
+    )
+
     def __init__(self, name: str, **kwargs):
         """
         :param name: column name
         :param parent: :class:`Table` or :class:`SubQuery`
         :param kwargs:
         """
-        self._parent: set[Path | Table | SubQuery] = set()
-        self.raw_name = (
+        # parent candidates, a tuple takes much less memory than a set for the few candidates a column has
+        self._parent: tuple[Path | Table | SubQuery, ...] = ()
+        self.raw_name = sys.intern(
             name if kwargs.pop("escaped", False) else escape_identifier_name(name)
         )
-        self.source_columns = [
+        self.source_columns = tuple(
             (
                 escape_identifier_name(raw_name),
                 escape_identifier_name(qualifier) if qualifier is not None else None,
@@ -165,7 +244,7 @@ class Column:
             for raw_name, qualifier in kwargs.pop(
                 "source_columns", ((self.raw_name, None),)
             )
-        ]
+        )
         self.from_alias = kwargs.pop("from_alias", False)
 
     def __str__(self):
@@ -185,8 +264,9 @@ class Column:
         return "Column: " + str(self)
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             isinstance(other, Column)
+            and hash(self) == hash(other)
             and str(self) == str(other)
             and self.parent == other.parent
         )
@@ -198,18 +278,31 @@ class Column:
             result = self._hash_cache = hash(str(self))
             return result
 
+    def __getstate__(self) -> dict[str, Any]:
+        # str hash is randomized per interpreter, leave out the cache so that it's recomputed when unpickled
+        return {
+            "_parent": self._parent,
+            "raw_name": self.raw_name,
+            "source_columns": self.source_columns,
+            "from_alias": self.from_alias,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for attr, value in state.items():
+            setattr(self, attr, value)
+        self.raw_name = sys.intern(self.raw_name)
+
     @property
     def parent(self) -> Path | Table | SubQuery | None:
-        if len(self._parent) == 1:
-            for p in self._parent:
-                return p
-        return None
+        return self._parent[0] if len(self._parent) == 1 else None
 
     @parent.setter
     def parent(self, value: Path | Table | SubQuery):
-        self._parent.add(value)
-        self.__dict__.pop("_str_cache", None)
-        self.__dict__.pop("_hash_cache", None)
+        if value not in self._parent:
+            self._parent += (value,)
+        for cache in ("_str_cache", "_hash_cache"):
+            if hasattr(self, cache):
+                delattr(self, cache)
 
     @property
     def parent_candidates(self) -> list[Path | Table | SubQuery]:
@@ -0,0 +1,89 @@
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqllineage.utils.constant import Phase
+
+
+class LineageObserver:
+    """
+    Observer of lineage analysis, which gets notified with wall time each time a phase is finished.
+
+    Phases of the whole SQL are split, merge and column_lineage. Phase analyze is for each statement, and it is further
+    broken down into parse and extract by sqlfluff analyzer. Statement result reused without analysis is not observed,
+    neither is statement analyzed in worker processes.
+
+    This base class does nothing, inherit it and override on_phase to collect metrics.
+    """
+
+    def on_phase(self, phase: str, elapsed: float, statement: str | None) -> None:
+        """
+        :param phase: phase name as defined in :class:`sqllineage.utils.constant.Phase`
+        :param elapsed: wall time in seconds
+        :param statement: the statement being analyzed, None for phases of the whole SQL
+        """
+
+    @contextmanager
+    def timed(self, phase: str, statement: str | None = None) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.on_phase(phase, time.perf_counter() - start, statement)
+
+
+class LineageProfiler(LineageObserver):
+    """
+    Observer recording wall time and count per phase and per statement, to find out the slowest statements.
+    """
+
+    def __init__(self) -> None:
+        self.phase_seconds: dict[str, float] = defaultdict(float)
+        self.phase_counts: dict[str, int] = defaultdict(int)
+        # statement to its wall time per phase
+        self.statement_seconds: dict[str, dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+
+    def __str__(self):
+        phases = "\n    ".join(
+            f"{phase}: {seconds:.3f}s ({self.phase_counts[phase]} times)"
+            for phase, seconds in self.phase_seconds.items()
+        )
+        slowest = ""
+        for i, (stmt, seconds) in enumerate(self.slowest_statements()):
+            stmt_short = stmt.replace("\n", "")
+            if len(stmt_short) > 50:
+                stmt_short = stmt_short[:50] + "..."
+            breakdown = "".join(
+                f" {phase}: {s:.3f}s"
+                for phase, s in self.statement_seconds[stmt].items()
+                if phase != Phase.ANALYZE
+            )
+            slowest += f"\n    #{i + 1} {seconds:.3f}s{breakdown} | {stmt_short}"
+        return f"""Phases:
+    {phases}
+Slowest Statements:{slowest}"""
+
+    def on_phase(self, phase: str, elapsed: float, statement: str | None) -> None:
+        self.phase_seconds[phase] += elapsed
+        self.phase_counts[phase] += 1
+        if statement is not None:
+            self.statement_seconds[statement][phase] += elapsed
+
+    def slowest_statements(self, n: int = 10) -> list[tuple[str, float]]:
+        """
+        a list of statement and its analyze time, sorted by analyze time in descending order.
+
+        :param n: number of statements to return
+        """
+        return sorted(
+            (
+                (stmt, phases[Phase.ANALYZE])
+                for stmt, phases in self.statement_seconds.items()
+                if Phase.ANALYZE in phases
+            ),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:n]
@@ -2,6 +2,7 @@ import warnings
 
 from sqlfluff.core import (
     FluffConfig,
+    Lexer,
     Linter,
     SQLLexError,
     SQLParseError,
@@ -10,21 +11,68 @@ from sqlfluff.core import (
 from sqlfluff.core.parser import BaseSegment
 
 from sqllineage.core.analyzer import LineageAnalyzer
+from sqllineage.core.budget import check_time_limit, interruptible
 from sqllineage.core.holders import StatementLineageHolder
 from sqllineage.core.metadata_provider import MetaDataProvider
+from sqllineage.core.models import Table
+from sqllineage.core.observer import LineageObserver
+from sqllineage.core.parser.sqlfluff.cache import ParseCache, fluff_config_cache
 from sqllineage.core.parser.sqlfluff.extractors.base import BaseExtractor
+from sqllineage.core.parser.sqlfluff.models import SqlFluffTable
 from sqllineage.exceptions import (
     InvalidSyntaxException,
     UnsupportedStatementException,
 )
+from sqllineage.utils.constant import Phase
 from sqllineage.utils.entities import AnalyzerContext
 
+# keywords of procedural language, in which semicolon doesn't necessarily terminate a statement
+PROCEDURAL_KEYWORDS = frozenset(
+    [
+        "BEGIN",
+        "DECLARE",
+        "DELIMITER",
+        "EXCEPTION",
+        "FUNCTION",
+        "LOOP",
+        "PACKAGE",
+        "PROCEDURE",
+        "TRIGGER",
+    ]
+)
+# keywords of control flow block, e.g. IF ... THEN ...; END IF; in BigQuery scripting. They're also used in expression
+# like IF() function or CASE expression, so only taken as block when starting a statement, or when following END
+BLOCK_KEYWORDS = frozenset(["CASE", "FOR", "IF", "LOOP", "REPEAT", "WHILE"])
+# markers of jinja template, with which SQL must be rendered before lexing
+JINJA_MARKERS = ("{{", "{%", "{#")
+
+
+class _SqlFluffDialects:
+    """
+    labels of all the sqlfluff dialects, read out upon first access as that imports every dialect module, whereas
+    analyzing SQL only needs the dialect in use
+    """
+
+    _labels: list[str] | None = None
+
+    def __get__(self, instance, owner) -> list[str]:
+        if self._labels is None:
+            self._labels = [dialect.label for dialect in dialect_readout()]
+        return self._labels
+
+
+def _normalize(sql: str) -> str:
+    """
+    normalize statement string so that it's insensitive to surrounding whitespaces and trailing semicolon
+    """
+    return sql.strip().rstrip(";").rstrip()
+
 
 class SqlFluffLineageAnalyzer(LineageAnalyzer):
     """SQL Statement Level Lineage Analyzer for `sqlfluff`"""
 
     PARSER_NAME = "sqlfluff"
-    SUPPORTED_DIALECTS = list(dialect.label for dialect in dialect_readout())
+    SUPPORTED_DIALECTS = _SqlFluffDialects()
 
     def __init__(
         self,
@@ -32,57 +80,208 @@ class SqlFluffLineageAnalyzer(LineageAnalyzer):
         file_path: str,
         dialect: str,
         silent_mode: bool = False,
+        sqlfluff_config: FluffConfig | None = None,
+        observer: LineageObserver | None = None,
     ):
+        """
+        :param sqlfluff_config: a pre-loaded sqlfluff config to reuse, file_path is not searched for config files
+                                when provided. Otherwise config is loaded from file_path via process-wide
+                                :class:`sqllineage.core.parser.sqlfluff.cache.FluffConfigCache`.
+        :param observer: observer to notify with wall time of parse and extract phase for each statement.
+        """
         super().__init__(sql)
-        self._sqlfluff_config = FluffConfig.from_path(
-            path=file_path, overrides={"dialect": dialect}
+        self._sqlfluff_config, self._linter = (
+            (sqlfluff_config, Linter(config=sqlfluff_config))
+            if sqlfluff_config is not None
+            else fluff_config_cache.get(file_path, {"dialect": dialect})
         )
         self._dialect = dialect
         self._silent_mode = silent_mode
-        self._segment_cache: dict[str, BaseSegment] = {}
+        self._observer = observer if observer is not None else LineageObserver()
+        # statement handles: segment of each statement by index if parsed when splitting, None once analyzed
+        self._stmt_segments: list[BaseSegment | None] = []
+        self._stmt_index: dict[str, int] = {}
+        # lineage result by statement index once analyzed without metadata, in which case it depends on SQL only.
+        # Statement analyzed again is answered from here, rather than parsed again from the released segment
+        self._stmt_holders: dict[int, StatementLineageHolder] = {}
+        self._parse_cache = ParseCache.from_config()
+        self._config_fingerprint = (
+            ParseCache.config_fingerprint(self._sqlfluff_config)
+            if self._parse_cache is not None
+            else ""
+        )
         self._stmts = self._split_and_cache()
+        for idx, stmt in enumerate(self._stmts):
+            self._stmt_index.setdefault(_normalize(stmt), idx)
+        if len(self._stmt_segments) != len(self._stmts):
+            self._stmt_segments = [None] * len(self._stmts)
 
     def _split_and_cache(self) -> list[str]:
         """Parse SQL once, split into statements, and cache segment per statement."""
         stripped = self._sql.strip()
         if not stripped:
             return []
+        if self._parse_cache is not None:
+            # with persistent parse cache, unchanged SQL doesn't need to be parsed for splitting.
+            # segment is then parsed on demand only for statement that misses the statement level cache
+            split_key = self._parse_cache.key(
+                "split",
+                self._dialect,
+                self._config_fingerprint,
+                stripped,
+                silent_mode=self._silent_mode,
+            )
+            if (stmts := self._parse_cache.get(split_key)) is None:
+                stmts = self._split(stripped)
+                self._parse_cache.set(split_key, stmts)
+            return stmts
+        return self._split(stripped)
+
+    def _split(self, stripped: str) -> list[str]:
+        # Append trailing semicolon to match sqlparse split behavior, which
+        # preserves the semicolon as part of the statement string.
+        if (raw_stmts := self._lexical_split(stripped)) is not None:
+            # statements are parsed on demand when analyzed
+            return [raw + ";" for raw in raw_stmts]
         # sqlfluff handles multi-statement SQL natively, including TSQL
         # without semicolons — no need for separate TSQL_NO_SEMICOLON path.
         segments = self._list_specific_statement_segment(stripped)
-        stmts = []
-        for segment in segments:
-            self._segment_cache[segment.raw] = segment
-            # Append trailing semicolon to match sqlparse split behavior, which
-            # preserves the semicolon as part of the statement string.
-            stmts.append(segment.raw + ";")
-        return stmts
+        self._stmt_segments = list(segments)
+        return [segment.raw + ";" for segment in segments]
+
+    def _lexical_split(self, sql: str) -> list[str] | None:
+        """
+        Split SQL into raw statements by semicolon using only the lexer, which takes linear time.
+
+        Parsing the whole script is avoided this way, but it only works when semicolon is guaranteed to be the
+        statement terminator. None is returned for the cases it doesn't apply: tsql where semicolon is optional,
+        SQL with procedural or control flow blocks where semicolon is used inside a statement, and templated SQL.
+        """
+        if (
+            self._dialect == "tsql"
+            or self._sqlfluff_config.get("templater") not in ("jinja", "raw")
+            or any(marker in sql for marker in JINJA_MARKERS)
+        ):
+            return None
+        tokens, errors = Lexer(config=self._sqlfluff_config).lex(sql)
+        if errors:
+            # let the parser report lexing error
+            return None
+        raw_stmts = []
+        # offset of current token, and the start/end offset of code tokens in current statement
+        offset, start, end = 0, None, 0
+        # previous code token, in upper case
+        previous = ""
+        for token in tokens:
+            token_start, offset = offset, offset + len(token.raw)
+            if not token.is_code:
+                continue
+            if token.raw_upper in PROCEDURAL_KEYWORDS:
+                return None
+            if token.raw_upper in BLOCK_KEYWORDS and (
+                start is None or previous == "END"
+            ):
+                return None
+            previous = token.raw_upper
+            if token.raw == ";":
+                if start is not None:
+                    raw_stmts.append(sql[start:end])
+                    start = None
+            else:
+                if start is None:
+                    start = token_start
+                end = offset
+        if start is not None:
+            raw_stmts.append(sql[start:end])
+        return raw_stmts
 
     @property
     def statements(self) -> list[str]:
         return self._stmts
 
+    @property
+    def statements_parsed(self) -> bool:
+        """
+        whether statements are already parsed when splitting, otherwise they're parsed on demand when analyzed.
+        """
+        return any(segment is not None for segment in self._stmt_segments)
+
     def analyze(
         self, sql: str, metadata_provider: MetaDataProvider
     ) -> StatementLineageHolder:
-        if (cache_key := sql.rstrip(";")) in self._segment_cache:
-            statement_segments = [self._segment_cache[cache_key]]
+        # lineage result depends on metadata when provider is ready, which is not covered by cache key
+        if self._parse_cache is not None and not metadata_provider:
+            stmt_key = self._parse_cache.key(
+                "statement",
+                self._dialect,
+                self._config_fingerprint,
+                _normalize(sql),
+                silent_mode=self._silent_mode,
+            )
+            if (holder := self._parse_cache.get(stmt_key)) is None:
+                holder = self._analyze(sql, metadata_provider)
+                # empty result is not cached so that silent mode warning for unsupported statement is kept
+                if holder.go.retrieve_vertices_by_props():
+                    self._parse_cache.set(stmt_key, holder)
+            return holder
+        return self._analyze(sql, metadata_provider)
+
+    def _analyze(
+        self, sql: str, metadata_provider: MetaDataProvider
+    ) -> StatementLineageHolder:
+        if (idx := self._stmt_index.get(_normalize(sql))) is not None:
+            if not metadata_provider and (stmt_holder := self._stmt_holders.get(idx)):
+                return stmt_holder
+            if (segment := self._stmt_segments[idx]) is None:
+                with self._observer.timed(Phase.PARSE, sql):
+                    segments = self._list_specific_statement_segment(self._stmts[idx])
+                if len(segments) > 1:
+                    # statements split by lexer are one per semicolon, the rest would be lost if not raised
+                    raise InvalidSyntaxException(
+                        f"Multiple statements are found without semicolon in between, "
+                        f"please terminate each statement with semicolon for SQL:\n{sql}"
+                    )
+                segment = segments[0] if segments else None
+            else:
+                # release the segment parsed when splitting, statement is parsed again if analyzed again with
+                # metadata provider ready, as lineage result depends on metadata then
+                self._stmt_segments[idx] = None
+            statement_segments = [segment] if segment is not None else []
         else:
-            statement_segments = self._list_specific_statement_segment(sql)
+            with self._observer.timed(Phase.PARSE, sql):
+                statement_segments = self._list_specific_statement_segment(sql)
         if len(statement_segments) == 0:
             raise UnsupportedStatementException(
                 f"SQLLineage cannot parse SQL:{sql}"
             )  # pragma: no cover
         else:
             statement_segment = statement_segments[0]
-            holder = BaseExtractor.try_extract(
-                self._sqlfluff_config.get("dialect"),
-                metadata_provider,
-                statement_segment,
-                AnalyzerContext(),
+            dialect = self._sqlfluff_config.get("dialect")
+            # fetch metadata of all the tables referred to in one go, instead of one table at a time during extraction
+            tables = (
+                _list_referenced_tables(statement_segment, dialect)
+                if metadata_provider
+                else []
             )
-            if holder is not None:
-                return StatementLineageHolder.of(holder)
+            # extraction is not interruptible as it may query metadata, don't start it once time is up
+            check_time_limit()
+            with (
+                self._observer.timed(Phase.EXTRACT, sql),
+                metadata_provider.prefetch(tables),
+            ):
+                holder = BaseExtractor.try_extract(
+                    dialect,
+                    metadata_provider,
+                    statement_segment,
+                    AnalyzerContext(),
+                )
+                stmt_holder = (
+                    StatementLineageHolder.of(holder) if holder is not None else None
+                )
+            if stmt_holder is not None:
+                if idx is not None and not metadata_provider:
+                    self._stmt_holders[idx] = stmt_holder
+                return stmt_holder
             else:
                 if self._silent_mode:
                     warnings.warn(
@@ -94,8 +293,10 @@ class SqlFluffLineageAnalyzer(LineageAnalyzer):
                         f"SQLLineage doesn't support analyzing statement type [{statement_segment.type}] for SQL:{sql}"
                     )
 
-    def _list_specific_statement_segment(self, sql: str):
-        parsed = Linter(config=self._sqlfluff_config).parse_string(sql)
+    def _list_specific_statement_segment(self, sql: str) -> list[BaseSegment]:
+        # parsing is where pathological SQL takes time, abort it once time limit is up
+        with interruptible():
+            parsed = self._linter.parse_string(sql)
         violations = [
             str(e)
             for e in parsed.violations
@@ -125,3 +326,19 @@ class SqlFluffLineageAnalyzer(LineageAnalyzer):
                     for statement in statements:
                         segments.append(statement.segments[0])
         return segments
+
+
+def _list_referenced_tables(segment: BaseSegment, dialect: str) -> list[Table]:
+    """
+    tables referred to anywhere in the statement, excluding references to CTE
+    """
+    cte_names = {
+        identifier.raw.lower()
+        for cte in segment.recursive_crawl("common_table_expression")
+        for identifier in cte.get_children("identifier")[:1]
+    }
+    return [
+        SqlFluffTable.of(reference, dialect=dialect)
+        for reference in segment.recursive_crawl("table_reference")
+        if len(reference.segments) > 1 or reference.raw.lower() not in cte_names
+    ]
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import sqlfluff
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.config import clear_config_caches
+
+from sqllineage import VERSION
+from sqllineage.config import SQLLineageConfig
+from sqllineage.utils.entities import CacheInfo
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """
+    Persistent on-disk cache for sqlfluff based lineage analysis, so that unchanged SQL won't be parsed again.
+
+    Each entry is pickled into a separate file under the cache directory, named after the hash of its key. Keys are
+    always salted with sqlfluff and sqllineage version, silent mode, as well as config items that affect the analysis
+    result.
+    Callers add :meth:`config_fingerprint` of the sqlfluff config to the key, so that changing templater or its
+    context variables doesn't hit entries analyzed with the old config. Entries from other versions are simply never
+    hit again. Clear the directory to reclaim disk space.
+
+    .. warning::
+         Entries are loaded using pickle, only point the cache directory to a location you trust.
+    """
+
+    def __init__(self, directory: str):
+        """
+        :param directory: cache directory, created if not exists
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls) -> "ParseCache | None":
+        """
+        return the cache configured by SQLLineageConfig.PARSE_CACHE_DIR, or None when it's not configured.
+        """
+        if directory := SQLLineageConfig.PARSE_CACHE_DIR:
+            return cls(directory)
+        return None
+
+    @staticmethod
+    def key(*parts: str, silent_mode: bool = False) -> str:
+        salts = (
+            sqlfluff.__version__,
+            VERSION,
+            str(silent_mode),
+            SQLLineageConfig.DEFAULT_SCHEMA,
+            str(SQLLineageConfig.LATERAL_COLUMN_ALIAS_REFERENCE),
+        )
+        return hashlib.sha256("\0".join(salts + parts).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def config_fingerprint(config: FluffConfig) -> str:
+        """
+        fingerprint of the effective sqlfluff config affecting how SQL is rendered and parsed: the core section and
+        the templater section, including context variables for jinja.
+        """
+        core = {
+            k: v
+            for k, v in config.get_section("core").items()
+            if k not in FluffConfig.private_vals
+        }
+        return hashlib.sha256(
+            json.dumps(
+                [core, config.get_section("templater")], sort_keys=True, default=str
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # corrupted or incompatible entry, treat as cache miss and let it be overwritten
+            logger.warning("failed to load parse cache entry %s, ignored", path)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        tmp_path = None
+        try:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # write to a temp file first then rename, so that concurrent readers never see a partial entry
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                # don't leave the temp file behind, whether pickling or renaming fails
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except OSError:
+            logger.warning("failed to write parse cache entry %s, ignored", path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key[2:] + ".pickle")
+
+
+# config files sqlfluff loads from each directory
+SQLFLUFF_CONFIG_FILES = (
+    "setup.cfg",
+    "tox.ini",
+    "pep8.ini",
+    ".sqlfluff",
+    "pyproject.toml",
+)
+
+
+def _mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class FluffConfigCache:
+    """
+    Process-wide in-memory cache of sqlfluff config and linter, so that analyzing many SQL files from the same
+    directory doesn't search for config files and load the dialect again and again.
+
+    Entries are keyed by config directory, current working directory (sqlfluff loads config files from directories in
+    between), and config overrides like dialect. Existence and modification time of config files that could be loaded
+    is checked upon each lookup. Entry is reloaded once any of them changes, e.g. a .sqlfluff file is edited or
+    created, while other files created in these directories don't matter. Least recently used entries are evicted
+    when it's full.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        :param maxsize: max number of configs to cache
+        """
+        self.maxsize = maxsize
+        # key to (config, linter, modification time of each path checked for change), in least recently used order
+        self._cache: OrderedDict[
+            tuple[str, str, tuple[tuple[str, Any], ...]],
+            tuple[FluffConfig, Linter, tuple[tuple[str, int | None], ...]],
+        ] = OrderedDict()
+        # modification time of config files when last loaded, None for file not exists
+        self._loaded_mtimes: dict[str, int | None] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, path: str, overrides: dict[str, Any]) -> tuple[FluffConfig, Linter]:
+        """
+        get sqlfluff config loaded from path, as well as a linter with this config.
+
+        :param path: path of SQL file or directory to search for config files
+        :param overrides: config overrides, e.g. {"dialect": "ansi"}
+        """
+        path = os.path.abspath(path)
+        directory = path if os.path.isdir(path) else os.path.dirname(path)
+        key = (directory, os.getcwd(), tuple(sorted(overrides.items())))
+        # take modification time before loading, so that change made during loading is picked up next time
+        mtimes = self._mtimes(directory)
+        with self._lock:
+            if (entry := self._cache.get(key)) is not None and entry[2] == mtimes:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return entry[0], entry[1]
+            changed = any(self._loaded_mtimes.get(p, m) != m for p, m in mtimes)
+            self._loaded_mtimes.update(mtimes)
+        if changed:
+            # config files are cached by sqlfluff as well, which never expires. Only clear it when a config file
+            # loaded before is changed, in which case it's stale for everyone in this process
+            clear_config_caches()
+        config = FluffConfig.from_path(path=directory, overrides=overrides)
+        linter = Linter(config=config)
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = (config, linter, mtimes)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return config, linter
+
+    @staticmethod
+    def _mtimes(directory: str) -> tuple[tuple[str, int | None], ...]:
+        """
+        modification time of config files that could be loaded for the directory, None for file not exists. Config
+        files are searched from user config directories, and from the directory up to the root.
+        """
+        home = os.path.expanduser("~")
+        directories = [home, os.path.join(home, ".config", "sqlfluff")]
+        while True:
+            directories.append(directory)
+            if (parent := os.path.dirname(directory)) == directory:
+                break
+            directory = parent
+        return tuple(
+            (p, _mtime(p))
+            for d in directories
+            for p in (os.path.join(d, filename) for filename in SQLFLUFF_CONFIG_FILES)
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """
+        statistics of the cache, in the same form as functools.lru_cache
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        clear the cache and its statistics
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+fluff_config_cache = FluffConfigCache()
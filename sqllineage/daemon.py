@@ -0,0 +1,174 @@
+"""
+Lineage daemon keeps a long-lived process with sqllineage imported and sqlfluff dialects loaded, serving requests
+forwarded by command line over a Unix domain socket. Editor integrations and pre-commit hooks calling sqllineage
+frequently then don't pay for interpreter startup, imports and dialect loading upon each call.
+
+Requests are handled one at a time, in the working directory and with the SQLLineageConfig of the calling command
+line, so that output is exactly the same as analyzing locally. Requests from a command line of another sqllineage
+version are declined, and the command line falls back to analyzing locally.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import logging.config
+import os
+import socket
+import socketserver
+import sys
+import traceback
+import warnings
+from argparse import Namespace
+from typing import Any
+
+from sqllineage import DEFAULT_LOGGING, VERSION
+from sqllineage.config import SQLLineageConfig
+from sqllineage.exceptions import SQLLineageException
+
+# seconds to wait for the daemon to accept the connection
+CONNECT_TIMEOUT = 1.0
+# seconds to wait for the daemon to respond, on top of --timeout if given
+RESPONSE_TIMEOUT = 60.0
+
+
+def _encode(obj: dict[str, Any]) -> bytes:
+    return json.dumps(obj).encode("utf-8") + b"\n"
+
+
+def _connect(socket_path: str) -> socket.socket | None:
+    """
+    :return: socket connected to the daemon, None if daemon isn't running
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward(socket_path: str, args: Namespace) -> dict[str, Any] | None:
+    """
+    forward parsed command line arguments to the daemon listening on socket_path.
+
+    :return: exit code, stdout and stderr of analyzing in the daemon, None if daemon isn't running, doesn't respond
+        in time or of another sqllineage version
+    """
+    if not hasattr(socket, "AF_UNIX") or (sock := _connect(socket_path)) is None:
+        return None
+    # thread-level config doesn't propagate to daemon, pass on the config of the calling thread
+    config = {key: getattr(SQLLineageConfig, key) for key in SQLLineageConfig.config}
+    # a hung daemon, or one busy with other requests, shouldn't block command line forever
+    sock.settimeout(RESPONSE_TIMEOUT + (getattr(args, "timeout", None) or 0))
+    with sock, sock.makefile("rb") as f:
+        try:
+            sock.sendall(
+                _encode(
+                    {
+                        "version": VERSION,
+                        "args": vars(args),
+                        "cwd": os.getcwd(),
+                        "config": config,
+                    }
+                )
+            )
+            response = f.readline()
+        except OSError:
+            # socket.timeout is a subclass of OSError, analyze locally as if daemon isn't running
+            return None
+    # daemon is gone halfway if there's no response
+    if not response:
+        return None
+    result: dict[str, Any] = json.loads(response)
+    return result if result.get("version") == VERSION else None
+
+
+def _analyze(args: dict[str, Any], cwd: str, config: dict[str, Any]) -> dict[str, Any]:
+    # this is to avoid circular import
+    from sqllineage.cli import analyze
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    code = 0
+    previous_cwd = os.getcwd()
+    try:
+        os.chdir(cwd)
+        with (
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+            # show warnings upon each request, rather than only once in the lifetime of daemon
+            warnings.catch_warnings(),
+            SQLLineageConfig(**config),
+        ):
+            # logging handler writes to sys.stderr at the time of configuration, which is now redirected
+            logging.config.dictConfig(DEFAULT_LOGGING)
+            try:
+                analyze(Namespace(**args))
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    code = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    code = 1
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        os.chdir(previous_cwd)
+        logging.config.dictConfig(DEFAULT_LOGGING)
+    return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+class _LineageRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            # client disconnects before sending the request
+            return
+        request = json.loads(line)
+        if request.get("version") != VERSION:
+            # arguments and config of another version may not be understood, let client analyze locally
+            response = {"version": VERSION}
+        else:
+            response = {
+                "version": VERSION,
+                **_analyze(request["args"], request["cwd"], request["config"]),
+            }
+        self.wfile.write(_encode(response))
+
+
+def serve(socket_path: str, dialect: str) -> None:
+    """
+    run lineage daemon listening on socket_path until interrupted.
+
+    :param socket_path: path of the Unix domain socket, only accessible to the current user
+    :param dialect: dialect to warm up upon startup, other dialects are loaded upon first request
+    """
+    from sqllineage.runner import LineageRunner
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise SQLLineageException(
+            "Lineage daemon requires Unix domain socket, which is not supported on this platform"
+        )
+    if os.path.exists(socket_path):
+        if (sock := _connect(socket_path)) is not None:
+            sock.close()
+            raise SQLLineageException(
+                f"Lineage daemon is already running on {socket_path}"
+            )
+        # left behind by a daemon not exited cleanly
+        os.remove(socket_path)
+    LineageRunner("SELECT 1", dialect=dialect).get_column_lineage()
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(socket_path, _LineageRequestHandler)
+    finally:
+        os.umask(umask)
+    try:
+        with server:
+            print(f" * SQLLineage daemon listening on {socket_path}")
+            server.serve_forever()
+    finally:
+        os.remove(socket_path)
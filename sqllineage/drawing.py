@@ -1,38 +1,110 @@
 """
 app is a wsgi application which accepts environ and start_response as argument.
 Here We implement a simple flask-like api to avoid explicitly add it as dependency.
-wsgiref is used to spawn a server from sqllineage commandline. To serve production traffic, you can/should put
-the app behind a real production server like gunicorn or uwsgi, as app is wsgi compatible.
-A simple gunicorn example: gunicorn sqllineage.drawing:app
+wsgiref is used to spawn a server from sqllineage commandline, handling requests by a pool of worker threads.
+To serve production traffic, you can also put the app behind a real production server like gunicorn or uwsgi, as app
+is wsgi compatible. A simple gunicorn example: gunicorn sqllineage.drawing:app
 """
 
+import hashlib
 import json
 import logging
 import mimetypes
 import os
+import socket
+import threading
 from argparse import Namespace
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlencode
-from wsgiref.simple_server import make_server
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
 
-from sqllineage import DEFAULT_DIALECT, DEFAULT_HOST, DEFAULT_PORT, STATIC_FOLDER
+from sqllineage import (
+    DEFAULT_DIALECT,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    STATIC_FOLDER,
+    VERSION,
+)
 from sqllineage.config import SQLLineageConfig
 from sqllineage.core.metadata.dummy import DummyMetaDataProvider
 from sqllineage.exceptions import SQLLineageException
 from sqllineage.utils.constant import LineageLevel
+from sqllineage.utils.entities import CacheInfo
 from sqllineage.utils.helpers import extract_sql_from_args
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WORKERS = 8
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_REQUEST_TIMEOUT = 30.0
+DEFAULT_ANALYSIS_TIMEOUT = 30.0
+
+
+class ResponseCache:
+    """
+    Thread safe LRU cache of lineage response, keyed by hash of SQL and dialect.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        :param maxsize: max number of responses to cache
+        """
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(sql: str, dialect: str) -> tuple[str, str]:
+        return hashlib.sha256(sql.encode("utf-8")).hexdigest(), dialect
+
+    def get(self, key: tuple[str, str]) -> dict[str, Any] | None:
+        with self._lock:
+            if (response := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+            return response
+
+    def set(self, key: tuple[str, str], response: dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        statistics of the cache, in the same form as functools.lru_cache
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        clear the cache and its statistics
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
 
 class SQLLineageApp:
     def __init__(self) -> None:
         self.routes: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {}
         self.root_path = Path(SQLLineageConfig.DIRECTORY)
         self.metadata_provider = DummyMetaDataProvider()
+        self.response_cache = ResponseCache()
+        # seconds to analyze lineage for each request, None means no limit
+        self.timeout: float | None = None
 
     def route(self, path: str):
         def wrapper(handler):
@@ -47,6 +119,8 @@ class SQLLineageApp:
         path_info = environ["PATH_INFO"]
         try:
             if request_method == "GET":
+                if path_info == "/health":
+                    return self.handle_200_json(start_response, self.health())
                 mimetype = "text/html; charset=utf-8"
                 if path_info == "/":
                     index_path = static_folder.joinpath(Path("index.html"))
@@ -112,6 +186,13 @@ class SQLLineageApp:
         except (SQLLineageException, RuntimeError) as e:
             return self.handle_400(start_response, str(e))
 
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "version": VERSION,
+            "response_cache": self.response_cache.cache_info()._asdict(),
+        }
+
     @staticmethod
     def handle_200_text(start_response, mimetype, text) -> list[bytes]:
         status_code = HTTPStatus.OK
@@ -176,14 +257,25 @@ def lineage(payload):
     req_args = Namespace(**payload)
     sql = extract_sql_from_args(req_args)
     dialect = getattr(req_args, "dialect", DEFAULT_DIALECT)
+    # lineage result depends on metadata when provider is ready, which is not covered by cache key
+    key = ResponseCache.key(sql, dialect) if not app.metadata_provider else None
+    if key is not None and (data := app.response_cache.get(key)) is not None:
+        return data
     lr = LineageRunner(
-        sql, dialect=dialect, verbose=True, metadata_provider=app.metadata_provider
+        sql,
+        dialect=dialect,
+        verbose=True,
+        metadata_provider=app.metadata_provider,
+        timeout=app.timeout,
     )
     data = {
         "verbose": str(lr),
         "dag": lr.to_cytoscape(),
         "column": lr.to_cytoscape(LineageLevel.COLUMN),
     }
+    # result with statements timed out is partial, analyze again next time
+    if key is not None and not lr.timed_out_statements():
+        app.response_cache.set(key, data)
     return data
 
 
@@ -214,17 +306,94 @@ def directory(payload):
     return data
 
 
+class ThreadPoolWSGIServer(WSGIServer):
+    """
+    WSGIServer handling requests by a pool of worker threads, so that a slow request doesn't block the others.
+
+    Requests more than the workers can handle wait in a bounded queue, and are rejected with 503 once the queue is
+    full. Each connection times out if the client doesn't send the request or receive the response in time. Socket
+    timeout doesn't bound time spent handling the request, which is up to the app, see SQLLineageApp.timeout.
+    """
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        RequestHandlerClass: type[WSGIRequestHandler],
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        request_timeout: float | None = DEFAULT_REQUEST_TIMEOUT,
+    ):
+        """
+        :param workers: number of worker threads
+        :param queue_size: max number of requests waiting for a worker
+        :param request_timeout: seconds of socket timeout for each connection, None means never
+        """
+        super().__init__(server_address, RequestHandlerClass)
+        self.request_timeout = request_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="sqllineage"
+        )
+        # requests being handled or waiting in queue
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+
+    def get_request(self) -> tuple[socket.socket, Any]:
+        request, client_address = super().get_request()
+        request.settimeout(self.request_timeout)
+        return request, client_address
+
+    def process_request(self, request, client_address) -> None:
+        if not self._slots.acquire(blocking=False):
+            self._reject(request)
+            return
+        self._executor.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def _reject(self, request: socket.socket) -> None:
+        status_code = HTTPStatus.SERVICE_UNAVAILABLE
+        body = json.dumps({"message": "Server Busy, Please Retry Later"}).encode()
+        try:
+            request.sendall(
+                f"HTTP/1.0 {status_code.value} {status_code.phrase}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                f"Retry-After: 1\r\n\r\n".encode() + body
+            )
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 def draw_lineage_graph(**kwargs) -> None:
     host = kwargs.pop("host", DEFAULT_HOST)
     port = kwargs.pop("port", DEFAULT_PORT)
+    workers = kwargs.pop("workers", DEFAULT_WORKERS)
+    queue_size = kwargs.pop("queue_size", DEFAULT_QUEUE_SIZE)
+    request_timeout = kwargs.pop("request_timeout", DEFAULT_REQUEST_TIMEOUT)
+    analysis_timeout = kwargs.pop("analysis_timeout", DEFAULT_ANALYSIS_TIMEOUT)
     querystring = urlencode({k: v for k, v in kwargs.items() if v})
     path = f"/?{querystring}" if querystring else "/"
     if f := kwargs.get("f"):
         app.root_path = Path(f).parent
     if metadata_provider := kwargs.get("metadata_provider"):
         app.metadata_provider = metadata_provider
+    app.timeout = analysis_timeout
     try:
-        with make_server(host, port, app) as httpd:
+        with ThreadPoolWSGIServer(
+            (host, port), WSGIRequestHandler, workers, queue_size, request_timeout
+        ) as httpd:
+            httpd.set_app(app)
             print(f" * SQLLineage Running on http://{host}:{port}{path}")
             httpd.serve_forever()
     except OSError as e:
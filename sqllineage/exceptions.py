@@ -16,3 +16,7 @@ class MetaDataProviderException(SQLLineageException):
 
 class ConfigException(SQLLineageException):
     """Raised for configuration errors"""
+
+
+class AnalysisTimeoutException(SQLLineageException):
+    """Raised when lineage analysis runs out of time budget"""
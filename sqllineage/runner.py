@@ -1,21 +1,41 @@
+import contextlib
+import itertools
 import logging
+import os
 import warnings
 from collections import OrderedDict
-from typing import Any
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
 
 from sqllineage import DEFAULT_DIALECT, SQLPARSE_DIALECT
-from sqllineage.core.holders import SQLLineageHolder
+from sqllineage.config import SQLLineageConfig
+from sqllineage.core.analyzer import LineageAnalyzer
+from sqllineage.core.budget import TimeBudget
+from sqllineage.core.graph import get_graph_operator_class
+from sqllineage.core.holders import SQLLineageHolder, StatementLineageHolder
 from sqllineage.core.metadata.dummy import DummyMetaDataProvider
-from sqllineage.core.metadata_provider import MetaDataProvider
+from sqllineage.core.metadata_provider import MetaDataProvider, MetaDataSession
 from sqllineage.core.models import Column, Table
-from sqllineage.core.parser.sqlfluff.analyzer import SqlFluffLineageAnalyzer
-from sqllineage.core.parser.sqlparse.analyzer import SqlParseLineageAnalyzer
+from sqllineage.core.observer import LineageObserver
 from sqllineage.drawing import draw_lineage_graph
+from sqllineage.exceptions import AnalysisTimeoutException
 from sqllineage.io import to_cytoscape
-from sqllineage.utils.constant import LineageLevel
+from sqllineage.utils.constant import LineageLevel, Phase
+
+if TYPE_CHECKING:
+    from sqlfluff.core import FluffConfig
+
+    from sqllineage.core.parser.sqlfluff.analyzer import SqlFluffLineageAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# statement to a list of (session metadata dependencies, lineage result) for statement level result reuse
+StatementHolderCache = dict[
+    str,
+    list[tuple[tuple[tuple[str, tuple[str, ...] | None], ...], StatementLineageHolder]],
+]
+
 
 def lazy_method(func):
     def wrapper(*args, **kwargs):
@@ -41,6 +61,10 @@ class LineageRunner:
         silent_mode: bool = False,
         draw_options: dict[str, Any] | None = None,
         file_path: str = ".",
+        workers: int = 1,
+        observer: LineageObserver | None = None,
+        timeout: float | None = None,
+        statement_timeout: float | None = None,
     ):
         """
         The entry point of SQLLineage after command line options are parsed.
@@ -51,6 +75,20 @@ class LineageRunner:
         :param verbose: verbose flag indicating whether statement-wise lineage result will be shown
         :param silent_mode: boolean flag indicating whether to skip lineage analysis for unknown statement types
         :param file_path: path of the SQL file.
+        :param workers: number of worker processes to parse and analyze statements in parallel. This only applies
+                        to sqlfluff dialects when no metadata provider is ready, as statements are then independent of
+                        each other. Lineage result is still combined sequentially following statement order.
+        :param observer: observer to notify with wall time of each phase, use
+                         :class:`sqllineage.core.observer.LineageProfiler` to find out the slowest statements.
+        :param timeout: seconds to analyze the whole SQL, counting from evaluation till column lineage paths are
+                        enumerated. Statements left unanalyzed once time is up are skipped as timed out, see
+                        :meth:`timed_out_statements`. AnalysisTimeoutException is raised if time is up before SQL is
+                        split into statements, or before column lineage paths are enumerated.
+        :param statement_timeout: seconds to parse and analyze each statement, statement running out of time is
+                                  skipped as timed out and analysis carries on with the rest, like silent_mode.
+                                  Statements are analyzed in the current process when either timeout is set.
+                                  Parsing is aborted once time is up, while the other phases check time in between,
+                                  so a statement may overrun by the time of one phase.
         """
         if dialect == SQLPARSE_DIALECT:
             warnings.warn(
@@ -68,6 +106,15 @@ class LineageRunner:
         self._dialect = dialect
         self._metadata_provider = metadata_provider
         self._silent_mode = silent_mode
+        self._workers = workers
+        self._observer = observer if observer is not None else LineageObserver()
+        self._timeout = timeout
+        self._statement_timeout = statement_timeout
+        # time budget of the run, starting upon evaluation
+        self._budget = TimeBudget()
+        # statement holders reused by incremental re-analysis
+        self._stmt_holder_cache: StatementHolderCache = {}
+        self._previous_stmt_holder_cache: StatementHolderCache = {}
 
     @lazy_method
     def __str__(self):
@@ -89,6 +136,9 @@ Target Tables:
             )
             combined += f"""Intermediate Tables:
     {intermediate_tables}"""
+        if self._budget.timed_out:
+            combined += f"""Timed Out Statements(#): {len(self._budget.timed_out)}
+"""
         if self._verbose:
             result = ""
             for i, holder in enumerate(self._stmt_holders):
@@ -131,6 +181,13 @@ Target Tables:
         """
         return self._stmt
 
+    @lazy_method
+    def timed_out_statements(self) -> list[str]:
+        """
+        a list of SQL statements skipped for running out of time budget.
+        """
+        return self._budget.timed_out
+
     @lazy_property
     def source_tables(self) -> list[Table]:
         """
@@ -154,18 +211,33 @@ Target Tables:
 
     @lazy_method
     def get_column_lineage(
-        self, exclude_path_ending_in_subquery=True, exclude_subquery_columns=False
+        self,
+        exclude_path_ending_in_subquery=True,
+        exclude_subquery_columns=False,
+        endpoints_only=False,
     ) -> list[tuple[Column, Column]]:
         """
         a list of column tuple :class:`sqllineage.models.Column`
+
+        :param endpoints_only: only return (source column, target column) pairs, without enumerating every lineage
+                               path in between, which is much faster for wide tables in long pipelines.
         """
         # sort by target column, and then source column
-        return sorted(
-            self._sql_holder.get_column_lineage(
-                exclude_path_ending_in_subquery, exclude_subquery_columns
+        with (
+            self._observer.timed(Phase.COLUMN_LINEAGE),
+            # what's left of the time budget after evaluation, checked between paths rather than interrupting
+            self._budget.run(
+                "SQLLineage ran out of time budget enumerating column lineage paths"
             ),
-            key=lambda x: (str(x[-1]), str(x[0])),
-        )
+        ):
+            return sorted(
+                self._sql_holder.get_column_lineage(
+                    exclude_path_ending_in_subquery,
+                    exclude_subquery_columns,
+                    endpoints_only,
+                ),
+                key=lambda x: (str(x[-1]), str(x[0])),
+            )
 
     def print_column_lineage(self) -> None:
         """
@@ -181,37 +253,157 @@ Target Tables:
         print(str(self))
 
     def _eval(self):
-        analyzer = (
-            SqlParseLineageAnalyzer(self._sql)
-            if self._dialect == SQLPARSE_DIALECT
-            else SqlFluffLineageAnalyzer(
-                self._sql, self._file_path, self._dialect, self._silent_mode
+        self._budget = budget = TimeBudget(self._timeout, self._statement_timeout)
+        with (
+            self._observer.timed(Phase.SPLIT),
+            budget.run("SQLLineage ran out of time budget splitting SQL"),
+        ):
+            analyzer = _new_analyzer(
+                self._sql,
+                self._dialect,
+                self._file_path,
+                self._silent_mode,
+                observer=self._observer,
             )
-        )
         self._stmt = analyzer.statements
+        previous_cache = self._previous_stmt_holder_cache
+        if (
+            self._workers > 1
+            and self._dialect != SQLPARSE_DIALECT
+            and not cast("SqlFluffLineageAnalyzer", analyzer).statements_parsed
+            and not self._metadata_provider
+            and not budget
+        ):
+            previous_cache = self._analyze_statements_in_parallel(previous_cache)
         with self._metadata_provider.session() as session:
-            stmt_holders = []
-            for stmt in self._stmt:
-                stmt_holder = analyzer.analyze(stmt, session.metadata_provider)
-                if write := stmt_holder.write:
-                    tgt_table = next(iter(write))
-                    if isinstance(tgt_table, Table) and (
-                        tgt_columns := stmt_holder.get_table_columns(tgt_table)
-                    ):
-                        session.register_session_metadata(tgt_table, tgt_columns)
-                stmt_holders.append(stmt_holder)
-            self._stmt_holders = stmt_holders
-            self._sql_holder = SQLLineageHolder.of(
-                session.metadata_provider, *self._stmt_holders
+            self._stmt_holders = _analyze_statements(
+                analyzer,
+                self._stmt,
+                session,
+                previous_cache,
+                self._stmt_holder_cache,
+                self._observer,
+                budget,
             )
+            with self._observer.timed(Phase.MERGE):
+                self._sql_holder = SQLLineageHolder.of(
+                    session.metadata_provider, *self._stmt_holders
+                )
+        # previous result is no longer needed once evaluated
+        self._previous_stmt_holder_cache = {}
         self._evaluated = True
 
+    def _analyze_statements_in_parallel(
+        self, previous_cache: StatementHolderCache
+    ) -> StatementHolderCache:
+        """
+        parse and analyze statements not in previous_cache using a process pool.
+
+        :return: previous_cache supplemented with the newly analyzed statements
+        """
+        stmts = list(dict.fromkeys(s for s in self._stmt if s not in previous_cache))
+        if len(stmts) <= 1:
+            return previous_cache
+        workers = min(self._workers, len(stmts))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=_worker_initargs(
+                self._dialect, self._metadata_provider, self._silent_mode
+            ),
+        ) as executor:
+            stmt_holders = executor.map(
+                _analyze_statement,
+                stmts,
+                itertools.repeat(self._file_path),
+                chunksize=max(1, len(stmts) // (workers * 4)),
+            )
+            # statements are independent of session metadata without a metadata provider ready
+            return previous_cache | {
+                stmt: [((), holder)] for stmt, holder in zip(stmts, stmt_holders)
+            }
+
+    @lazy_method
+    def incremental(self, sql: str) -> "LineageRunner":
+        """
+        Create a new LineageRunner for the updated SQL, with the same options as this one.
+
+        Statements unchanged from this runner won't be analyzed again, their lineage results are reused instead.
+        Session metadata registration is replayed in statement order, and a statement is re-analyzed whenever the
+        session metadata it sees differs from last time, e.g. a table it selects from is created with different
+        columns by an earlier statement.
+
+        :param sql: a string representation of the updated SQL statements.
+        """
+        runner = LineageRunner(
+            sql,
+            dialect=self._dialect,
+            metadata_provider=self._metadata_provider,
+            verbose=self._verbose,
+            silent_mode=self._silent_mode,
+            draw_options=self._draw_options,
+            file_path=self._file_path,
+            workers=self._workers,
+            observer=self._observer,
+            timeout=self._timeout,
+            statement_timeout=self._statement_timeout,
+        )
+        runner._previous_stmt_holder_cache = self._stmt_holder_cache
+        return runner
+
+    @staticmethod
+    def batch(
+        paths: Iterable[str],
+        dialect: str = DEFAULT_DIALECT,
+        metadata_provider: MetaDataProvider = DummyMetaDataProvider(),
+        silent_mode: bool = False,
+        workers: int | None = None,
+    ) -> SQLLineageHolder:
+        """
+        Analyze a batch of SQL files in parallel and combine the result into one lineage graph.
+
+        Files are sharded across a process pool, with each worker process keeping its sqlfluff config warm.
+        Each file is analyzed in its own metadata session, just like a standalone LineageRunner. The statement
+        level results are then merged back in the order of the given paths, with session metadata (e.g. tables
+        created in an earlier file) registered in the same order. When metadata provider is ready, file referring
+        to tables registered by files before it is analyzed again with their session metadata in place, so the
+        combined lineage is the same as if these files are analyzed one after another.
+
+        :param paths: paths of the SQL files
+        :param dialect: sql dialect
+        :param metadata_provider: metadata service object providing table schema. It's sent to each worker process,
+                                  so it must be picklable when the start method of the process pool is not fork.
+        :param silent_mode: boolean flag indicating whether to skip lineage analysis for unknown statement types
+        :param workers: number of worker processes, default to the number of CPUs. Set to 1 to analyze in the
+                        current process.
+        :return: :class:`sqllineage.core.holders.SQLLineageHolder`
+        """
+        paths = list(paths)
+        workers = workers if workers is not None else os.cpu_count() or 1
+        worker = _AnalyzerWorker(dialect, metadata_provider, silent_mode)
+        if workers == 1 or len(paths) <= 1:
+            return _merge_batch_results(worker, paths)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=_worker_initargs(dialect, metadata_provider, silent_mode),
+        ) as executor:
+            results = executor.map(
+                _analyze_file,
+                paths,
+                chunksize=max(1, len(paths) // (workers * 4)),
+            )
+            return _merge_batch_results(worker, paths, results)
+
     @staticmethod
     def supported_dialects() -> dict[str, list[str]]:
         """
         an ordered dict (so we can make sure the default parser implementation comes first)
         with key, value as parser_name, dialect list respectively
         """
+        from sqllineage.core.parser.sqlfluff.analyzer import SqlFluffLineageAnalyzer
+        from sqllineage.core.parser.sqlparse.analyzer import SqlParseLineageAnalyzer
+
         dialects = OrderedDict(
             [
                 (
@@ -225,3 +417,317 @@ Target Tables:
             ]
         )
         return dialects
+
+
+class StreamingLineageRunner:
+    def __init__(
+        self,
+        dialect: str = DEFAULT_DIALECT,
+        metadata_provider: MetaDataProvider = DummyMetaDataProvider(),
+        silent_mode: bool = False,
+        file_path: str = ".",
+        observer: LineageObserver | None = None,
+    ):
+        """
+        Streaming counterpart of LineageRunner for unbounded SQL input, e.g. tailing a query log.
+
+        Statements are analyzed as they come and folded into a running combined graph. Neither statement string nor
+        statement level lineage result is kept, and parse trees are released once the SQL they come from is analyzed.
+        Session metadata lives until the runner is closed, use it as a context manager to close it.
+
+        :param dialect: sql dialect
+        :param metadata_provider: metadata service object providing table schema
+        :param silent_mode: boolean flag indicating whether to skip lineage analysis for unknown statement types
+        :param file_path: path to search for sqlfluff config file, which is loaded once and reused.
+        :param observer: observer to notify with wall time of each phase
+        """
+        self._dialect = dialect
+        self._metadata_provider = metadata_provider
+        self._silent_mode = silent_mode
+        self._file_path = file_path
+        self._observer = observer if observer is not None else LineageObserver()
+        self._sqlfluff_config = (
+            _load_sqlfluff_config(file_path, dialect)
+            if dialect != SQLPARSE_DIALECT
+            else None
+        )
+        # session is closed along with the runner, deregistering session metadata
+        self._exit_stack = contextlib.ExitStack()
+        self._session = self._exit_stack.enter_context(metadata_provider.session())
+        self._go = get_graph_operator_class()()
+        self._statement_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """
+        deregister session metadata registered by analyzed statements.
+        """
+        self._exit_stack.close()
+
+    @property
+    def statement_count(self) -> int:
+        """
+        number of statements analyzed so far.
+        """
+        return self._statement_count
+
+    def run(self, sqls: Iterable[str]) -> Iterator[tuple[str, StatementLineageHolder]]:
+        """
+        analyze SQL from an iterable lazily, yielding statement level lineage one by one.
+
+        :param sqls: an iterable of SQL strings, each may contain one or more statements.
+        :return: an iterator of tuple of statement and its :class:`sqllineage.core.holders.StatementLineageHolder`
+        """
+        for sql in sqls:
+            with self._observer.timed(Phase.SPLIT):
+                analyzer = _new_analyzer(
+                    sql,
+                    self._dialect,
+                    self._file_path,
+                    self._silent_mode,
+                    sqlfluff_config=self._sqlfluff_config,
+                    observer=self._observer,
+                )
+            for stmt in analyzer.statements:
+                with self._observer.timed(Phase.ANALYZE, stmt):
+                    stmt_holder = analyzer.analyze(
+                        stmt, self._session.metadata_provider
+                    )
+                _register_session_metadata(self._session, stmt_holder)
+                with self._observer.timed(Phase.MERGE):
+                    SQLLineageHolder.merge_statement(self._go, stmt_holder)
+                self._statement_count += 1
+                yield stmt, stmt_holder
+
+    def get_sql_holder(self) -> SQLLineageHolder:
+        """
+        combined lineage of all the statements analyzed so far. The running graph is left intact so that
+        streaming can carry on.
+
+        :return: :class:`sqllineage.core.holders.SQLLineageHolder`
+        """
+        ngo = type(self._go)()
+        ngo.merge(self._go)
+        return SQLLineageHolder.build(self._session.metadata_provider, ngo)
+
+
+def _new_analyzer(
+    sql: str,
+    dialect: str,
+    file_path: str,
+    silent_mode: bool,
+    sqlfluff_config: "FluffConfig | None" = None,
+    observer: LineageObserver | None = None,
+) -> LineageAnalyzer:
+    """
+    create the analyzer for the dialect. Parser is imported here rather than at module level, so that importing
+    sqllineage doesn't pay for sqlfluff when analyzing with sqlparse, and vice versa.
+    """
+    if dialect == SQLPARSE_DIALECT:
+        from sqllineage.core.parser.sqlparse.analyzer import SqlParseLineageAnalyzer
+
+        return SqlParseLineageAnalyzer(sql)
+    from sqllineage.core.parser.sqlfluff.analyzer import SqlFluffLineageAnalyzer
+
+    return SqlFluffLineageAnalyzer(
+        sql,
+        file_path,
+        dialect,
+        silent_mode,
+        sqlfluff_config=sqlfluff_config,
+        observer=observer,
+    )
+
+
+def _load_sqlfluff_config(path: str, dialect: str) -> "FluffConfig":
+    from sqllineage.core.parser.sqlfluff.cache import fluff_config_cache
+
+    return fluff_config_cache.get(path, {"dialect": dialect})[0]
+
+
+def _register_session_metadata(
+    session: MetaDataSession, stmt_holder: StatementLineageHolder
+) -> tuple[str, ...] | None:
+    """
+    register the columns of table written by the statement as session metadata.
+
+    :return: table name followed by column names as registered, None if nothing registered
+    """
+    if write := stmt_holder.write:
+        tgt_table = next(iter(write))
+        if isinstance(tgt_table, Table) and (
+            tgt_columns := stmt_holder.get_table_columns(tgt_table)
+        ):
+            session.register_session_metadata(tgt_table, tgt_columns)
+            return (str(tgt_table), *(c.raw_name for c in tgt_columns))
+    return None
+
+
+def _analyze_statements(
+    analyzer: LineageAnalyzer,
+    statements: list[str],
+    session: MetaDataSession,
+    previous_cache: StatementHolderCache | None = None,
+    cache: StatementHolderCache | None = None,
+    observer: LineageObserver | None = None,
+    budget: TimeBudget | None = None,
+) -> list[StatementLineageHolder]:
+    """
+    analyze statements in order, registering session metadata along the way.
+
+    :param previous_cache: statement holders from previous analysis to reuse
+    :param cache: dict to collect statement holders from this analysis
+    :param observer: observer to notify with wall time of analyzing each statement
+    :param budget: time budget to analyze statements within, statements running out of time are recorded in it
+    """
+    previous_cache = previous_cache if previous_cache is not None else {}
+    observer = observer if observer is not None else LineageObserver()
+    budget = budget if budget is not None else TimeBudget()
+    # session metadata registered so far, in the form of table name to column names
+    session_metadata: dict[str, tuple[str, ...]] = {}
+    stmt_holders = []
+    for stmt in statements:
+        stmt_holder = None
+        for dependencies, previous_holder in previous_cache.get(stmt, []):
+            if all(session_metadata.get(t) == cols for t, cols in dependencies):
+                stmt_holder = previous_holder
+                break
+        if stmt_holder is None:
+            try:
+                with observer.timed(Phase.ANALYZE, stmt), budget.statement(stmt):
+                    stmt_holder = analyzer.analyze(stmt, session.metadata_provider)
+            except AnalysisTimeoutException as e:
+                warnings.warn(str(e))
+                budget.timed_out.append(stmt)
+                # result of timed-out statement is not cached, so it's analyzed again next time
+                stmt_holders.append(StatementLineageHolder())
+                continue
+        if cache is not None:
+            # lineage result depends on session metadata only when metadata provider is ready. In that case,
+            # snapshot session metadata of all the tables this statement refers to, the result can be reused next
+            # time as long as these tables have the same session metadata.
+            dependencies = (
+                tuple(
+                    (str(t), session_metadata.get(str(t)))
+                    for t in stmt_holder.go.retrieve_vertices_by_props()
+                    if isinstance(t, Table)
+                )
+                if session.metadata_provider
+                else ()
+            )
+            cache.setdefault(stmt, []).append((dependencies, stmt_holder))
+        if registered := _register_session_metadata(session, stmt_holder):
+            session_metadata[registered[0]] = registered[1:]
+        stmt_holders.append(stmt_holder)
+    return stmt_holders
+
+
+def _merge_batch_results(
+    worker: "_AnalyzerWorker",
+    paths: list[str],
+    results: Iterable[list[StatementLineageHolder]] | None = None,
+) -> SQLLineageHolder:
+    """
+    merge statement level results of files in the order of paths, registering session metadata along the way.
+
+    :param results: statement holders of each file analyzed in its own session. None to analyze files here one
+                    after another, in the session shared by all files.
+    """
+    metadata_provider = worker.metadata_provider
+    with metadata_provider.session() as session:
+        stmt_holders = []
+        # tables registered as session metadata by files merged so far
+        registered: set[str] = set()
+        for path, file_holders in zip(
+            paths, results if results is not None else [None] * len(paths)
+        ):
+            if file_holders is None or (
+                metadata_provider
+                and any(
+                    str(t) in registered
+                    for stmt_holder in file_holders
+                    for t in stmt_holder.go.retrieve_vertices_by_props()
+                    if isinstance(t, Table)
+                )
+            ):
+                # lineage result depends on session metadata when metadata provider is ready, file analyzed in its
+                # own session lacks that of the files before it
+                file_holders = worker.analyze_file(path, session)
+            for stmt_holder in file_holders:
+                if table_columns := _register_session_metadata(session, stmt_holder):
+                    registered.add(table_columns[0])
+                stmt_holders.append(stmt_holder)
+        return SQLLineageHolder.of(session.metadata_provider, *stmt_holders)
+
+
+class _AnalyzerWorker:
+    """
+    Analyze SQL in process pool worker, sqlfluff config is loaded once per directory and reused by
+    :class:`sqllineage.core.parser.sqlfluff.cache.FluffConfigCache`.
+    """
+
+    def __init__(
+        self, dialect: str, metadata_provider: MetaDataProvider, silent_mode: bool
+    ):
+        self.dialect = dialect
+        self.metadata_provider = metadata_provider
+        self.silent_mode = silent_mode
+
+    def analyze_file(
+        self, path: str, session: MetaDataSession | None = None
+    ) -> list[StatementLineageHolder]:
+        """
+        :param session: metadata session to analyze the file in, the file is analyzed in its own session if None
+        """
+        with open(path) as f:
+            sql = f.read()
+        analyzer = self._get_analyzer(sql, path)
+        if session is not None:
+            return _analyze_statements(analyzer, analyzer.statements, session)
+        with self.metadata_provider.session() as session:
+            return _analyze_statements(analyzer, analyzer.statements, session)
+
+    def analyze_statement(self, sql: str, path: str) -> StatementLineageHolder:
+        return self._get_analyzer(sql, path).analyze(sql, self.metadata_provider)
+
+    def _get_analyzer(self, sql: str, path: str) -> LineageAnalyzer:
+        return _new_analyzer(sql, self.dialect, path, self.silent_mode)
+
+
+# state of process pool worker, set by process pool initializer
+_worker_state: dict[str, Any] = {}
+
+
+def _worker_initargs(
+    dialect: str, metadata_provider: MetaDataProvider, silent_mode: bool
+) -> tuple[str, MetaDataProvider, bool, dict[str, Any]]:
+    # thread-level config doesn't propagate to worker process, pass on the config of the calling thread
+    config = {key: getattr(SQLLineageConfig, key) for key in SQLLineageConfig.config}
+    return dialect, metadata_provider, silent_mode, config
+
+
+def _init_worker(
+    dialect: str,
+    metadata_provider: MetaDataProvider,
+    silent_mode: bool,
+    config: dict[str, Any],
+) -> None:
+    _worker_state["worker"] = _AnalyzerWorker(dialect, metadata_provider, silent_mode)
+    _worker_state["config"] = config
+
+
+def _analyze_file(path: str) -> list[StatementLineageHolder]:
+    worker: _AnalyzerWorker = _worker_state["worker"]
+    with SQLLineageConfig(**_worker_state["config"]):
+        return worker.analyze_file(path)
+
+
+def _analyze_statement(sql: str, path: str) -> StatementLineageHolder:
+    worker: _AnalyzerWorker = _worker_state["worker"]
+    with SQLLineageConfig(**_worker_state["config"]):
+        return worker.analyze_statement(sql, path)
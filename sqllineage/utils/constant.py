@@ -27,3 +27,12 @@ class EdgeDirection:
 class LineageLevel:
     TABLE = "table"
     COLUMN = "column"
+
+
+class Phase:
+    SPLIT = "split"
+    ANALYZE = "analyze"
+    PARSE = "parse"
+    EXTRACT = "extract"
+    MERGE = "merge"
+    COLUMN_LINEAGE = "column_lineage"
@@ -27,3 +27,10 @@ class EdgeTuple(NamedTuple):
     target: Any
     label: str
     attributes: dict[str, Any] = {}
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
@@ -262,7 +262,7 @@ _data_warehouse_schemas = {
 @pytest.fixture(
     scope="session",
     params=generate_metadata_providers(_data_warehouse_schemas),
-    ids=["dummy", "sqlalchemy"],
+    ids=["dummy", "sqlalchemy", "sqlalchemy_reflect_schema"],
 )
 def provider(request):
     # session scope: SQLAlchemy provider is expensive to initialize; share one instance across all tests
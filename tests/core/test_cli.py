@@ -1,11 +1,21 @@
+import json
 import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from argparse import Namespace
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from sqllineage import VERSION
 from sqllineage.cli import main
 from sqllineage.config import SQLLineageConfig
+from sqllineage.daemon import forward
 
 
 @patch("socketserver.BaseServer.serve_forever")
@@ -20,6 +30,7 @@ def test_cli_dummy(_):
             main(["-e", "select * from dual", "-f", sql_file])
             main(["-f", sql_file, "-g"])
             main(["-f", sql_file, "--silent_mode"])
+            main(["-f", sql_file, "-l", "column", "--profile"])
             main(["-f", sql_file, "--sqlalchemy_url=sqlite:///:memory:"])
             main(["--sqlalchemy_url=sqlite:///:memory:", "-g"])
             break
@@ -46,3 +57,162 @@ def test_file_permission_error(_):
     with pytest.raises(SystemExit) as e:
         main(["-f", __file__])
     assert e.value.code == 1
+
+
+def test_cli_metadata_snapshot(tmp_path, capsys):
+    db, snapshot = tmp_path / "db.db", tmp_path / "snapshot.db"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE bar (col1 INTEGER, col2 INTEGER)")
+    conn.close()
+    with pytest.raises(SystemExit):
+        main(["--dump-metadata-snapshot", str(snapshot)])
+    main(
+        [f"--sqlalchemy_url=sqlite:///{db}", "--dump-metadata-snapshot", str(snapshot)]
+    )
+    assert "Dumped metadata of 1 tables" in capsys.readouterr().out
+    main(
+        [
+            "-e",
+            "insert into main.foo select * from main.bar",
+            "-l",
+            "column",
+            "--metadata-snapshot",
+            str(snapshot),
+        ]
+    )
+    assert capsys.readouterr().out.splitlines() == [
+        "main.foo.col1 <- main.bar.col1",
+        "main.foo.col2 <- main.bar.col2",
+    ]
+    with pytest.warns(UserWarning):
+        main(
+            [
+                "-e",
+                "select * from main.bar",
+                "--metadata-snapshot",
+                str(snapshot),
+                "--sqlalchemy_url=sqlite:///:memory:",
+            ]
+        )
+
+
+def test_cli_lazy_import():
+    code = """
+import sys
+from sqllineage.cli import main
+main(["-e", "insert into foo select * from bar"])
+print(",".join(m for m in sys.modules if m.startswith(("sqlalchemy", "sqlparse", "sqlfluff.dialects."))))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    # only the dialect in use is imported
+    modules = result.stdout.splitlines()[-1].split(",")
+    assert "sqlfluff.dialects.dialect_ansi" in modules
+    assert all(m.startswith("sqlfluff.dialects.dialect_ansi") for m in modules)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires unix socket")
+def test_cli_daemon(tmp_path, capsys):
+    daemon_socket = str(tmp_path / "daemon.sock")
+    with pytest.raises(SystemExit):
+        main(["--daemon"])
+    capsys.readouterr()
+    args = ["-e", "insert into foo select col1 from bar", "-l", "column"]
+    main(args)
+    expected = capsys.readouterr()
+    # analyzed locally when daemon isn't running
+    main(["--daemon-socket", daemon_socket, *args])
+    assert capsys.readouterr() == expected
+    # daemon serves a single request and then exits
+    with patch(
+        "socketserver.BaseServer.serve_forever", lambda self: self.handle_request()
+    ):
+        daemon = threading.Thread(
+            target=main, args=(["--daemon", "--daemon-socket", daemon_socket],)
+        )
+        daemon.start()
+        while not os.path.exists(daemon_socket):
+            time.sleep(0.01)
+        main(["--daemon-socket", daemon_socket, *args])
+        daemon.join(timeout=10)
+    assert not daemon.is_alive()
+    assert (
+        capsys.readouterr().out
+        == " * SQLLineage daemon listening on " + daemon_socket + "\n" + expected.out
+    )
+    assert not os.path.exists(daemon_socket)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires unix socket")
+def test_cli_daemon_version_mismatch(tmp_path, capsys):
+    daemon_socket = str(tmp_path / "daemon.sock")
+    # daemon serves two requests and then exits
+    with patch(
+        "socketserver.BaseServer.serve_forever",
+        lambda self: [self.handle_request() for _ in range(2)],
+    ):
+        daemon = threading.Thread(
+            target=main, args=(["--daemon", "--daemon-socket", daemon_socket],)
+        )
+        daemon.start()
+        while not os.path.exists(daemon_socket):
+            time.sleep(0.01)
+        # client disconnects without sending request
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(daemon_socket)
+        # request from command line of another version is declined
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(daemon_socket)
+            sock.sendall(
+                json.dumps(
+                    {"version": "0.0.0", "args": {}, "cwd": "", "config": {}}
+                ).encode("utf-8")
+                + b"\n"
+            )
+            response = json.loads(sock.makefile("rb").readline())
+        daemon.join(timeout=10)
+    assert not daemon.is_alive()
+    assert response == {"version": VERSION}
+    # command line falls back to analyzing locally upon response of another version
+    with (
+        patch("sqllineage.daemon.VERSION", "0.0.0"),
+        patch("sqllineage.daemon._connect") as connect,
+    ):
+        server, client = socket.socketpair()
+        connect.return_value = client
+        with server:
+            server.sendall(
+                json.dumps(
+                    {"version": VERSION, "code": 0, "stdout": "", "stderr": ""}
+                ).encode("utf-8")
+                + b"\n"
+            )
+            assert forward(daemon_socket, Namespace()) is None
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires unix socket")
+def test_cli_daemon_not_responding(tmp_path, capsys):
+    daemon_socket = str(tmp_path / "daemon.sock")
+    args = ["-e", "insert into tab1 select * from tab2"]
+    main(args)
+    expected = capsys.readouterr()
+    # daemon accepting the connection but never responding
+    servers = []
+
+    def accept(_):
+        server, client = socket.socketpair()
+        servers.append(server)
+        return client
+
+    with (
+        patch("sqllineage.daemon.RESPONSE_TIMEOUT", 0.1),
+        patch("sqllineage.daemon._connect", side_effect=accept),
+    ):
+        assert forward(daemon_socket, Namespace(timeout=None)) is None
+        # command line falls back to analyzing locally
+        main(["--daemon-socket", daemon_socket, *args])
+    for server in servers:
+        server.close()
+    assert len(servers) == 2
+    assert capsys.readouterr().out == expected.out
@@ -1,14 +1,19 @@
 import json
 import os.path
+import threading
+import urllib.error
+import urllib.request
 from collections import namedtuple
 from http import HTTPStatus
-from io import StringIO
+from io import BytesIO, StringIO
 from unittest.mock import patch
+from wsgiref.simple_server import WSGIRequestHandler
 
 import pytest
 
 from sqllineage.config import SQLLineageConfig
-from sqllineage.drawing import app, draw_lineage_graph
+from sqllineage.core.metadata.dummy import DummyMetaDataProvider
+from sqllineage.drawing import ThreadPoolWSGIServer, app, draw_lineage_graph
 from sqllineage.exceptions import SQLLineageException
 
 
@@ -100,9 +105,74 @@ def test_handler():
 
 
 def test_port_already_in_use():
-    def failing_make_server(host, port, app):
+    def failing_server(server_address, *args, **kwargs):
         raise OSError(48, "Address already in use")
 
-    with patch("sqllineage.drawing.make_server", failing_make_server):
+    with patch("sqllineage.drawing.ThreadPoolWSGIServer", failing_server):
         with pytest.raises(SQLLineageException, match="Failed to start server"):
             draw_lineage_graph()
+
+
+def test_request_and_analysis_timeout():
+    with (
+        patch("sqllineage.drawing.ThreadPoolWSGIServer") as server,
+        patch.object(app, "timeout", None),
+    ):
+        server.return_value.__enter__.return_value.serve_forever.return_value = None
+        draw_lineage_graph(request_timeout=10.0, analysis_timeout=None)
+        assert server.call_args.args[-1] == 10.0
+        assert app.timeout is None
+        draw_lineage_graph(request_timeout=None, analysis_timeout=5.0)
+        assert server.call_args.args[-1] is None
+        assert app.timeout == 5.0
+
+
+def test_health_and_response_cache():
+    def start_response(status, header):
+        pass
+
+    def post_lineage(sql):
+        body = json.dumps({"e": sql}).encode()
+        with BytesIO(body) as f:
+            environ = {
+                "REQUEST_METHOD": "POST",
+                "PATH_INFO": "/lineage",
+                "CONTENT_LENGTH": len(body),
+                "wsgi.input": f,
+            }
+            return json.loads(app(environ, start_response)[0])
+
+    app.response_cache.cache_clear()
+    with patch.object(app, "metadata_provider", DummyMetaDataProvider()):
+        first = post_lineage("INSERT INTO tab1 SELECT * FROM tab2")
+        assert post_lineage("INSERT INTO tab1 SELECT * FROM tab2") == first
+        post_lineage("INSERT INTO tab1 SELECT * FROM tab3")
+    result = app({"REQUEST_METHOD": "GET", "PATH_INFO": "/health"}, start_response)
+    health = json.loads(result[0])
+    assert health["status"] == "ok"
+    assert health["response_cache"]["hits"] == 1
+    assert health["response_cache"]["misses"] == 2
+    assert health["response_cache"]["currsize"] == 2
+
+
+def test_thread_pool_server():
+    server = ThreadPoolWSGIServer(
+        ("127.0.0.1", 0), WSGIRequestHandler, workers=2, queue_size=0
+    )
+    server.set_app(app)
+    url = f"http://127.0.0.1:{server.server_port}/health"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            assert json.loads(response.read())["status"] == "ok"
+        # occupy all the workers, so that the next request is rejected rather than queued
+        for _ in range(2):
+            server._slots.acquire()
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(url, timeout=10)
+        assert e.value.code == HTTPStatus.SERVICE_UNAVAILABLE.value
+        assert e.value.headers["Retry-After"] == "1"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -1,9 +1,11 @@
 import pytest
+import rustworkx as rx
 
 from sqllineage.config import SQLLineageConfig
 from sqllineage.core.graph import get_graph_operator_class
 from sqllineage.core.graph.networkx import NetworkXGraphOperator
 from sqllineage.core.graph.rustworkx import RustworkXGraphOperator
+from sqllineage.utils.constant import EdgeDirection
 
 
 def test_graph_operator_dummy():
@@ -32,3 +34,239 @@ def test_graph_operator_import_fail():
         GRAPH_OPERATOR_CLASS="sqllineage.core.graph.networkx.UnknownGraphOperator"
     ):
         assert get_graph_operator_class() == NetworkXGraphOperator
+
+
+def test_graph_operator_merge_many():
+    for graph_operator_class in (NetworkXGraphOperator, RustworkXGraphOperator):
+        others = []
+        for i in range(3):
+            other = graph_operator_class()
+            other.add_vertex_if_not_exist(f"v{i}", tag=i)
+            other.add_edge_if_not_exist(f"v{i}", f"v{i + 1}", "lineage", index=i)
+            others.append(other)
+        go = graph_operator_class()
+        go.add_vertex_if_not_exist("v0")
+        # merge into sub graph view, which can't be modified in place for networkx
+        sub_graph = go.get_sub_graph("v0")
+        sub_graph.merge_many(*others)
+        assert set(sub_graph.retrieve_vertices_by_props()) == {
+            "v0",
+            "v1",
+            "v2",
+            "v3",
+        }
+        assert sub_graph.retrieve_vertices_by_props(tag=1) == ["v1"]
+        assert {
+            (e.source, e.target, e.attributes.get("index"))
+            for e in sub_graph.retrieve_edges_by_label("lineage")
+        } == {("v0", "v1", 0), ("v1", "v2", 1), ("v2", "v3", 2)}
+        # merged graphs are copied, neither the original nor the merged graphs are affected
+        sub_graph.update_vertices("v1", tag=-1)
+        assert others[1].retrieve_vertices_by_props(tag=1) == ["v1"]
+        assert go.retrieve_vertices_by_props() == ["v0"]
+
+
+def test_graph_operator_edge_index():
+    def assert_edges(go, label, expected):
+        assert {(e.source, e.target) for e in go.retrieve_edges_by_label(label)} == (
+            expected
+        )
+        for direction, end in ((EdgeDirection.OUT, 0), (EdgeDirection.IN, 1)):
+            for vertex in go.retrieve_vertices_by_props():
+                assert {
+                    (e.source, e.target)
+                    for e in go.retrieve_edges_by_vertex(vertex, direction, label)
+                } == {edge for edge in expected if edge[end] == vertex}
+
+    for graph_operator_class in (NetworkXGraphOperator, RustworkXGraphOperator):
+        go = graph_operator_class()
+        go.add_edge_if_not_exist("t1", "c1", "has_column")
+        go.add_edge_if_not_exist("t1", "c2", "has_column")
+        go.add_edge_if_not_exist("c1", "c2", "lineage", index=0)
+        go.add_edge_if_not_exist("c2", "c2", "lineage", index=1)
+        # index is built lazily upon first lookup, and maintained by mutations afterward
+        assert_edges(go, "has_column", {("t1", "c1"), ("t1", "c2")})
+        assert [
+            e.attributes.get("index") for e in go.retrieve_edges_by_label("lineage")
+        ] == [0, 1]
+        go.add_edge_if_not_exist("c2", "c3", "lineage")
+        assert_edges(go, "lineage", {("c1", "c2"), ("c2", "c2"), ("c2", "c3")})
+        go.drop_edge("c1", "c2")
+        assert_edges(go, "lineage", {("c2", "c2"), ("c2", "c3")})
+        go.drop_vertices("c2")
+        assert_edges(go, "lineage", set())
+        assert_edges(go, "has_column", {("t1", "c1")})
+        other = graph_operator_class()
+        other.add_edge_if_not_exist("c1", "c3", "lineage")
+        go.merge(other)
+        assert_edges(go, "lineage", {("c1", "c3")})
+        sub_graph = go.get_sub_graph("t1", "c1")
+        assert_edges(sub_graph, "has_column", {("t1", "c1")})
+        assert_edges(sub_graph, "lineage", set())
+        assert go.retrieve_edges_by_label("unknown") == []
+
+
+def test_graph_operator_vertex_index():
+    for graph_operator_class in (NetworkXGraphOperator, RustworkXGraphOperator):
+        go = graph_operator_class()
+        go.add_vertex_if_not_exist("t1", read=True)
+        go.add_vertex_if_not_exist("t2", write=True)
+        go.add_edge_if_not_exist("t1", "t2", "lineage")
+        # index is built lazily upon first lookup, and maintained by mutations afterward
+        assert go.retrieve_vertices_by_props(read=True) == ["t1"]
+        go.add_vertex_if_not_exist("t3", read=True, write=True)
+        go.update_vertices("t1", "t4", write=True)
+        assert set(go.retrieve_vertices_by_props(read=True)) == {"t1", "t3"}
+        assert set(go.retrieve_vertices_by_props(read=True, write=True)) == {
+            "t1",
+            "t3",
+        }
+        go.update_vertices("t3", read=False)
+        assert go.retrieve_vertices_by_props(read=True) == ["t1"]
+        assert go.retrieve_vertices_by_props(read=False) == ["t3"]
+        go.drop_vertices("t1")
+        assert go.retrieve_vertices_by_props(read=True) == []
+        assert set(go.retrieve_vertices_by_props(write=True)) == {"t2", "t3"}
+        other = graph_operator_class()
+        other.add_vertex_if_not_exist("t2", drop=True)
+        other.add_vertex_if_not_exist("t5", drop=True)
+        go.merge(other)
+        assert set(go.retrieve_vertices_by_props(drop=True)) == {"t2", "t5"}
+        assert go.retrieve_vertices_by_props(drop=True, write=True) == ["t2"]
+        assert go.get_sub_graph("t2", "t3").retrieve_vertices_by_props(
+            write=True, drop=True
+        ) == ["t2"]
+        # None value matches vertex without the prop, and unhashable value can't be indexed
+        assert set(go.retrieve_vertices_by_props(drop=None)) == {"t3"}
+        go.update_vertices("t5", tags=["a"])
+        assert go.retrieve_vertices_by_props(tags=["a"]) == ["t5"]
+        assert set(go.retrieve_vertices_by_props()) == {"t2", "t3", "t5"}
+
+
+def test_graph_operator_vertex_types():
+    class Name(str):
+        pass
+
+    for graph_operator_class in (NetworkXGraphOperator, RustworkXGraphOperator):
+        go = graph_operator_class()
+        go.add_vertex_if_not_exist("t1")
+        go.add_edge_if_not_exist("t1", 1, "has_column")
+        go.add_edge_if_not_exist(1, 2, "lineage")
+        go.add_edge_if_not_exist(2, 2.5, "lineage")
+        assert go.retrieve_vertices_by_types(str) == ["t1"]
+        assert set(go.retrieve_vertices_by_types(int, str)) == {"t1", 1, 2}
+        go.add_vertex_if_not_exist(Name("t2"))
+        assert set(go.retrieve_vertices_by_types(str)) == {"t1", "t2"}
+        assert go.retrieve_vertices_by_types(Name) == ["t2"]
+        assert go.retrieve_vertex_degrees() == {
+            "t1": (0, 1),
+            1: (1, 1),
+            2: (1, 1),
+            2.5: (1, 0),
+            "t2": (0, 0),
+        }
+        # sub graph by types is cached until next mutation
+        sub_graph = go.get_sub_graph_by_types(int, Name)
+        assert sub_graph is go.get_sub_graph_by_types(int, Name)
+        assert {
+            (e.source, e.target) for e in sub_graph.retrieve_edges_by_label("lineage")
+        } == {(1, 2)}
+        go.drop_vertices("t2")
+        assert go.get_sub_graph_by_types(int, Name) is not sub_graph
+        assert set(
+            go.get_sub_graph_by_types(int, Name).retrieve_vertices_by_props()
+        ) == {1, 2}
+
+
+def test_graph_operator_sub_graph():
+    for graph_operator_class in (NetworkXGraphOperator, RustworkXGraphOperator):
+        go = graph_operator_class()
+        go.add_vertex_if_not_exist("a", read=True)
+        for src, tgt in (("a", "b"), ("b", "c"), ("c", "d"), ("a", "c")):
+            go.add_edge_if_not_exist(src, tgt, "lineage", weight=1)
+        sub_graph = go.get_sub_graph("a", "b", "c", "x")
+        # queries are restricted to vertices of the sub graph
+        assert set(sub_graph.retrieve_vertices_by_props()) == {"a", "b", "c"}
+        assert sub_graph.retrieve_vertices_by_props(read=True) == ["a"]
+        assert {
+            (e.source, e.target, e.attributes["weight"])
+            for e in sub_graph.retrieve_edges_by_label("lineage")
+        } == {("a", "b", 1), ("b", "c", 1), ("a", "c", 1)}
+        assert sub_graph.retrieve_edges_by_vertex("c", EdgeDirection.OUT) == []
+        assert sub_graph.retrieve_edges_by_vertex("d", EdgeDirection.IN) == []
+        assert sub_graph.retrieve_source_vertices() == ["a"]
+        assert sub_graph.retrieve_target_vertices() == ["c"]
+        assert sub_graph.retrieve_vertex_degrees()["c"] == (2, 0)
+        assert sub_graph.retrieve_ancestors("c") == {"a", "b"}
+        assert sorted(sub_graph.list_lineage_paths("a", "c")) == [
+            ["a", "b", "c"],
+            ["a", "c"],
+        ]
+        assert sub_graph.get_sub_graph("b", "c", "d").retrieve_vertices_by_props() == [
+            "b",
+            "c",
+        ]
+        if graph_operator_class is NetworkXGraphOperator:
+            # networkx sub graph view is frozen
+            continue
+        # rustworkx sub graph view is copied before being modified, leaving the original graph intact
+        sub_graph.drop_vertices("b")
+        sub_graph.add_edge_if_not_exist("c", "e", "lineage")
+        sub_graph.update_vertices("a", read=False)
+        assert set(sub_graph.retrieve_vertices_by_props()) == {"a", "c", "e"}
+        assert sub_graph.retrieve_ancestors("e") == {"a", "c"}
+        assert set(go.retrieve_vertices_by_props()) == {"a", "b", "c", "d"}
+        assert go.retrieve_vertices_by_props(read=True) == ["a"]
+        assert go.retrieve_ancestors("d") == {"a", "b", "c"}
+
+
+def test_rustworkx_graph_operator_from_graph():
+    for graph in (rx.PyDiGraph(), rx.PyDAG()):
+        src = graph.add_node({"vertex": "v0", "tag": 0})
+        tgt = graph.add_node("v1")
+        graph.add_edge(src, tgt, {"label": "lineage", "index": 0})
+        go = RustworkXGraphOperator(graph)
+        assert set(go.retrieve_vertices_by_props()) == {"v0", "v1"}
+        assert go.retrieve_vertices_by_props(tag=0) == ["v0"]
+        assert [
+            (e.source, e.target, e.attributes)
+            for e in go.retrieve_edges_by_label("lineage")
+        ] == [("v0", "v1", {"index": 0})]
+
+
+def test_rustworkx_sub_graph_view_isolation():
+    go = RustworkXGraphOperator()
+    go.add_edge_if_not_exist("v0", "v1", "lineage")
+    # modifying sub graph view copies it first, leaving the original graph intact
+    sub_graph = go.get_sub_graph("v0")
+    sub_graph.add_vertex_if_not_exist("v2")
+    assert set(go.retrieve_vertices_by_props()) == {"v0", "v1"}
+    assert set(sub_graph.retrieve_vertices_by_props()) == {"v0", "v2"}
+    # sub graph view refuses to be used once the original graph is modified, as node index may be reused
+    sub_graph = go.get_sub_graph("v0", "v1")
+    go.drop_vertices("v1")
+    go.add_vertex_if_not_exist("v3")
+    with pytest.raises(RuntimeError):
+        sub_graph.retrieve_vertices_by_props()
+    with pytest.raises(RuntimeError):
+        sub_graph.add_vertex_if_not_exist("v4")
+
+
+def test_rustworkx_sub_graph_view_after_noop():
+    go = RustworkXGraphOperator()
+    go.add_edge_if_not_exist("v0", "v1", "lineage")
+    sub_graph = go.get_sub_graph("v0", "v1")
+    # adding existing vertex or edge, dropping absent vertex and updating props don't modify the graph structure
+    go.add_edge_if_not_exist("v0", "v1", "lineage")
+    go.add_vertex_if_not_exist("v0", tag=0)
+    go.update_vertices("v1", tag=1)
+    go.drop_vertices("v2")
+    assert set(sub_graph.retrieve_vertices_by_props()) == {"v0", "v1"}
+    assert sub_graph.retrieve_vertices_by_props(tag=1) == ["v1"]
+    assert [
+        (e.source, e.target) for e in sub_graph.retrieve_edges_by_label("lineage")
+    ] == [("v0", "v1")]
+    # adding a new edge between existing vertices does
+    go.add_edge_if_not_exist("v1", "v0", "lineage")
+    with pytest.raises(RuntimeError):
+        sub_graph.retrieve_vertices_by_props()
@@ -1,5 +1,75 @@
+import pickle
+
+from sqllineage.config import SQLLineageConfig
+from sqllineage.core.graph_operator import GraphOperator
 from sqllineage.core.holders import StatementLineageHolder
+from sqllineage.core.models import Table
+from sqllineage.runner import LineageRunner
+from sqllineage.utils.constant import EdgeDirection, EdgeType
+
+from ..helpers import _gen_graph_operators
 
 
 def test_dummy():
     assert str(StatementLineageHolder()) == repr(StatementLineageHolder())
+
+
+def test_statement_holder_pickle():
+    sql = "insert into tab1 select a.col1 from (select col1 from tab2) a"
+    for graph_operator in _gen_graph_operators():
+        with SQLLineageConfig(GRAPH_OPERATOR_CLASS=graph_operator):
+            runner = LineageRunner(sql)
+            runner._eval()
+            holder = runner._stmt_holders[0]
+            restored = pickle.loads(pickle.dumps(holder))
+            assert str(restored) == str(holder)
+            assert restored.write_columns == holder.write_columns
+            assert restored.get_column_lineage() == holder.get_column_lineage()
+
+
+def test_column_lineage_dag():
+    sql = """insert into tab2 select col1, col1 + col2 as col2 from tab1;
+insert into tab3 select a.col1, a.col2 from (select col1, col2 from tab2) a;
+insert into tab4 select col2 from tab3"""
+    for graph_operator in _gen_graph_operators():
+        with SQLLineageConfig(GRAPH_OPERATOR_CLASS=graph_operator):
+            runner = LineageRunner(sql)
+            runner._eval()
+            holder = runner._sql_holder
+            dag = holder.get_column_lineage_dag()
+            paths = holder.get_column_lineage()
+            assert set(dag.retrieve_vertices_by_props()) == {
+                col for path in paths for col in path
+            }
+            for path in paths:
+                for src, tgt in zip(path, path[1:]):
+                    assert tgt in {
+                        e.target
+                        for e in dag.retrieve_edges_by_vertex(src, EdgeDirection.OUT)
+                    }
+                # default implementation walks backward in the same way
+                assert GraphOperator.retrieve_ancestors(
+                    holder.go, path[-1]
+                ) == holder.go.retrieve_ancestors(path[-1])
+
+
+def test_sql_holder_table_summary():
+    sql = """insert into tab2 select * from tab1;
+insert into tab3 select * from tab2"""
+    for graph_operator in _gen_graph_operators():
+        with SQLLineageConfig(GRAPH_OPERATOR_CLASS=graph_operator):
+            runner = LineageRunner(sql)
+            runner._eval()
+            holder = runner._sql_holder
+            assert holder.source_tables == {Table("tab1")}
+            table_graph = holder.table_lineage_graph
+            # table level projection and summary are computed once, until the graph is modified
+            assert holder.table_lineage_graph is table_graph
+            assert holder.intermediate_tables == {Table("tab2")}
+            assert holder.target_tables == {Table("tab3")}
+            holder.go.add_edge_if_not_exist(
+                Table("tab3"), Table("tab4"), EdgeType.LINEAGE
+            )
+            assert holder.table_lineage_graph is not table_graph
+            assert holder.intermediate_tables == {Table("tab2"), Table("tab3")}
+            assert holder.target_tables == {Table("tab4")}
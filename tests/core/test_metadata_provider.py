@@ -1,9 +1,22 @@
+import asyncio
 import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import ProgrammingError
 
+from sqllineage.core.metadata import sqlalchemy as sqlalchemy_metadata
+from sqllineage.core.metadata.caching import CacheInfo, CachingMetaDataProvider
+from sqllineage.core.metadata.dummy import DummyMetaDataProvider
+from sqllineage.core.metadata.snapshot import SnapshotMetaDataProvider
 from sqllineage.core.metadata.sqlalchemy import SQLAlchemyMetaDataProvider
+from sqllineage.core.metadata_provider import AsyncMetaDataProvider
+from sqllineage.core.models import Column, Table
 from sqllineage.exceptions import MetaDataProviderException
+from sqllineage.runner import LineageRunner
 
 
 def test_sqlalchemy_metadata_provider_connection_fail():
@@ -24,3 +37,337 @@ def test_sqlalchemy_metadata_provider_query_fail():
         provider._get_table_columns("non_existing_schema", "non_existing_table") == []
     )
     assert provider._get_table_columns("main", "non_existing_table") == []
+
+
+class CountingMetaDataProvider(DummyMetaDataProvider):
+    def __init__(self, metadata: dict[str, list[str]]):
+        super().__init__(metadata)
+        self.single_calls: list[tuple[str, str]] = []
+        self.bulk_calls: list[list[tuple[str, str]]] = []
+
+    def _get_table_columns(self, schema: str, table: str, **kwargs) -> list[str]:
+        self.single_calls.append((schema, table))
+        return super()._get_table_columns(schema, table, **kwargs)
+
+    def _get_tables_columns(
+        self, tables: list[tuple[str, str]], **kwargs
+    ) -> dict[tuple[str, str], list[str]]:
+        self.bulk_calls.append(tables)
+        return {
+            (schema, table): DummyMetaDataProvider._get_table_columns(
+                self, schema, table
+            )
+            for schema, table in tables
+        }
+
+
+def test_metadata_provider_prefetch_per_statement():
+    provider = CountingMetaDataProvider(
+        {"db.tab1": ["col1", "col2"], "db.tab2": ["col3"]}
+    )
+    sql = """INSERT INTO db.tab3
+WITH cte1 AS (SELECT * FROM db.tab2)
+SELECT a.*, cte1.col3 FROM db.tab1 a JOIN cte1 ON a.col1 = cte1.col3"""
+    lr = LineageRunner(sql, metadata_provider=provider)
+    assert {(str(path[0]), str(path[-1])) for path in lr.get_column_lineage()} == {
+        ("db.tab1.col1", "db.tab3.col1"),
+        ("db.tab1.col2", "db.tab3.col2"),
+        ("db.tab2.col3", "db.tab3.col3"),
+    }
+    assert provider.bulk_calls == [[("db", "tab3"), ("db", "tab2"), ("db", "tab1")]]
+    assert provider.single_calls == []
+    # prefetched metadata doesn't outlive the statement
+    assert provider._prefetched == {}
+
+
+def test_metadata_provider_get_tables_columns():
+    provider = CountingMetaDataProvider({"db.tab1": ["col1"], "db.tab2": ["col2"]})
+    with provider.session() as session:
+        session.register_session_metadata(Table("db.tab2"), [Column("col3")])
+        result = provider.get_tables_columns(
+            [Table("db.tab1"), Table("db.tab2"), Table("db.tab1", alias="t")]
+        )
+    assert {str(t): [str(c) for c in cols] for t, cols in result.items()} == {
+        "db.tab1": ["db.tab1.col1"],
+        "db.tab2": ["db.tab2.col3"],
+    }
+    assert provider.bulk_calls == [[("db", "tab1")]]
+
+
+class SleepingMetaDataProvider(AsyncMetaDataProvider):
+    def __init__(self, metadata: dict[str, list[str]], concurrency: int):
+        super().__init__(concurrency)
+        self.metadata = metadata
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _aget_table_columns(self, schema: str, table: str, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.metadata.get(f"{schema}.{table}", [])
+
+
+def test_async_metadata_provider():
+    metadata = {f"db.tab{i}": [f"col{i}"] for i in range(10)}
+    provider = SleepingMetaDataProvider(metadata, concurrency=4)
+    tables = [Table(name) for name in metadata]
+    result = provider.get_tables_columns(tables)
+    assert [[str(c) for c in result[t]] for t in tables] == [
+        [f"db.tab{i}.col{i}"] for i in range(10)
+    ]
+    assert provider.max_in_flight == 4
+    assert [str(c) for c in provider.get_table_columns(Table("db.tab1"))] == [
+        "db.tab1.col1"
+    ]
+
+    async def from_event_loop():
+        async_result = await provider.aget_tables_columns(tables)
+        # sync api works inside a running event loop as well
+        sync_result = provider.get_tables_columns(tables)
+        return async_result, sync_result
+
+    async_result, sync_result = asyncio.run(from_event_loop())
+    assert async_result == sync_result == result
+
+
+class LoopBoundMetaDataProvider(AsyncMetaDataProvider):
+    def __init__(self):
+        super().__init__()
+        # stand-in for client bound to the event loop it's created in, like aiohttp session
+        self.client_loop = None
+
+    async def _aget_table_columns(self, schema: str, table: str, **kwargs):
+        if self.client_loop is None:
+            self.client_loop = asyncio.get_running_loop()
+        elif self.client_loop is not asyncio.get_running_loop():
+            raise RuntimeError("client is attached to a different loop")
+        return ["col1"]
+
+
+def test_async_metadata_provider_event_loop():
+    with LoopBoundMetaDataProvider() as provider:
+        for table in ("db.tab1", "db.tab2"):
+            assert provider.get_table_columns(Table(table))
+
+        async def from_event_loop():
+            await provider.aget_tables_columns([Table("db.tab3")])
+            return provider.get_tables_columns([Table("db.tab4")])
+
+        assert asyncio.run(from_event_loop())
+        thread = provider._loop_thread
+        assert thread is not None and thread.is_alive()
+    assert not thread.is_alive()
+    # event loop is started again in unpickled provider, e.g. in worker process
+    with SleepingMetaDataProvider({"db.tab1": ["col1"]}, concurrency=1) as provider:
+        assert provider.get_table_columns(Table("db.tab1"))
+        with pickle.loads(pickle.dumps(provider)) as unpickled:
+            assert unpickled.get_table_columns(Table("db.tab1"))
+
+
+def test_async_metadata_provider_lineage():
+    provider = SleepingMetaDataProvider({"db.tab1": ["col1", "col2"]}, concurrency=16)
+    lr = LineageRunner(
+        "INSERT INTO db.tab2 SELECT * FROM db.tab1", metadata_provider=provider
+    )
+    assert {(str(path[0]), str(path[-1])) for path in lr.get_column_lineage()} == {
+        ("db.tab1.col1", "db.tab2.col1"),
+        ("db.tab1.col2", "db.tab2.col2"),
+    }
+
+
+def test_caching_metadata_provider():
+    provider = CountingMetaDataProvider({"db.tab1": ["col1"], "db.tab2": ["col2"]})
+    caching_provider = CachingMetaDataProvider(provider, maxsize=2)
+    assert bool(caching_provider)
+    tables = [Table("db.tab1"), Table("db.tab2"), Table("db.tab3")]
+    for _ in range(3):
+        result = caching_provider.get_tables_columns(tables)
+        assert [[str(c) for c in result[t]] for t in tables] == [
+            ["db.tab1.col1"],
+            ["db.tab2.col2"],
+            [],
+        ]
+    # tab1 is evicted as least recently used, tab3 as missing table is cached too
+    assert provider.bulk_calls == [
+        [("db", "tab1"), ("db", "tab2"), ("db", "tab3")],
+        [("db", "tab1")],
+        [("db", "tab2")],
+    ]
+    assert caching_provider.cache_info() == CacheInfo(
+        hits=4, misses=5, maxsize=2, currsize=2
+    )
+    caching_provider.cache_clear()
+    assert caching_provider.cache_info() == CacheInfo(
+        hits=0, misses=0, maxsize=2, currsize=0
+    )
+    assert not CachingMetaDataProvider(DummyMetaDataProvider())
+
+
+def test_caching_metadata_provider_ttl():
+    provider = CountingMetaDataProvider({"db.tab1": ["col1"]})
+    caching_provider = CachingMetaDataProvider(provider, ttl=0.05, negative_ttl=0)
+    for _ in range(2):
+        caching_provider.get_table_columns(Table("db.tab1"))
+        caching_provider.get_table_columns(Table("db.tab2"))
+    assert provider.bulk_calls == [[("db", "tab1")], [("db", "tab2")], [("db", "tab2")]]
+    time.sleep(0.1)
+    caching_provider.get_table_columns(Table("db.tab1"))
+    assert provider.bulk_calls[-1] == [("db", "tab1")]
+
+
+def test_caching_metadata_provider_shared_across_threads():
+    provider = CountingMetaDataProvider({"db.tab1": ["col1", "col2"]})
+    caching_provider = CachingMetaDataProvider(provider)
+    sql = "INSERT INTO db.tab2 SELECT * FROM db.tab1"
+    # warm up the cache, so that lineage runners from other threads all hit the cache
+    caching_provider.get_tables_columns([Table("db.tab1"), Table("db.tab2")])
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        lineages = list(
+            executor.map(
+                lambda _: LineageRunner(
+                    sql, metadata_provider=caching_provider
+                ).get_column_lineage(),
+                range(8),
+            )
+        )
+    assert all(
+        [(str(p[0]), str(p[-1])) for p in lineage]
+        == [("db.tab1.col1", "db.tab2.col1"), ("db.tab1.col2", "db.tab2.col2")]
+        for lineage in lineages
+    )
+    assert len(provider.bulk_calls) == 1
+    assert pickle.loads(pickle.dumps(caching_provider)).cache_info() == (
+        caching_provider.cache_info()
+    )
+
+
+def test_sqlalchemy_metadata_provider_reflect_once(monkeypatch):
+    provider = SQLAlchemyMetaDataProvider("sqlite:///:memory:")
+    with provider.engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE tab1 (col1 INTEGER)")
+    reflected = []
+    table_cls = sqlalchemy_metadata.Table
+
+    def table(*args, **kwargs):
+        reflected.append(args[0])
+        return table_cls(*args, **kwargs)
+
+    monkeypatch.setattr(sqlalchemy_metadata, "Table", table)
+    for _ in range(2):
+        assert provider._get_table_columns("main", "tab1") == ["col1"]
+    assert reflected == ["tab1"]
+
+
+def test_metadata_provider_session_per_thread():
+    provider = DummyMetaDataProvider({"db.tab1": ["col1"]})
+    with provider.session() as session:
+        session.register_session_metadata(Table("db.tab1"), [Column("col2")])
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread = executor.submit(
+                provider.get_table_columns, Table("db.tab1")
+            ).result()
+        assert [str(c) for c in other_thread] == ["db.tab1.col1"]
+        assert [str(c) for c in provider.get_table_columns(Table("db.tab1"))] == [
+            "db.tab1.col2"
+        ]
+
+
+@pytest.mark.parametrize("reflect_schema", [False, True])
+def test_sqlalchemy_metadata_provider_bulk(reflect_schema: bool):
+    provider = SQLAlchemyMetaDataProvider(
+        "sqlite:///:memory:", reflect_schema=reflect_schema
+    )
+    with provider.engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE tab1 (col1 INTEGER, col2 INTEGER)")
+        conn.exec_driver_sql("CREATE VIEW view1 AS SELECT col1 FROM tab1")
+    tables = [("main", "tab1"), ("main", "view1"), ("main", "tab2")]
+    expected = {
+        ("main", "tab1"): ["col1", "col2"],
+        ("main", "view1"): ["col1"],
+        ("main", "tab2"): [],
+    }
+    assert provider._get_tables_columns(tables) == expected
+    assert provider._get_tables_columns([("unknown", "tab1")]) == {
+        ("unknown", "tab1"): []
+    }
+    queries = []
+    event.listen(
+        provider.engine, "before_cursor_execute", lambda *args: queries.append(args)
+    )
+    found = [("main", "tab1"), ("main", "view1")]
+    assert provider._get_tables_columns(found) == {t: expected[t] for t in found}
+    assert provider._get_table_columns("main", "tab1") == ["col1", "col2"]
+    # tables found are reflected once and for all
+    assert len(queries) == 0
+    # tables not found are not kept, table created afterward is found
+    with provider.engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE tab2 (col3 INTEGER)")
+    assert provider._get_tables_columns(tables) == expected | {
+        ("main", "tab2"): ["col3"]
+    }
+    # negative caching is left to CachingMetaDataProvider
+    cached = CachingMetaDataProvider(provider)
+    assert cached._get_tables_columns([("main", "tab3")]) == {("main", "tab3"): []}
+    queries.clear()
+    assert cached._get_tables_columns([("main", "tab3")]) == {("main", "tab3"): []}
+    assert len(queries) == 0
+
+
+def test_sqlalchemy_metadata_provider_bulk_error(monkeypatch):
+    provider = SQLAlchemyMetaDataProvider("sqlite:///:memory:")
+    with provider.engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE tab1 (col1 INTEGER)")
+
+    def inspect(engine):
+        raise ProgrammingError("SELECT 1", {}, Exception("schema does not exist"))
+
+    # bulk reflection fails the same way as reflecting one table at a time
+    with monkeypatch.context() as m:
+        m.setattr(sqlalchemy_metadata, "inspect", inspect)
+        assert provider._get_tables_columns([("main", "tab1")]) == {
+            ("main", "tab1"): []
+        }
+    # failure is not kept, table is reflected again next time
+    assert provider._get_tables_columns([("main", "tab1")]) == {
+        ("main", "tab1"): ["col1"]
+    }
+
+
+def test_snapshot_metadata_provider(tmp_path):
+    path = str(tmp_path / "snapshot.db")
+    provider = DummyMetaDataProvider(
+        {"db1.tab1": ["col2", "col1"], "db1.tab2": ["col3"], "db2.tab1": []}
+    )
+    snapshot = SnapshotMetaDataProvider.dump(provider, path, batch_size=2)
+    assert bool(snapshot)
+    assert sorted(snapshot.list_tables()) == [("db1", "tab1"), ("db1", "tab2")]
+    assert snapshot._get_table_columns("db1", "tab1") == ["col2", "col1"]
+    assert snapshot._get_tables_columns([("db1", "tab2"), ("db2", "tab1")]) == {
+        ("db1", "tab2"): ["col3"],
+        ("db2", "tab1"): [],
+    }
+    # connection is opened again after unpickled, e.g. in a worker process
+    unpickled = pickle.loads(pickle.dumps(snapshot))
+    assert unpickled._get_table_columns("db1", "tab2") == ["col3"]
+    # dump again from a snapshot, overwriting the existing one
+    SnapshotMetaDataProvider.dump(
+        DummyMetaDataProvider({"db1.tab1": ["col4"]}), path, tables=[("db1", "tab1")]
+    )
+    assert SnapshotMetaDataProvider(path)._get_table_columns("db1", "tab1") == ["col4"]
+
+
+def test_snapshot_metadata_provider_exception(tmp_path):
+    with pytest.raises(MetaDataProviderException):
+        SnapshotMetaDataProvider(str(tmp_path / "non_existing.db"))
+    invalid = tmp_path / "invalid.db"
+    invalid.write_text("not a snapshot")
+    with pytest.raises(MetaDataProviderException):
+        SnapshotMetaDataProvider(str(invalid))._get_table_columns("db1", "tab1")
+    with pytest.raises(NotImplementedError):
+        SnapshotMetaDataProvider.dump(
+            SleepingMetaDataProvider({}, concurrency=1), str(tmp_path / "s.db")
+        )
+    # no partial snapshot is left behind
+    assert sorted(os.listdir(tmp_path)) == ["invalid.db"]
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from sqlparse.sql import Parenthesis
 
@@ -25,6 +27,40 @@ def test_hash_eq():
     assert len({Table("a"), Table("a")}) == 1
 
 
+def test_schema_interned():
+    assert Schema("a") is Schema("A")
+    assert Schema() is Schema("<default>")
+    assert Table("a.b").schema is Table("b", Schema("a")).schema
+    assert pickle.loads(pickle.dumps(Schema("a"))) is Schema("a")
+
+
+def test_slots():
+    for model in (
+        Schema(),
+        Table("a"),
+        Path("a"),
+        SubQuery(Parenthesis(), Parenthesis().value, ""),
+        Column("a"),
+    ):
+        assert not hasattr(model, "__dict__")
+
+
+def test_pickle():
+    tab = Table("a.b", alias="c")
+    assert pickle.loads(pickle.dumps(tab)) == tab
+    assert pickle.loads(pickle.dumps(tab)).alias == "c"
+    assert pickle.loads(pickle.dumps(Path("a"))) == Path("a")
+    sq = pickle.loads(pickle.dumps(SubQuery(Parenthesis(), "(select 1)", "sq")))
+    assert sq.query is None and sq.alias == "sq"
+    col = Column("c", source_columns=(("d", "e"),))
+    col.parent = tab
+    col.parent = Table("f")
+    unpickled = pickle.loads(pickle.dumps(col))
+    assert unpickled == col
+    assert unpickled.parent_candidates == col.parent_candidates
+    assert unpickled.source_columns == col.source_columns
+
+
 def test_of_dummy():
     with pytest.raises(NotImplementedError):
         Column.of("")
@@ -1,9 +1,18 @@
-from unittest.mock import Mock
+import os
+import threading
+from unittest.mock import Mock, patch
 
+import pytest
 from sqlfluff.core import Linter
 
+from sqllineage.core.metadata.dummy import DummyMetaDataProvider
+from sqllineage.core.models import Column, SubQuery
+from sqllineage.core.parser.sqlfluff.analyzer import SqlFluffLineageAnalyzer
+from sqllineage.core.parser.sqlfluff.cache import FluffConfigCache, ParseCache
 from sqllineage.core.parser.sqlfluff.models import SqlFluffColumn
 from sqllineage.core.parser.sqlfluff.utils import find_from_expression_element
+from sqllineage.exceptions import InvalidSyntaxException
+from sqllineage.utils.entities import CacheInfo
 
 
 def test_column_extract_source_columns():
@@ -15,3 +24,147 @@ def test_column_extract_source_columns():
 def test_return_none_find_from_expression_element():
     file_segment = Linter(dialect="ansi").parse_string("TRUNCATE TABLE tab").tree
     assert find_from_expression_element(file_segment) is None
+
+
+def test_sqlfluff_analyzer_parse_each_statement_once():
+    sql = "insert into tab1 select * from tab2;\n-- comment\ninsert into tab3 select * from tab1;"
+    analyzer = SqlFluffLineageAnalyzer(sql, ".", "ansi")
+    with patch.object(
+        analyzer,
+        "_list_specific_statement_segment",
+        wraps=analyzer._list_specific_statement_segment,
+    ) as parse:
+        for stmt in analyzer.statements:
+            # statement with different trailing whitespace or semicolon is still recognized
+            for variant in (stmt, stmt.rstrip(";"), f"  {stmt};\n"):
+                analyzer.analyze(variant, DummyMetaDataProvider())
+        assert parse.call_count == len(analyzer.statements)
+
+
+def test_sqlfluff_analyzer_release_parse_tree():
+    sql = """insert into tab1 select * from (select col1 from tab2) sq;
+insert into tab3 select sq.col1 from (select col1 from tab1) sq"""
+    # tsql statements are parsed when splitting
+    for dialect in ("ansi", "tsql"):
+        analyzer = SqlFluffLineageAnalyzer(sql, ".", dialect)
+        for stmt in analyzer.statements:
+            holder = analyzer.analyze(stmt, DummyMetaDataProvider())
+            subqueries = {
+                p
+                for v in holder.go.retrieve_vertices_by_props()
+                for p in (v.parent_candidates if isinstance(v, Column) else [v])
+                if isinstance(p, SubQuery)
+            }
+            assert len(subqueries) > 0
+            assert all(sq.query is None for sq in subqueries)
+        assert not analyzer.statements_parsed
+        # lineage result depends on metadata when provider is ready, statement is parsed again from released segment
+        with patch.object(
+            analyzer,
+            "_list_specific_statement_segment",
+            wraps=analyzer._list_specific_statement_segment,
+        ) as parse:
+            provider = DummyMetaDataProvider({"default.tab2": ["col1"]})
+            analyzer.analyze(analyzer.statements[0], provider)
+            assert parse.call_count == 1
+
+
+def test_sqlfluff_analyzer_lexical_split_fallback():
+    sql = """CREATE PROCEDURE proc1()
+BEGIN
+INSERT INTO tab1 SELECT * FROM tab2;
+END;
+INSERT INTO tab3 SELECT * FROM tab1;"""
+    analyzer = SqlFluffLineageAnalyzer(sql, ".", "bigquery")
+    assert analyzer._lexical_split(sql) is None
+    assert len(analyzer.statements) == 2
+    sql = "{% set tbl = 'tab2' %}INSERT INTO tab1 SELECT * FROM {{ tbl }};"
+    analyzer = SqlFluffLineageAnalyzer(sql, ".", "ansi")
+    assert analyzer._lexical_split(sql) is None
+    assert analyzer.statements == ["INSERT INTO tab1 SELECT * FROM tab2;"]
+    sql = """IF (SELECT COUNT(*) FROM tab1) > 0 THEN
+INSERT INTO tab2 SELECT * FROM tab1;
+END IF;"""
+    analyzer = SqlFluffLineageAnalyzer(sql, ".", "bigquery")
+    assert analyzer._lexical_split(sql) is None
+    # IF function and CASE expression are not control flow blocks
+    sql = "SELECT IF(col1 > 0, 1, 0), CASE WHEN col1 > 0 THEN 1 END FROM tab1;SELECT 1;"
+    analyzer = SqlFluffLineageAnalyzer(sql, ".", "bigquery")
+    assert analyzer._lexical_split(sql) is not None
+
+
+def test_sqlfluff_analyzer_lexical_split_multiple_statements():
+    sql = "insert into tab1 select * from tab2;"
+    analyzer = SqlFluffLineageAnalyzer(sql, ".", "ansi")
+    segments = Linter(dialect="ansi").parse_string(
+        "insert into tab1 select * from tab2;\ninsert into tab3 select * from tab4;"
+    )
+    statements = [s.segments[0] for s in segments.tree.get_children("statement")]
+    # statements in one chunk split by lexer are reported rather than silently dropped
+    with patch.object(
+        analyzer, "_list_specific_statement_segment", return_value=statements
+    ):
+        with pytest.raises(InvalidSyntaxException, match="without semicolon"):
+            analyzer.analyze(sql, DummyMetaDataProvider())
+
+
+def test_fluff_config_cache(tmp_path):
+    cache = FluffConfigCache(maxsize=2)
+    config, linter = cache.get(str(tmp_path), {"dialect": "ansi"})
+    # files in the same directory share the same config and linter
+    assert cache.get(str(tmp_path / "test.sql"), {"dialect": "ansi"}) == (
+        config,
+        linter,
+    )
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    # creating other files in the directory doesn't matter
+    (tmp_path / "test.sql").write_text("select 1")
+    mtime = os.stat(tmp_path).st_mtime_ns + 10**9
+    os.utime(tmp_path, ns=(mtime, mtime))
+    assert cache.get(str(tmp_path), {"dialect": "ansi"})[0] is config
+    assert cache.cache_info() == CacheInfo(hits=2, misses=1, maxsize=2, currsize=1)
+    # sqlfluff config caches are left alone unless config file is changed
+    with patch(
+        "sqllineage.core.parser.sqlfluff.cache.clear_config_caches"
+    ) as clear_config_caches:
+        cache.get(str(tmp_path), {"dialect": "tsql"})
+        clear_config_caches.assert_not_called()
+    cache.cache_clear()
+    cache.get(str(tmp_path), {"dialect": "ansi"})
+    cache.get(str(tmp_path), {"dialect": "ansi"})
+    # config is reloaded once config file is created or modified
+    config_file = tmp_path / ".sqlfluff"
+    for max_line_length in (100, 120):
+        config_file.write_text(f"[sqlfluff]\nmax_line_length = {max_line_length}\n")
+        mtime = os.stat(config_file).st_mtime_ns + max_line_length * 10**9
+        os.utime(config_file, ns=(mtime, mtime))
+        reloaded, _ = cache.get(str(tmp_path), {"dialect": "ansi"})
+        assert reloaded is not config
+        assert reloaded.get("max_line_length") == max_line_length
+    assert cache.cache_info() == CacheInfo(hits=1, misses=3, maxsize=2, currsize=1)
+    # least recently used config is evicted
+    cache.get(str(tmp_path), {"dialect": "sparksql"})
+    cache.get(str(tmp_path.parent), {"dialect": "ansi"})
+    assert cache.cache_info().currsize == 2
+    cache.get(str(tmp_path), {"dialect": "ansi"})
+    assert cache.cache_info() == CacheInfo(hits=1, misses=6, maxsize=2, currsize=2)
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_parse_cache(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    # silent mode changes analysis result, so it's part of the key
+    assert ParseCache.key("statement", "select 1") != ParseCache.key(
+        "statement", "select 1", silent_mode=True
+    )
+    key = ParseCache.key("statement", "select 1")
+    cache.set(key, ["select 1;"])
+    assert cache.get(key) == ["select 1;"]
+    # temp file is removed when writing entry fails, no matter pickling or renaming
+    with pytest.raises(TypeError):
+        cache.set(key, threading.Lock())
+    with patch("os.replace", side_effect=OSError):
+        cache.set(ParseCache.key("statement", "select 2"), ["select 2;"])
+    assert [f.name for f in tmp_path.rglob("*") if f.is_file()] == [key[2:] + ".pickle"]
+    assert cache.get(key) == ["select 1;"]
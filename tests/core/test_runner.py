@@ -1,11 +1,27 @@
 import os
 import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlfluff.core import Linter
 
 from sqllineage.cli import main
 from sqllineage.config import SQLLineageConfig
-from sqllineage.core.models import SubQuery
-from sqllineage.runner import LineageRunner
-from sqllineage.utils.constant import LineageLevel
+from sqllineage.core.budget import (
+    TimeBudget,
+    check_time_limit,
+    interruptible,
+    time_limit,
+)
+from sqllineage.core.metadata.dummy import DummyMetaDataProvider
+from sqllineage.core.models import SubQuery, Table
+from sqllineage.core.observer import LineageProfiler
+from sqllineage.core.parser.sqlfluff.analyzer import SqlFluffLineageAnalyzer
+from sqllineage.exceptions import AnalysisTimeoutException
+from sqllineage.runner import LineageRunner, StreamingLineageRunner
+from sqllineage.utils.constant import LineageLevel, Phase
 
 from ..helpers import _gen_graph_operators, assert_table_lineage_equal
 
@@ -77,3 +93,289 @@ tbl_name=my_table"""
             main(["-f", nested_dir + "/nested.sql"])
         finally:
             os.chdir(cwd)
+
+
+def test_runner_batch():
+    sqls = [
+        "insert into tab2 select col1, col2 from tab1;",
+        "create table tab3 as select * from tab2;\ninsert into tab4 select col1 from tab3",
+    ]
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        paths = []
+        for i, sql in enumerate(sqls):
+            paths.append(os.path.join(tmpdirname, f"{i}.sql"))
+            with open(paths[-1], "w") as f:
+                f.write(sql)
+        expected = LineageRunner("\n".join(sqls))
+        for workers in (1, 2):
+            holder = LineageRunner.batch(paths, workers=workers)
+            assert holder.source_tables == set(expected.source_tables)
+            assert holder.target_tables == set(expected.target_tables)
+            assert holder.intermediate_tables == set(expected.intermediate_tables)
+            assert holder.get_column_lineage() == set(expected.get_column_lineage())
+
+
+def test_runner_batch_session_metadata():
+    sqls = [
+        "insert into tab2 select * from main.tab1",
+        "insert into tab3 select * from tab2",
+    ]
+    provider = DummyMetaDataProvider({"main.tab1": ["col1", "col2"]})
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        paths = []
+        for i, sql in enumerate(sqls):
+            paths.append(os.path.join(tmpdirname, f"{i}.sql"))
+            with open(paths[-1], "w") as f:
+                f.write(sql)
+        expected = LineageRunner(
+            ";\n".join(sqls), metadata_provider=provider
+        ).get_column_lineage()
+        # wildcard from tab2 is resolved with session metadata registered by the file before it
+        assert {str(path[-1]) for path in expected} == {
+            "<default>.tab3.col1",
+            "<default>.tab3.col2",
+        }
+        for workers in (1, 2):
+            holder = LineageRunner.batch(
+                paths, metadata_provider=provider, workers=workers
+            )
+            assert holder.get_column_lineage() == set(expected)
+
+
+def test_runner_with_parse_cache():
+    sql = """insert into tab2 select col1, col2 from tab1;
+insert into tab3 select * from tab2"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        with SQLLineageConfig(PARSE_CACHE_DIR=tmpdirname):
+            expected = LineageRunner(sql).get_column_lineage()
+            with patch.object(Linter, "parse_string") as parse_string:
+                assert LineageRunner(sql).get_column_lineage() == expected
+                parse_string.assert_not_called()
+
+
+def test_runner_with_parse_cache_respect_sqlfluff_config():
+    sql = "insert into {{ tgt }} select * from tab1"
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        with SQLLineageConfig(PARSE_CACHE_DIR=os.path.join(tmpdirname, "cache")):
+            for tgt in ("tab2", "tab3"):
+                # same SQL rendered with different jinja context variable
+                directory = os.path.join(tmpdirname, tgt)
+                os.mkdir(directory)
+                with open(os.path.join(directory, ".sqlfluff"), "w") as f:
+                    f.write(f"[sqlfluff:templater:jinja:context]\ntgt={tgt}\n")
+                runner = LineageRunner(sql, file_path=directory)
+                assert runner.target_tables == [Table(tgt)]
+
+
+def test_runner_incremental():
+    provider = DummyMetaDataProvider({"main.tab1": ["col1", "col2"]})
+    sql = """create table tab2 as select col1 from main.tab1;
+insert into tab3 select * from tab2;
+insert into tab4 select col2 from main.tab1"""
+    runner = LineageRunner(sql, metadata_provider=provider)
+    runner.get_column_lineage()
+    for new_sql, analyzed in [
+        # only the changed statement is analyzed
+        (sql.replace("tab4", "tab5"), 1),
+        # statement 2 depends on session metadata registered by statement 1, so it's analyzed as well
+        (sql.replace("select col1", "select col1, col2"), 2),
+    ]:
+        with patch.object(
+            SqlFluffLineageAnalyzer,
+            "analyze",
+            autospec=True,
+            side_effect=SqlFluffLineageAnalyzer.analyze,
+        ) as analyze:
+            incremental = runner.incremental(new_sql)
+            actual = incremental.get_column_lineage()
+            assert analyze.call_count == analyzed
+        assert (
+            actual
+            == LineageRunner(new_sql, metadata_provider=provider).get_column_lineage()
+        )
+
+
+def test_runner_parallel():
+    sql = """insert into tab2 select col1, col2 from tab1;
+insert into tab3 select * from tab2;
+insert into tab4 select t2.col1, t3.col2 from tab2 t2 join tab3 t3 on t2.col1 = t3.col1"""
+    expected = LineageRunner(sql, verbose=True)
+    actual = LineageRunner(sql, verbose=True, workers=2)
+    assert str(actual) == str(expected)
+    assert actual.get_column_lineage() == expected.get_column_lineage()
+
+
+def test_runner_streaming():
+    metadata = {"main.tab1": ["col1", "col2"]}
+    provider = DummyMetaDataProvider(metadata)
+    sqls = [
+        "create table tab2 as select col1 from main.tab1",
+        "insert into tab3 select * from tab2; insert into tab5 select col1 from tab3",
+        "insert into tab4 select col1 from tab2 join main.tab1 on tab2.col1 = tab1.col2",
+    ]
+    for graph_operator in _gen_graph_operators():
+        with SQLLineageConfig(GRAPH_OPERATOR_CLASS=graph_operator):
+            with StreamingLineageRunner(metadata_provider=provider) as runner:
+                stmts = []
+                for i, sql in enumerate(sqls):
+                    stmts += [stmt for stmt, _ in runner.run([sql])]
+                    expected = LineageRunner(
+                        ";\n".join(sqls[: i + 1]),
+                        metadata_provider=DummyMetaDataProvider(metadata),
+                    )
+                    actual = runner.get_sql_holder()
+                    assert actual.source_tables == set(expected.source_tables)
+                    assert actual.target_tables == set(expected.target_tables)
+                    assert actual.intermediate_tables == set(
+                        expected.intermediate_tables
+                    )
+                    assert set(actual.get_column_lineage()) == set(
+                        expected.get_column_lineage()
+                    )
+                assert runner.statement_count == len(stmts) == 4
+                assert provider.get_table_columns(Table("tab2")) != []
+            # session metadata is deregistered once closed
+            assert provider.get_table_columns(Table("tab2")) == []
+
+
+def test_runner_profile():
+    sql = """insert into tab2 select col1 from tab1;
+insert into tab3 select t2.col1 from tab2 t2 join (select col1 from tab1) t1 on t2.col1 = t1.col1"""
+    # sqlfluff analyzer breaks down analyze phase into parse and extract
+    for dialect, phases in (
+        ("ansi", {Phase.ANALYZE, Phase.PARSE, Phase.EXTRACT}),
+        ("non-validating", {Phase.ANALYZE}),
+    ):
+        profiler = LineageProfiler()
+        runner = LineageRunner(sql, dialect=dialect, observer=profiler)
+        runner.get_column_lineage()
+        for phase in (Phase.SPLIT, Phase.MERGE, Phase.COLUMN_LINEAGE):
+            assert profiler.phase_counts[phase] == 1
+        assert profiler.phase_counts[Phase.ANALYZE] == 2
+        for stmt in runner.statements():
+            assert set(profiler.statement_seconds[stmt]) == phases
+        slowest = profiler.slowest_statements(1)
+        assert len(slowest) == 1 and slowest[0][0] in runner.statements()
+        assert str(profiler).startswith("Phases:")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("sqllineage.core.budget.time", fake):
+        yield fake
+
+
+def slow_parse(clock, seconds):
+    """
+    parsing statement reading from table slow takes seconds by the fake clock
+    """
+    parse_string = Linter.parse_string
+
+    def wrapper(self, sql, *args, **kwargs):
+        if "slow" in sql:
+            clock.now += seconds
+        return parse_string(self, sql, *args, **kwargs)
+
+    return patch.object(Linter, "parse_string", wrapper)
+
+
+SQL_WITH_SLOW_STATEMENT = """insert into tab2 select * from tab1;
+insert into tab3 select * from slow;
+insert into tab5 select * from tab4;"""
+
+
+def test_runner_statement_timeout(clock):
+    runner = LineageRunner(SQL_WITH_SLOW_STATEMENT, statement_timeout=5)
+    with (
+        slow_parse(clock, 10),
+        pytest.warns(UserWarning, match="ran out of time budget"),
+    ):
+        assert runner.timed_out_statements() == [runner.statements()[1]]
+    assert set(runner.source_tables) == {Table("tab1"), Table("tab4")}
+    assert set(runner.target_tables) == {Table("tab2"), Table("tab5")}
+    assert "Timed Out Statements(#): 1" in str(runner)
+
+
+def test_runner_timeout(clock):
+    runner = LineageRunner(SQL_WITH_SLOW_STATEMENT, timeout=5)
+    with (
+        slow_parse(clock, 10),
+        pytest.warns(UserWarning, match="ran out of time budget"),
+    ):
+        # statements left once time is up are skipped as well
+        assert runner.timed_out_statements() == runner.statements()[1:]
+    assert set(runner.source_tables) == {Table("tab1")}
+
+
+def test_runner_timeout_column_lineage(clock):
+    runner = LineageRunner("insert into tab2 select col1 from tab1", timeout=5)
+    runner.statements()
+    clock.now += 10
+    # column lineage is enumerated within what's left of the time budget, rather than a fresh one
+    with pytest.raises(AnalysisTimeoutException, match="column lineage"):
+        runner.get_column_lineage()
+    runner = LineageRunner("insert into tab2 select col1 from tab1", timeout=5)
+    runner.statements()
+    go = runner._sql_holder.go
+    retrieve_ancestors = go.retrieve_ancestors
+
+    def slow_retrieve_ancestors(vertex):
+        clock.now += 10
+        return retrieve_ancestors(vertex)
+
+    # enumeration checks time budget between paths, rather than being interrupted
+    with (
+        patch.object(go, "retrieve_ancestors", slow_retrieve_ancestors),
+        patch("sqllineage.core.budget._raise_in_thread") as interrupt,
+    ):
+        with pytest.raises(AnalysisTimeoutException, match="column lineage"):
+            runner.get_column_lineage()
+    assert not interrupt.called
+
+
+def test_time_budget():
+    budget = TimeBudget(statement_timeout=0.05)
+    # code block outside interruptible is not interrupted, time limit is checked once it finishes
+    with pytest.raises(AnalysisTimeoutException, match="out of time budget"):
+        with budget.statement("select 1"):
+            time.sleep(0.1)
+    with pytest.raises(AnalysisTimeoutException, match="out of time budget"):
+        with budget.statement("select 1"):
+            time.sleep(0.1)
+            check_time_limit()
+            pytest.fail("time limit is not checked")  # pragma: no cover
+    with pytest.raises(AnalysisTimeoutException, match="out of time budget"):
+        with budget.statement("select 1"), interruptible():
+            while True:
+                time.sleep(0.01)
+    # time limit doesn't apply outside of budget
+    with interruptible():
+        time.sleep(0.1)
+    check_time_limit()
+
+
+def test_time_limit():
+    with time_limit(None, "unlimited"):
+        time.sleep(0.01)
+    with time_limit(1, "in time"):
+        pass
+    # exception to interrupt the block doesn't leak out once it finishes in time
+    time.sleep(0.05)
+    with pytest.raises(AnalysisTimeoutException, match="out of time"):
+        with time_limit(0.05, "out of time"):
+            while True:
+                time.sleep(0.01)
+    with pytest.raises(AnalysisTimeoutException, match="no time left"):
+        with time_limit(0, "no time left"):
+            pass
+    # time limit blocks share one watchdog thread
+    assert sum(t.name == "sqllineage-watchdog" for t in threading.enumerate()) == 1
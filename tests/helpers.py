@@ -48,6 +48,7 @@ def _assert_column_lineage(lr: LineageRunner, column_lineages=None):
             tgt_col.parent = Table(tgt.qualifier)
             expected.add((src_col, tgt_col))
     actual = {(lineage[0], lineage[-1]) for lineage in set(lr.get_column_lineage())}
+    assert set(lr.get_column_lineage(endpoints_only=True)) == actual
 
     assert (
         set(actual) == expected
@@ -109,8 +110,23 @@ def assert_column_lineage_equal(
 
 def generate_metadata_providers(test_schemas) -> list[MetaDataProvider]:
     dummy_provider = DummyMetaDataProvider(test_schemas)
+    sqlite3_sqlalchemy_provider = _generate_sqlite3_sqlalchemy_provider(test_schemas)
+    sqlite3_sqlalchemy_schema_provider = _generate_sqlite3_sqlalchemy_provider(
+        test_schemas, reflect_schema=True
+    )
+    return [
+        dummy_provider,
+        sqlite3_sqlalchemy_provider,
+        sqlite3_sqlalchemy_schema_provider,
+    ]
 
-    sqlite3_sqlalchemy_provider = SQLAlchemyMetaDataProvider("sqlite:///:memory:")
+
+def _generate_sqlite3_sqlalchemy_provider(
+    test_schemas, **kwargs
+) -> SQLAlchemyMetaDataProvider:
+    sqlite3_sqlalchemy_provider = SQLAlchemyMetaDataProvider(
+        "sqlite:///:memory:", **kwargs
+    )
     metadata = MetaData()
     for full_table_name, columns_names in test_schemas.items():
         schema, table = full_table_name.split(".")
@@ -130,5 +146,4 @@ def generate_metadata_providers(test_schemas) -> list[MetaDataProvider]:
             schema=schema,
         )
     metadata.create_all(bind=sqlite3_sqlalchemy_provider.engine)
-
-    return [dummy_provider, sqlite3_sqlalchemy_provider]
+    return sqlite3_sqlalchemy_provider
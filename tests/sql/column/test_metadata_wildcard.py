@@ -456,7 +456,7 @@ def test_wildcard_reference_from_previous_statements(provider: MetaDataProvider)
             "temp.dim_credit_card2": ["creditcard_key", "creditcardid", "cardtype"],
         }
     ),
-    ids=["dummy", "sqlalchemy"],
+    ids=["dummy", "sqlalchemy", "sqlalchemy_reflect_schema"],
 )
 def test_wildcard_table_union_with_same_column_names(provider: MetaDataProvider):
     sql = """insert into temp.creditcard_snapshot
@@ -503,7 +503,7 @@ SELECT * FROM temp.dim_credit_card2"""
             "temp.dim_credit_card2": ["cc_key", "cc_id", "cc_type"],
         }
     ),
-    ids=["dummy", "sqlalchemy"],
+    ids=["dummy", "sqlalchemy", "sqlalchemy_reflect_schema"],
 )
 def test_wildcard_table_union_with_different_column_names(provider: MetaDataProvider):
     sql = """insert into temp.creditcard_snapshot
@@ -550,7 +550,7 @@ SELECT * FROM temp.dim_credit_card2"""
             "temp.credit_card_daily": ["creditcard_key", "creditcard_id", "card_type"],
         }
     ),
-    ids=["dummy", "sqlalchemy"],
+    ids=["dummy", "sqlalchemy", "sqlalchemy_reflect_schema"],
 )
 @pytest.mark.parametrize("dialect", ["databricks", "hive", "sparksql"])
 def test_insert_overwrite_with_partition_excludes_partition_columns(
@@ -65,3 +65,29 @@ def test_split_statements_with_desc(analyzer_cls):
 
 DESC tab1;"""
     assert _n_statements(analyzer_cls, sql) == 2
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        """IF (SELECT COUNT(*) FROM tab1) > 0 THEN
+  INSERT INTO tab2 SELECT * FROM tab1;
+END IF;
+INSERT INTO tab3 SELECT * FROM tab2;""",
+        """FOR record IN (SELECT col1 FROM tab1) DO
+  INSERT INTO tab2 SELECT * FROM tab1;
+END FOR;
+INSERT INTO tab3 SELECT * FROM tab2;""",
+        """INSERT INTO tab2 SELECT IF(col1 > 0, col1, 0) AS col1 FROM tab1;
+WHILE TRUE DO
+  INSERT INTO tab2 SELECT * FROM tab1;
+END WHILE;
+INSERT INTO tab3 SELECT CASE WHEN col1 > 0 THEN 1 END AS col1 FROM tab2;""",
+    ],
+)
+def test_split_statements_with_control_flow_block(sql):
+    # semicolon inside control flow block doesn't terminate statement, split the same way as parsing the whole SQL
+    analyzer = SqlFluffLineageAnalyzer(sql, file_path=".", dialect="bigquery")
+    assert analyzer.statements == [
+        segment.raw + ";" for segment in analyzer._list_specific_statement_segment(sql)
+    ]